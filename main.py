@@ -5,7 +5,7 @@ Main entry point for the CLI application
 """
 
 import typer
-from typing import Optional
+from typing import Dict, List, Optional
 from pathlib import Path
 import sys
 import os
@@ -14,6 +14,8 @@ import os
 sys.path.insert(0, str(Path(__file__).parent))
 
 from seif.agent import Agent
+from seif.deadline import parse_duration
+from seif.pacing import PROFILES
 from seif.utils import display_startup_ui  
 from rich.console import Console
 from rich.panel import Panel
@@ -33,25 +35,63 @@ app = typer.Typer(
 
 console = Console()
 
+# Commands that talk to the model; the model is preloaded while they start up
+WARM_UP_COMMANDS = {"run", "chat"}
+
+def _maybe_start_warmup(command: Optional[str]) -> None:
+    """Preload the configured model in the background for commands that use it."""
+    from seif.config import config
+    if command in WARM_UP_COMMANDS and config.get("llm", "warm_up_on_start", True):
+        from seif.llm import start_background_warmup
+        start_background_warmup()
+
+@app.callback()
+def startup(ctx: typer.Context):
+    """
+    🤖 SeifCLI - Your smart terminal assistant powered by local LLMs
+    """
+    _maybe_start_warmup(ctx.invoked_subcommand)
+
 @app.command("run")
 def run_task(
     prompt: str = typer.Argument(..., help="Natural language task to execute"),
     interactive: bool = typer.Option(False, "--interactive", "-i", help="Keep browser open after task completion"),
+    no_optimize: bool = typer.Option(False, "--no-optimize", help="Execute the plan exactly as generated, without optimizer rewrites"),
+    unattended: bool = typer.Option(False, "--unattended", "-u", help="Never prompt: retry transient errors and replan failed steps automatically; steps that need confirmation stop the run"),
+    deadline: str = typer.Option(None, "--deadline", "-d", help="Time budget for the whole task, e.g. 30s or 2m"),
+    pacing: str = typer.Option(None, "--pacing", help=f"Browser delay profile: {', '.join(PROFILES)}"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed execution logs")
 ):
     """
     🚀 Execute a natural language task using AI and browser automation
     """
+    budget = None
+    if deadline:
+        try:
+            budget = parse_duration(deadline)
+        except ValueError as e:
+            console.print(f"[bold red]❌ {e}[/bold red]")
+            raise typer.Exit(2)
+    if not _valid_pacing(pacing):
+        raise typer.Exit(2)
+    
     console.print(f"\n[bold green]🎯 Task:[/bold green] {prompt}")
     console.print(f"[bold blue]🔧 Interactive Mode:[/bold blue] {'Enabled' if interactive else 'Disabled'}")
+    if budget:
+        console.print(f"[bold blue]⏱️ Deadline:[/bold blue] {budget:g}s")
     
-    if not Confirm.ask("🚀 Ready to execute this task?", default=True):
+    if not unattended and not Confirm.ask("🚀 Ready to execute this task?", default=True):
         console.print("[bold red]❌ Task cancelled by user.[/bold red]")
         return
     
+    agent = None
     try:
         agent = Agent()
-        agent.execute_task(prompt, interactive_mode=interactive)
+        if unattended:
+            agent.config["recovery"]["unattended"] = True
+        if pacing:
+            agent.config["browser"]["pacing"] = pacing.lower()
+        agent.execute_task(prompt, interactive_mode=interactive, optimize=not no_optimize, deadline=budget)
         
         if interactive:
             console.print("\n[bold yellow]🔄 Interactive mode enabled - browser will remain open.[/bold yellow]")
@@ -65,8 +105,90 @@ def run_task(
                 
     except KeyboardInterrupt:
         console.print("\n[bold red]❌ Task interrupted by user.[/bold red]")
+        if agent and agent.checkpoint and agent.checkpoint.resumable:
+            console.print(f"[yellow]Progress saved. Continue with: seif resume {agent.checkpoint.run_id}[/yellow]")
     except Exception as e:
         console.print(f"[bold red]❌ Error executing task: {e}[/bold red]")
+    
+    # Same exit status as timeout(1) so scripts can tell a timeout from a failure
+    if agent and agent.last_result and agent.last_result.timed_out:
+        raise typer.Exit(124)
+
+def _valid_pacing(pacing: Optional[str]) -> bool:
+    """Check a --pacing value, printing the available profiles if it is unknown."""
+    if pacing and pacing.lower() not in PROFILES:
+        console.print(f"[bold red]❌ Unknown pacing profile '{pacing}'. Available: {', '.join(PROFILES)}[/bold red]")
+        return False
+    return True
+
+@app.command("resume")
+def resume_task(
+    run_id: str = typer.Argument(None, help="Run to continue; lists resumable runs when omitted"),
+    interactive: bool = typer.Option(False, "--interactive", "-i", help="Keep browser open after task completion"),
+    unattended: bool = typer.Option(False, "--unattended", "-u", help="Never prompt: retry transient errors automatically; steps that need confirmation stop the run"),
+    deadline: str = typer.Option(None, "--deadline", "-d", help="Time budget for the rest of the task, e.g. 30s or 2m")
+):
+    """
+    ⏯️ Continue an interrupted task from its last completed step
+    """
+    if run_id is None:
+        _list_runs()
+        return
+    
+    budget = None
+    if deadline:
+        try:
+            budget = parse_duration(deadline)
+        except ValueError as e:
+            console.print(f"[bold red]❌ {e}[/bold red]")
+            raise typer.Exit(2)
+    
+    agent = None
+    try:
+        agent = Agent()
+        if unattended:
+            agent.config["recovery"]["unattended"] = True
+        agent.resume(run_id, interactive_mode=interactive, deadline=budget)
+        
+        if interactive:
+            console.print("\n[bold yellow]🔄 Interactive mode enabled - browser will remain open.[/bold yellow]")
+            console.print("[dim]Press Ctrl+C to close the browser and exit.[/dim]")
+            try:
+                while True:
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                agent.close_browser()
+    except KeyboardInterrupt:
+        console.print("\n[bold red]❌ Task interrupted by user.[/bold red]")
+    
+    if agent and agent.last_result and agent.last_result.timed_out:
+        raise typer.Exit(124)
+
+def _list_runs():
+    """Print the checkpointed runs that can be resumed."""
+    from seif.checkpoints import CheckpointStore
+    from rich.table import Table
+    
+    runs = [checkpoint for checkpoint in CheckpointStore().list() if checkpoint.resumable]
+    if not runs:
+        console.print("[yellow]No interrupted runs to resume.[/yellow]")
+        return
+    
+    table = Table(title="Resumable Runs")
+    table.add_column("Run ID", style="bold blue")
+    table.add_column("Task", style="green")
+    table.add_column("Progress")
+    table.add_column("Status", style="dim")
+    table.add_column("Updated", style="dim")
+    for checkpoint in runs:
+        table.add_row(
+            checkpoint.run_id,
+            checkpoint.prompt[:50] + ("..." if len(checkpoint.prompt) > 50 else ""),
+            f"{checkpoint.next_step}/{len(checkpoint.steps)}",
+            "interrupted" if checkpoint.status == "running" else checkpoint.status,
+            time.strftime("%Y-%m-%d %H:%M", time.localtime(checkpoint.updated_at))
+        )
+    console.print(table)
 
 @app.command("chat")
 def chat_mode(
@@ -93,13 +215,11 @@ def chat_mode(
     
     
     from seif.chat_manager import ChatManager
-    chat_manager = ChatManager(model=model)
+    chat_manager = ChatManager(model=model, intent_matcher=agent.intents)
     
     
     if load_history:
-        from seif.memory import Memory
-        memory = Memory()
-        memory.load(load_history)
+        chat_manager.memory.load(load_history)
     
     try:
         while True:
@@ -139,13 +259,12 @@ def chat_mode(
                 elif result["action"] == "task":
                     task = result["content"]
                     console.print(f"[bold green]🎯 Executing task:[/bold green] {task}")
-                    agent.execute_task(task, interactive_mode=True)
+                    agent.execute_task(task, interactive_mode=True, plan=result.get("plan"))
                     continue
                     
                 elif result["action"] == "chat":
-                    # Generate and display response
-                    response = chat_manager.generate_response(user_input)
-                    chat_manager.display_response(response)
+                    # Stream the response as it is generated
+                    chat_manager.display_response(chat_manager.generate_response_stream(user_input))
                 
             except KeyboardInterrupt:
                 console.print("\n[bold yellow]Use 'exit' to quit properly.[/bold yellow]")
@@ -186,6 +305,322 @@ def show_chat_help():
     """
     console.print(Markdown(help_text))
 
+model_app = typer.Typer(help="🧠 Manage the local model")
+app.add_typer(model_app, name="model")
+
+@model_app.command("warm")
+def model_warm(
+    model: str = typer.Option(None, help="Model to preload (overrides config)")
+):
+    """🔥 Preload the model into memory"""
+    from seif.llm import LLM
+    
+    llm = LLM(model=model)
+    with console.status(f"[bold blue]Loading model '{llm.model}'...[/bold blue]"):
+        load_time = llm.warm_up()
+    
+    if load_time is None:
+        console.print(f"[yellow]⚠[/yellow] Could not warm up '{llm.model}'.")
+        return
+    console.print(f"[green]✓[/green] Model '{llm.model}' loaded in {load_time:.2f}s (kept alive for {llm.keep_alive})")
+
+@model_app.command("status")
+def model_status(
+    model: str = typer.Option(None, help="Model to report on (overrides config)")
+):
+    """📊 Show which models are loaded"""
+    from seif.llm import LLM, get_warmup_state
+    from rich.table import Table
+    
+    llm = LLM(model=model)
+    try:
+        loaded = llm.model_status()
+    except Exception as e:
+        console.print(f"[bold red]❌ Could not query model status: {e}[/bold red]")
+        return
+    
+    table = Table(title="Loaded Models")
+    table.add_column("Model", style="bold blue")
+    table.add_column("Size", style="green")
+    table.add_column("Expires", style="dim")
+    for entry in loaded:
+        size = entry.get("size_vram") or entry.get("size") or 0
+        table.add_row(entry.get("name", entry.get("model", "?")), f"{size / 1e9:.1f} GB", str(entry.get("expires_at", "")))
+    console.print(table)
+    
+    is_loaded = any(entry.get("name", entry.get("model", "")).startswith(llm.model) for entry in loaded)
+    state = "[green]loaded[/green]" if is_loaded else "[yellow]not loaded[/yellow]"
+    console.print(f"Configured model [bold]{llm.model}[/bold] is {state}.")
+    
+    warm = get_warmup_state(llm.model)
+    if warm:
+        warmed_at = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(warm["warmed_at"]))
+        console.print(f"[dim]Last warm-up: load time {warm['load_time']:.2f}s at {warmed_at}[/dim]")
+    else:
+        console.print("[dim]No warm-up recorded yet; run `seif model warm`.[/dim]")
+
+cache_app = typer.Typer(help="🗄️ Inspect and manage the LLM response cache")
+app.add_typer(cache_app, name="cache")
+
+@cache_app.command("stats")
+def cache_stats():
+    """📊 Show response cache statistics"""
+    from seif.llm import get_response_cache
+    from rich.table import Table
+    
+    cache = get_response_cache()
+    if cache is None:
+        console.print("[yellow]⚠[/yellow] Response cache is disabled.")
+        return
+    
+    stats = cache.stats()
+    table = Table(title="LLM Response Cache")
+    table.add_column("Metric", style="bold")
+    table.add_column("Value", style="green")
+    table.add_row("Location", str(cache.path))
+    table.add_row("Entries", f"{stats['entries']} / {cache.max_entries}")
+    table.add_row("TTL", f"{cache.ttl}s")
+    table.add_row("Lifetime hits", str(stats["lifetime_hits"]))
+    
+    from seif.plan_cache import PlanCache
+    plan_cache = PlanCache()
+    reusable = sum(1 for entry in plan_cache.entries.values() if entry.get("status") == "succeeded")
+    table.add_row("Cached plans", f"{reusable} reusable / {len(plan_cache.entries)} stored")
+    
+    from seif.selector_cache import get_selector_cache
+    selector_cache = get_selector_cache()
+    if selector_cache is not None:
+        selectors = selector_cache.stats()
+        table.add_row("Cached selectors", f"{selectors['entries']} on {selectors['domains']} domains, "
+                                          f"{selectors['hits']} hits")
+    
+    from seif.intents import IntentStats
+    fast_path = IntentStats().summary()
+    if fast_path["hit_rate"] is not None:
+        saved = f", ~{fast_path['estimated_saved']:.1f}s saved" if fast_path["estimated_saved"] is not None else ""
+        table.add_row("Fast path", f"{fast_path['hits']} / {fast_path['hits'] + fast_path['misses']} tasks "
+                                   f"({fast_path['hit_rate']:.0%}){saved}")
+    console.print(table)
+
+@cache_app.command("clear")
+def cache_clear():
+    """🧹 Remove all cached LLM responses, plans and selectors"""
+    from seif.llm import get_response_cache
+    from seif.plan_cache import PlanCache
+    from seif.selector_cache import SelectorCache
+    
+    PlanCache().clear()
+    SelectorCache().clear()
+    cache = get_response_cache()
+    if cache is not None:
+        cache.clear()
+    console.print("[green]✓[/green] Response, plan and selector caches cleared.")
+
+macro_app = typer.Typer(help="🎬 Record and replay tasks without planning")
+app.add_typer(macro_app, name="macro")
+
+def _parse_assignments(assignments: Optional[List[str]]) -> Optional[Dict[str, str]]:
+    """Parse key=value pairs, or return None if any is malformed."""
+    values = {}
+    for assignment in assignments or []:
+        key, sep, value = assignment.partition("=")
+        if not sep or not key.strip():
+            console.print(f"[bold red]❌ Expected key=value, got '{assignment}'[/bold red]")
+            return None
+        values[key.strip()] = value
+    return values
+
+@macro_app.command("record")
+def macro_record(
+    name: str = typer.Argument(..., help="Name to save the macro under"),
+    prompt: str = typer.Argument(..., help="Natural language task to execute and record"),
+    param: List[str] = typer.Option(None, "--param", "-p", help="Turn a recorded value into a parameter, as name=value (repeatable)")
+):
+    """
+    ⏺️ Execute a task and save its steps as a replayable macro
+    
+    Without --param, the text typed by each TYPE step becomes a parameter.
+    """
+    from seif.macros import Macro, MacroLibrary, parameterize
+    from seif.plan import PlanStep
+    
+    params = _parse_assignments(param)
+    if params is None:
+        return
+    
+    agent = Agent()
+    agent.record_selectors = True
+    if not agent.execute_task(prompt):
+        console.print("[bold red]❌ Task did not complete; nothing was recorded.[/bold red]")
+        return
+    
+    # Failed steps that were skipped are left out; selectors resolved by the browser replace the planned ones.
+    # Steps run inside PARALLEL branches are recorded as part of their PARALLEL step.
+    steps = [
+        PlanStep.from_dict({
+            "command": entry["command"],
+            "args": entry.get("resolved_args") or entry["args"],
+            "branches": entry.get("branches", [])
+        })
+        for entry in agent.last_run_log if entry["success"] and "branch" not in entry
+    ]
+    steps, used = parameterize(steps, params)
+    for unused in sorted(set(params) - set(used)):
+        console.print(f"[yellow]⚠[/yellow] Value of parameter '{unused}' does not appear in any step.")
+    
+    try:
+        path = MacroLibrary().save(Macro(name=name, prompt=prompt, steps=steps, params=used))
+    except ValueError as e:
+        console.print(f"[bold red]❌ {e}[/bold red]")
+        return
+    
+    console.print(f"[green]✓[/green] Recorded macro '{name}' with {len(steps)} steps to {path}")
+    for i, step in enumerate(steps, 1):
+        console.print(f"  {i}. {step}")
+    if used:
+        console.print(f"[dim]Parameters: {', '.join(f'{k} (default: {v})' for k, v in used.items())}[/dim]")
+
+@macro_app.command("run")
+def macro_run(
+    name: str = typer.Argument(..., help="Macro to replay"),
+    assignments: List[str] = typer.Argument(None, help="Parameter values as key=value"),
+    interactive: bool = typer.Option(False, "--interactive", "-i", help="Keep browser open after the macro completes"),
+    pacing: str = typer.Option(None, "--pacing", help=f"Browser delay profile: {', '.join(PROFILES)}")
+):
+    """▶️ Replay a recorded macro without calling the LLM"""
+    from seif.macros import MacroLibrary
+    
+    values = _parse_assignments(assignments)
+    if values is None or not _valid_pacing(pacing):
+        return
+    
+    library = MacroLibrary()
+    macro = library.get(name)
+    if macro is None:
+        console.print(f"[bold red]❌ No macro named '{name}'. See 'seif macro list'.[/bold red]")
+        return
+    
+    try:
+        steps = macro.bind(values)
+    except ValueError as e:
+        console.print(f"[bold red]❌ {e}[/bold red]")
+        return
+    
+    console.print(f"\n[bold green]🎬 Macro:[/bold green] {name} ({len(steps)} steps)")
+    agent = Agent()
+    if pacing:
+        agent.config["browser"]["pacing"] = pacing.lower()
+    try:
+        agent.replay(steps, interactive_mode=interactive)
+        library.record_run(name)
+        
+        if interactive:
+            console.print("\n[bold yellow]🔄 Interactive mode enabled - browser will remain open.[/bold yellow]")
+            console.print("[dim]Press Ctrl+C to close the browser and exit.[/dim]")
+            try:
+                while True:
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                agent.close_browser()
+    except KeyboardInterrupt:
+        console.print("\n[bold red]❌ Macro interrupted by user.[/bold red]")
+        agent.close_browser()
+
+@macro_app.command("list")
+def macro_list():
+    """📚 List recorded macros"""
+    from seif.macros import MacroLibrary
+    from rich.table import Table
+    
+    macros = MacroLibrary().list()
+    if not macros:
+        console.print("[yellow]No macros recorded yet. Use 'seif macro record'.[/yellow]")
+        return
+    
+    table = Table(title="Macros")
+    table.add_column("Name", style="bold blue")
+    table.add_column("Parameters", style="green")
+    table.add_column("Steps")
+    table.add_column("Runs")
+    table.add_column("Recorded from", style="dim")
+    for name, entry in sorted(macros.items()):
+        table.add_row(name, ", ".join(entry.get("params", [])), str(entry.get("steps", 0)),
+                      str(entry.get("runs", 0)), entry.get("prompt", ""))
+    console.print(table)
+
+@macro_app.command("delete")
+def macro_delete(
+    name: str = typer.Argument(..., help="Macro to delete")
+):
+    """🗑️ Delete a recorded macro"""
+    from seif.macros import MacroLibrary
+    
+    if MacroLibrary().delete(name):
+        console.print(f"[green]✓[/green] Deleted macro '{name}'.")
+    else:
+        console.print(f"[bold red]❌ No macro named '{name}'.[/bold red]")
+
+pool_app = typer.Typer(help="🏊 Keep pre-launched browsers ready for tasks")
+app.add_typer(pool_app, name="pool")
+
+@pool_app.command("start")
+def pool_start(
+    size: Optional[int] = typer.Option(None, "--size", "-n", help="Number of browsers to keep ready (default: pool.size)")
+):
+    """🚀 Launch the pooled browsers; tasks check them out until 'seif pool stop'"""
+    from seif.browser_pool import BrowserPool
+    
+    pool = BrowserPool()
+    if size is not None:
+        if size < 1:
+            console.print("[bold red]❌ Pool size must be at least 1.[/bold red]")
+            return
+        pool.size = size
+    try:
+        with console.status("[bold blue]Starting pooled browsers...", spinner="earth"):
+            sessions = pool.start()
+    except Exception as e:
+        console.print(f"[bold red]❌ Could not start the browser pool: {e}[/bold red]")
+        return
+    console.print(f"[green]✓[/green] Browser pool running with {len(sessions)} browser(s).")
+
+@pool_app.command("status")
+def pool_status():
+    """📊 Show pooled browsers, their health and memory use"""
+    from seif.browser_pool import BrowserPool
+    from rich.table import Table
+    
+    pool = BrowserPool()
+    sessions = pool.status()
+    if not sessions:
+        console.print("[yellow]Browser pool is not running. Use 'seif pool start'.[/yellow]")
+        return
+    
+    table = Table(title=f"Browser Pool ({len(sessions)} / {pool.size})")
+    table.add_column("Session", style="bold blue")
+    table.add_column("Status")
+    table.add_column("Health")
+    table.add_column("Tasks")
+    table.add_column("Memory")
+    table.add_column("Age")
+    table.add_column("Port / PID", style="dim")
+    for session in sessions:
+        status = "[yellow]busy[/yellow]" if session["status"] == "busy" else "[green]idle[/green]"
+        health = "[green]ok[/green]" if session["healthy"] else "[red]unreachable[/red]"
+        memory = f"{session['rss_mb']:.0f} / {pool.max_rss_mb} MB" if session["rss_mb"] is not None else "n/a"
+        age = time.time() - session["started_at"]
+        table.add_row(session["id"], status, health, f"{session['tasks']} / {pool.max_tasks}", memory,
+                      f"{age / 60:.0f}m" if age >= 60 else f"{age:.0f}s", f"{session['port']} / {session['pid']}")
+    console.print(table)
+
+@pool_app.command("stop")
+def pool_stop():
+    """🛑 Close every pooled browser"""
+    from seif.browser_pool import BrowserPool
+    
+    stopped = BrowserPool().stop()
+    console.print(f"[green]✓[/green] Stopped {stopped} pooled browser(s).")
+
 @app.command("version")
 def show_version():
     """📋 Show SeifCLI version information"""
@@ -332,6 +767,7 @@ def setup_environment(
         "memory": {
             "storage_dir": str(config_dir / "memory"),
             "max_context_length": 4000,
+            "max_context_tokens": 2048,
             "auto_summarize": auto_summarize,
             "summarization_threshold": 20
         },
@@ -2,40 +2,122 @@
 
 import pkgutil
 import importlib
-import re
+import queue
 import json
+import re
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
 from rich.console import Console
 from rich.prompt import Confirm, Prompt
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from . import skills
+from .checkpoints import Checkpoint, CheckpointStore, new_run_id
+from .config import config as global_config
+from .deadline import Deadline, DeadlineExceeded
+from .intents import IntentMatcher, IntentStats
+from .optimizer import PlanOptimizer
+from .plan import PARALLEL, PlanStep
 from .planner import Planner
 from .browser import Browser
+from .browser_pool import BrowserPool, pool_enabled
 
 console = Console()
 
+# Queue sentinel marking the end of a streamed plan
+_PLAN_END = object()
+
+# Step errors that may succeed when the step is tried again after a short wait
+TRANSIENT_ERRORS = re.compile(
+    r"timeout|timed out|could not find|no suitable|no clickable|stale|not interactable|"
+    r"intercepted|failed to navigate|connection",
+    re.IGNORECASE
+)
+
+
+@dataclass
+class TaskResult:
+    """Structured outcome of a task run."""
+
+    # "succeeded", "failed", "aborted" or "timed_out"
+    status: str
+    steps_completed: int
+    elapsed: float
+    error: Optional[str] = None
+    # The deadline the task ran under, in seconds
+    deadline: Optional[float] = None
+
+    @property
+    def timed_out(self) -> bool:
+        return self.status == "timed_out"
+
+    def to_dict(self) -> Dict:
+        return {
+            "status": self.status,
+            "steps_completed": self.steps_completed,
+            "elapsed": round(self.elapsed, 3),
+            "error": self.error,
+            "deadline": self.deadline
+        }
+
+
 class Agent:
     def __init__(self, config_path: Optional[str] = None, model: Optional[str] = None):
         self.model = model
         self.browser = None
+        # Idle extra browsers used by PARALLEL branches, kept for reuse
+        self.worker_browsers = []
+        self._workers_lock = threading.Lock()
+        self._log_lock = threading.Lock()
         self.skills = self._load_skills()
         self.execution_log = []
+        self.phase_timings = {}
+        self.plan_rewrites = []
+        self.last_run_log = []
+        self.record_selectors = False
         self.config = self._load_config(config_path)
-        
-        self.planner = Planner(model=self.model)
+        self._planner = None
+        self.intents = IntentMatcher(self.skills) if global_config.get("planner", "fast_path", True) else None
+        self.intent_stats = IntentStats()
+        self.used_fast_path = False
+        self.replans = 0
+        self.last_error = None
+        self.deadline: Optional[Deadline] = None
+        self.last_result: Optional[TaskResult] = None
+        self.checkpoints = CheckpointStore()
+        self.checkpoint: Optional[Checkpoint] = None
+        self._browser_pool: Optional[BrowserPool] = None
+    
+    @property
+    def planner(self) -> Planner:
+        """The planner, created on first use so replaying macros never touches the LLM."""
+        if self._planner is None:
+            self._planner = Planner(model=self.model, skills=self.skills)
+        return self._planner
         
     def _load_config(self, config_path: Optional[str]) -> Dict:
-        """Load configuration from file or use defaults."""
+        """Load configuration from defaults, config.json and an optional config file.
+        
+        The browser, security, logging, execution and recovery sections of
+        config.json are merged over the defaults, and a config_path file over both.
+        """
         default_config = {
             "browser": {
                 "headless": False,
                 "window_size": "1920,1080",
                 "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "timeout": 10
+                "timeout": 10,
+                "pacing": "human",     # Delay profile: human, balanced or fast
+                "pacing_domains": {},  # Domain -> profile overrides, e.g. {"example.com": "fast"}
+                "readiness": {},       # Command -> conditions waited on after it, e.g. {"CLICK": ["url_changed"]}
+                "dom_quiet_ms": 250,   # No DOM mutations for this long counts as dom_quiet
+                "network_idle_ms": 400, # No fetch/XHR in flight for this long counts as network_idle
+                "network_idle_timeout": 2, # Seconds network_idle is waited on after an action; polling pages never go idle
+                "readiness_timeout": 10 # Seconds to wait for a page to settle after an action
             },
             "security": {
                 "require_confirmation": True,
@@ -45,16 +127,33 @@ class Agent:
             "logging": {
                 "save_screenshots_on_error": True,
                 "log_file": "agent_execution.log"
+            },
+            "execution": {
+                "max_parallel_branches": 3,  # Browsers used at once by a PARALLEL step
+                "max_step_seconds": 60,      # Time budget of a single step when the task has a deadline
+                "checkpoints": True          # Save progress after every step so 'seif resume' can continue a run
+            },
+            "recovery": {
+                "unattended": False,   # Recover from failures without prompting; confirmations are never skipped
+                "max_retries": 2,      # Retries of a step that failed with a transient error
+                "retry_backoff": 1.0,  # Seconds before the first retry, doubled for each further retry
+                "max_replans": 2       # Partial replans allowed per task
             }
         }
         
+        # Sections of config.json that configure the agent override the defaults
+        for section, values in default_config.items():
+            configured = global_config.config.get(section)
+            if isinstance(configured, dict):
+                values.update(configured)
+        
         if config_path and Path(config_path).exists():
             try:
                 with open(config_path, 'r') as f:
                     user_config = json.load(f)
                     for key, value in user_config.items():
                         if isinstance(value, dict):
-                            default_config[key].update(value)
+                            default_config.setdefault(key, {}).update(value)
                         else:
                             default_config[key] = value
             except Exception as e:
@@ -65,7 +164,20 @@ class Agent:
     def _initialize_browser(self):
         """Initializes the browser if it hasn't been already."""
         if self.browser is None:
-            self.browser = Browser(config=self.config.get("browser", {}))
+            self.browser = self._new_browser()
+        self.browser.resolve_selectors = self.record_selectors
+        self.browser.deadline = self.deadline
+
+    def _new_browser(self) -> Browser:
+        """Start a browser, attached to a pooled Chrome session when the browser pool is in use.
+        
+        Falls back to launching Chrome when the pool is disabled or has no idle session.
+        """
+        browser_config = self.config.get("browser", {})
+        if self._browser_pool is None and pool_enabled():
+            self._browser_pool = BrowserPool(browser_config)
+        session = self._browser_pool.checkout() if self._browser_pool else None
+        return Browser(config=browser_config, session=session, pool=self._browser_pool)
 
     def _load_skills(self) -> Dict:
         """Dynamically loads all skills from the 'skills' directory."""
@@ -88,38 +200,16 @@ class Agent:
         console.print(skills_table)
         return discovered_skills
 
-    def _parse_command(self, command_str: str) -> Tuple[Optional[str], List[str]]:
-        """Enhanced command parsing with better error handling."""
-        try:
-            pattern = r'(\w+)(?:\s+"([^"]*)")*(?:\s+(\S+))*'
-            match = re.match(pattern, command_str.strip())
-            
-            if not match:
-                parts = re.findall(r'(\w+)|"(.*?)"', command_str)
-                command = None
-                args = []
-                
-                for part in parts:
-                    if part[0] and not command:
-                        command = part[0]
-                    elif part[1]:
-                        args.append(part[1])
-                    elif part[0] and command:
-                        args.append(part[0])
-                        
-                return command, args
-            
-            command = match.group(1)
-            args = [g for g in match.groups()[1:] if g is not None]
-            return command, args
-            
-        except Exception as e:
-            console.print(f"[red]Error parsing command '{command_str}': {e}[/red]")
-            return None, []
-
     def _log_execution(self, step: str, command: str, args: List[str], 
-                      success: bool, error: Optional[str] = None):
-        """Log execution details for debugging and analysis."""
+                      success: bool, error: Optional[str] = None,
+                      resolved_args: Optional[List[str]] = None,
+                      branches: Optional[List[List[PlanStep]]] = None,
+                      branch: Optional[int] = None, retry: bool = False):
+        """Log execution details for debugging and analysis. Safe to call from branch threads.
+        
+        Attempts that are retried are logged with retry set; they are not step
+        outcomes and do not count as failures.
+        """
         log_entry = {
             "timestamp": time.time(),
             "step": step,
@@ -128,15 +218,25 @@ class Agent:
             "success": success,
             "error": error
         }
-        self.execution_log.append(log_entry)
+        if resolved_args is not None:
+            log_entry["resolved_args"] = resolved_args
+        if branch is not None:
+            log_entry["branch"] = branch
+        if retry:
+            log_entry["retry"] = True
+        if branches:
+            log_entry["branches"] = [[branch_step.to_dict() for branch_step in branch] for branch in branches]
         
-        if self.config.get("logging", {}).get("log_file"):
-            try:
-                log_file = Path(self.config["logging"]["log_file"])
-                with open(log_file, 'a') as f:
-                    f.write(f"{json.dumps(log_entry)}\n")
-            except Exception:
-                pass  
+        with self._log_lock:
+            self.execution_log.append(log_entry)
+            
+            if self.config.get("logging", {}).get("log_file"):
+                try:
+                    log_file = Path(self.config["logging"]["log_file"])
+                    with open(log_file, 'a') as f:
+                        f.write(f"{json.dumps(log_entry)}\n")
+                except Exception:
+                    pass  
 
     def _is_safe_domain(self, url: str) -> bool:
         """Check if URL is in the safe domains list."""
@@ -148,7 +248,7 @@ class Agent:
         if not self.config.get("security", {}).get("require_confirmation", True):
             return False
             
-        if command in ["CLICK", "TYPE"]:
+        if command in ["CLICK", "TYPE", "SUBMIT"]:
             return True
             
         if command == "GOTO" and args:
@@ -156,107 +256,678 @@ class Agent:
             
         return False
 
+    def match_intent(self, prompt: str) -> Optional[List[PlanStep]]:
+        """Plan a simple command with the rule-based fast path, or None if the planner is needed."""
+        return self.intents.match(prompt) if self.intents else None
+
+    def _produce_plan(self, prompt: str, steps: queue.Queue, stop: threading.Event,
+                      optimizer: Optional[PlanOptimizer] = None,
+                      fast_plan: Optional[List[PlanStep]] = None,
+                      produced: Optional[List[PlanStep]] = None):
+        """Stream plan steps into a queue for the executor. Runs on a worker thread.
+        
+        Every step is also appended to produced, if given, so checkpoints can
+        include steps the executor has not reached yet.
+        """
+        started = time.perf_counter()
+        try:
+            plan = iter(fast_plan) if fast_plan else self.planner.stream_plan(prompt, stop=stop, deadline=self.deadline)
+            if optimizer:
+                plan = optimizer.optimize(plan)
+            for step in plan:
+                if produced is not None:
+                    produced.append(step)
+                steps.put(step)
+                if stop.is_set():
+                    break
+        except Exception as e:
+            steps.put(e)
+        finally:
+            self.phase_timings["planning"] = time.perf_counter() - started
+            steps.put(_PLAN_END)
+
+    def _start_deadline(self, deadline: Optional[Union[Deadline, float]]) -> None:
+        """Set the deadline of the run, given as a Deadline or a number of seconds."""
+        if deadline is not None and not isinstance(deadline, Deadline):
+            deadline = Deadline(float(deadline))
+        self.deadline = deadline
+
+    def _timed_out(self) -> bool:
+        return self.deadline is not None and self.deadline.expired()
+
     def execute_task(self, prompt: str, interactive_mode: bool = False, 
-                    dry_run: bool = False):
-        """Enhanced task execution with better error handling and logging."""
-        self._initialize_browser()
+                    dry_run: bool = False, optimize: bool = True,
+                    plan: Optional[List[PlanStep]] = None,
+                    deadline: Optional[Union[Deadline, float]] = None):
+        """Enhanced task execution with better error handling and logging.
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            plan_task = progress.add_task("Creating plan...", total=None)
-            plan = self.planner.create_plan(prompt)
-            progress.remove_task(plan_task)
+        Simple commands recognized by the intent matcher, or a plan passed in
+        by the caller, skip the planner entirely. Otherwise planning is
+        pipelined with execution: the planner streams steps into a queue from
+        a worker thread and each step runs as soon as it arrives. Unless
+        optimize is False, the plan passes through the PlanOptimizer on its
+        way to the executor.
         
-        if not plan:
-            console.print("[bold red]Could not create a plan. Aborting.[/bold red]")
-            return False
-
-        console.print(f"[bold green]Plan created with {len(plan)} steps[/bold green]")
+        With a deadline (a Deadline or seconds), every LLM call and browser
+        wait is bounded by the time remaining, each step additionally by
+        execution.max_step_seconds, and the run stops with a timed_out result
+        once it passes. The outcome is available as last_result.
+        """
+        self._start_deadline(deadline)
+        self.last_result = None
+        self.last_error = None
+        optimizer = PlanOptimizer() if optimize else None
+        self.plan_rewrites = optimizer.rewrites if optimizer else []
+        
+        fast_plan = plan if plan is not None else self.match_intent(prompt)
+        self.used_fast_path = bool(fast_plan)
+        if fast_plan:
+            self.intent_stats.record_hit()
+            console.print("[bold green]Recognized a simple command; skipping the planner.[/bold green]")
         
         if dry_run:
+            if not fast_plan:
+                self.intent_stats.record_miss()
+            plan = fast_plan or self.planner.create_plan(prompt, deadline=self.deadline)
+            if optimizer:
+                plan = list(optimizer.optimize(plan))
+            if not plan:
+                console.print("[bold red]Could not create a plan. Aborting.[/bold red]")
+                return False
             console.print("[yellow]DRY RUN MODE - No actions will be executed[/yellow]")
             for i, step in enumerate(plan, 1):
                 console.print(f"  {i}. {step}")
             return True
 
-        success = True
+        task_started = time.perf_counter()
+        self.phase_timings = {}
+        self.replans = 0
+        pacing_started = self._pacing_seconds()
+        
+        # Planning runs on a worker thread while the browser starts on this one
+        steps = queue.Queue()
+        produced: List[PlanStep] = []
+        stop_planning = threading.Event()
+        planner_thread = threading.Thread(
+            target=self._produce_plan, args=(prompt, steps, stop_planning, optimizer, fast_plan, produced),
+            daemon=True
+        )
+        planner_thread.start()
+        
+        browser_started = time.perf_counter()
+        try:
+            self._initialize_browser()
+            browser_error = None if self.browser and self.browser.driver else "Browser failed to start"
+        except Exception as e:
+            browser_error = f"Browser failed to start: {e}"
+        self.phase_timings["browser_startup"] = time.perf_counter() - browser_started
+        
+        if browser_error:
+            console.print(f"[bold red]{browser_error}. Aborting.[/bold red]")
+            stop_planning.set()
+            planner_thread.join()
+            self.close_browser()
+            self.last_result = TaskResult("failed", 0, time.perf_counter() - task_started, browser_error,
+                                          self.deadline.seconds if self.deadline else None)
+            return False
+
+        execution_started = time.perf_counter()
+        waiting_for_plan = 0.0
+        status = "succeeded"
+        error = None
+        run_log_start = len(self.execution_log)
+        plan: List[PlanStep] = []
+        planning_done = False
         i = 0
+        self._begin_checkpoint(Checkpoint(new_run_id(), prompt, [], plan_complete=False))
         
-        while i < len(plan):
-            step = plan[i]
-            console.print(f"\n[yellow]Step {i+1}/{len(plan)}: {step}[/yellow]")
-            
-            command, args = self._parse_command(step)
-            
-            if not command:
-                console.print(f"[red]Could not parse command: {step}[/red]")
-                self._log_execution(step, "", [], False, "Parse error")
-                break
-            
-            if self._requires_confirmation(command, args):
-                if not Confirm.ask(f"⚠️ Proceed with [bold cyan]{command}[/bold cyan] {' '.join(args)}?", default=True):
-                    console.print("[bold red]Aborted by user.[/bold red]")
-                    self._log_execution(step, command, args, False, "User abort")
-                    success = False
+        try:
+            while True:
+                if self._timed_out():
+                    status = "timed_out"
                     break
-            
-            error = self._execute_command(command, args, step)
-            
-            if error:
-                console.print(f"[bold red]Error: {error}[/bold red]")
-                self._log_execution(step, command, args, False, error)
-                
-                if self.config.get("logging", {}).get("save_screenshots_on_error"):
-                    error_screenshot = f"error_step_{i+1}_{int(time.time())}.png"
-                    if self.browser:
-                        self.browser.screenshot(error_screenshot)
-                        console.print(f"[yellow]Error screenshot saved: {error_screenshot}[/yellow]")
+                if i == len(plan):
+                    if planning_done:
+                        break
+                    wait_started = time.perf_counter()
+                    try:
+                        item = steps.get(timeout=self.deadline.remaining() if self.deadline else None)
+                    except queue.Empty:
+                        item = DeadlineExceeded("Deadline exceeded while waiting for the plan")
+                    waiting_for_plan += time.perf_counter() - wait_started
+                    if item is _PLAN_END:
+                        planning_done = True
+                        continue
+                    if isinstance(item, DeadlineExceeded):
+                        status = "timed_out"
+                        break
+                    if isinstance(item, Exception):
+                        console.print(f"[bold red]Planning failed: {item}[/bold red]")
+                        status, error = "failed", f"Planning failed: {item}"
+                        break
+                    plan.append(item)
                 
-                action = Prompt.ask(
-                    "[yellow]What would you like to do?[/yellow]", 
-                    choices=["retry", "skip", "abort"], 
-                    default="skip"
-                )
+                step = plan[i]
+                position = f"{i+1}/{len(plan)}" if planning_done else f"{i+1}"
+                outcome = self._run_step(step, position, i + 1)
                 
-                if action == "retry":
+                if outcome == "replan":
+                    # The rest of the streamed plan is superseded by the replan
+                    stop_planning.set()
+                    planner_thread.join()
+                    if not planning_done:
+                        # Keep the steps already streamed in case the replan fails
+                        plan[len(plan):] = produced[len(plan):]
+                    planning_done = True
+                    new_steps = self._replan(prompt, plan, i)
+                    if not new_steps:
+                        status = "timed_out" if self._timed_out() else "failed"
+                        error = self.last_error
+                        break
+                    if optimizer:
+                        new_steps = list(optimizer.optimize(new_steps))
+                    plan[i:] = new_steps
                     continue
-                elif action == "skip":
-                    i += 1
+                if outcome == "retry":
                     continue
-                else:
-                    console.print("[bold red]Aborted by user.[/bold red]")
-                    success = False
+                if outcome == "timeout":
+                    status = "timed_out"
+                    break
+                if outcome == "abort":
+                    status, error = "aborted", "Aborted by user"
                     break
+                i += 1
+                # Until planning ends or a replan replaces it, the plan streamed so far is the full plan
+                self._save_checkpoint(*self._checkpoint_plan(plan, produced, planning_done), i, run_log_start)
+        finally:
+            stop_planning.set()
+            # A planner blocked in an LLM call past the deadline is left to finish on its own
+            planner_thread.join(timeout=1.0 if self._timed_out() else None)
+            finished = time.perf_counter()
+            self.phase_timings["execution"] = (finished - execution_started - waiting_for_plan
+                                               - self.phase_timings.get("replanning", 0.0))
+            self.phase_timings["wall_clock"] = finished - task_started
+            self.phase_timings["pacing"] = self._pacing_seconds() - pacing_started
+        
+        self.last_run_log = self.execution_log[run_log_start:]
+        success = status == "succeeded"
+        if status == "timed_out":
+            error = f"Deadline of {self.deadline.seconds:g}s exceeded"
+            console.print(f"[bold red]{error} after {i} of {len(plan)} steps. Stopping.[/bold red]")
+        self.last_result = TaskResult(status, i, self.phase_timings["wall_clock"], error,
+                                      self.deadline.seconds if self.deadline else None)
+        self._finish_checkpoint(status, *self._checkpoint_plan(plan, produced, planning_done))
+        
+        if not plan:
+            if status != "timed_out":
+                console.print("[bold red]Could not create a plan. Aborting.[/bold red]")
+            if not interactive_mode:
+                self.close_browser()
+            return False
+        
+        self._display_execution_summary()
+        
+        if not fast_plan and status != "timed_out":
+            self.intent_stats.record_miss(self.phase_timings.get("planning"))
+            # Only plans that ran every step cleanly are served from the plan cache
+            plan_succeeded = success and all(
+                entry["success"] for entry in self.execution_log[run_log_start:] if not entry.get("retry")
+            )
+            self.planner.record_outcome(prompt, plan_succeeded)
+        
+        if not interactive_mode:
+            self.close_browser()
+            
+        return success
+
+    def _unattended(self) -> bool:
+        return bool(self.config.get("recovery", {}).get("unattended", False))
+
+    def _dispatch(self, step: PlanStep) -> Optional[str]:
+        """Execute a step and return its error message, if any.
+        
+        Under a task deadline, a single step is also bounded by
+        execution.max_step_seconds; PARALLEL steps get the whole remaining budget.
+        """
+        if self.deadline and self.browser:
+            if step.command == PARALLEL:
+                self.browser.deadline = self.deadline
             else:
-                self._log_execution(step, command, args, True)
-                
+                max_step = self.config.get("execution", {}).get("max_step_seconds", 60)
+                self.browser.deadline = self.deadline.child(max_step)
+        if step.command == PARALLEL:
+            return self._execute_parallel(step)
+        return self._execute_command(step.command, step.args, str(step))
+
+    def _retry_transient(self, step: PlanStep, error: Optional[str]) -> Optional[str]:
+        """In unattended mode, retry a step that failed with a transient error.
+        
+        Waits recovery.retry_backoff seconds before the first retry and twice as
+        long before each further one, up to recovery.max_retries retries.
+        
+        Returns:
+            The error of the last attempt, or None once an attempt succeeds
+        """
+        if not error or not self._unattended():
+            return error
+        
+        recovery = self.config.get("recovery", {})
+        max_retries = recovery.get("max_retries", 2)
+        delay = recovery.get("retry_backoff", 1.0)
+        for attempt in range(1, max_retries + 1):
+            if not TRANSIENT_ERRORS.search(error):
+                break
+            if self.deadline and self.deadline.remaining() <= delay:
+                break
+            console.print(f"[yellow]Transient error: {error}. Retrying in {delay:.1f}s ({attempt}/{max_retries})...[/yellow]")
+            self._log_execution(str(step), step.command, step.args, False, f"{error} (retrying)", retry=True)
+            time.sleep(delay)
+            delay *= 2
+            error = self._dispatch(step)
+            if not error:
+                break
+        return error
+
+    def _run_step(self, step: PlanStep, position: str, number: int) -> str:
+        """Confirm, execute and log a single step.
+        
+        In unattended mode there are no prompts: transient errors are retried
+        with backoff and a step that still fails asks for a replan. A step that
+        needs confirmation aborts an unattended run, since nobody can give it;
+        turn security.require_confirmation off to run such steps unattended. A
+        step that fails after the task deadline has passed ends the run without
+        prompting.
+        
+        Returns:
+            "next" to move on, "retry" to run the step again, "replan" to
+            replace the remaining steps, "timeout", or "abort"
+        """
+        console.print(f"\n[yellow]Step {position}: {step}[/yellow]")
+        
+        command, args = step.command, step.args
+        
+        if self._step_requires_confirmation(step):
+            if self._unattended():
+                console.print(f"[bold red]{command} needs confirmation, which an unattended run cannot give. "
+                              "Set security.require_confirmation to false to allow it.[/bold red]")
+                self._log_execution(str(step), command, args, False, "Confirmation required in unattended mode")
+                return "abort"
+            if not Confirm.ask(f"⚠️ Proceed with [bold cyan]{command}[/bold cyan] {' '.join(args)}?", default=True):
+                console.print("[bold red]Aborted by user.[/bold red]")
+                self._log_execution(str(step), command, args, False, "User abort")
+                return "abort"
+        
+        error = self._dispatch(step)
+        error = self._retry_transient(step, error)
+        
+        if not error:
+            self._log_execution(str(step), command, args, True, resolved_args=self._resolved_args(command, args),
+                                branches=step.branches)
+            return "next"
+        
+        console.print(f"[bold red]Error: {error}[/bold red]")
+        self._log_execution(str(step), command, args, False, error, branches=step.branches)
+        self.last_error = error
+        
+        if self._timed_out():
+            return "timeout"
+        
+        if self.config.get("logging", {}).get("save_screenshots_on_error"):
+            error_screenshot = f"error_step_{number}_{int(time.time())}.png"
+            if self.browser:
+                self.browser.screenshot(error_screenshot)
+                console.print(f"[yellow]Error screenshot saved: {error_screenshot}[/yellow]")
+        
+        if self._unattended():
+            return "replan"
+        
+        action = Prompt.ask(
+            "[yellow]What would you like to do?[/yellow]", 
+            choices=["retry", "skip", "abort"], 
+            default="skip"
+        )
+        
+        if action == "retry":
+            return "retry"
+        elif action == "skip":
+            return "next"
+        else:
+            console.print("[bold red]Aborted by user.[/bold red]")
+            return "abort"
+
+    def _replan(self, prompt: str, plan: List[PlanStep], index: int) -> Optional[List[PlanStep]]:
+        """Ask the planner for new steps to replace plan[index:] after a failure.
+        
+        Returns:
+            The new steps, or None when the replan budget is spent or no usable
+            plan was produced
+        """
+        max_replans = self.config.get("recovery", {}).get("max_replans", 2)
+        if self.replans >= max_replans:
+            console.print(f"[bold red]Replan budget of {max_replans} exhausted. Aborting.[/bold red]")
+            return None
+        self.replans += 1
+        
+        started = time.perf_counter()
+        page = self.browser.describe_page() if self.browser else "(no browser)"
+        try:
+            new_steps = self.planner.replan(prompt, plan[:index], plan[index], self.last_error or "", page,
+                                            deadline=self.deadline)
+        except DeadlineExceeded:
+            new_steps = []
+        self.phase_timings["replanning"] = self.phase_timings.get("replanning", 0.0) + time.perf_counter() - started
+        
+        if not new_steps:
+            if not self._timed_out():
+                console.print("[bold red]Replanning failed. Aborting.[/bold red]")
+            return None
+        console.print(f"[bold green]Replanned {len(new_steps)} steps from step {index + 1} "
+                      f"({self.replans}/{max_replans}).[/bold green]")
+        return new_steps
+
+    def _step_requires_confirmation(self, step: PlanStep) -> bool:
+        """Whether a step, or any step in its branches, requires confirmation."""
+        if step.command == PARALLEL:
+            return any(self._requires_confirmation(branch_step.command, branch_step.args)
+                       for branch in step.branches for branch_step in branch)
+        return self._requires_confirmation(step.command, step.args)
+
+    def _checkout_worker(self) -> Browser:
+        """Take an idle worker browser, starting a new one if none is idle."""
+        with self._workers_lock:
+            worker = self.worker_browsers.pop() if self.worker_browsers else None
+        if worker is None:
+            worker = self._new_browser()
+        worker.deadline = self.deadline
+        return worker
+
+    def _release_worker(self, browser: Browser) -> None:
+        """Return a worker browser to the idle pool, or discard it if it failed to start."""
+        if not browser.driver:
+            # Returns a pooled session that could not be attached to
+            browser.close()
+            return
+        with self._workers_lock:
+            self.worker_browsers.append(browser)
+
+    def _run_branch(self, number: int, branch: List[PlanStep], idle: queue.Queue) -> Tuple[int, float, Optional[str]]:
+        """Run one branch of a PARALLEL step to completion. Runs on a pool thread.
+        
+        Args:
+            number: The branch number, used to label its output
+            branch: The steps of the branch
+            idle: Browsers free for this PARALLEL step; a worker browser is
+                checked out when it is empty
+            
+        Returns:
+            Tuple of steps completed, elapsed seconds and the error that stopped
+            the branch, if any
+        """
+        started = time.perf_counter()
+        try:
+            worker = idle.get_nowait()
+        except queue.Empty:
+            worker = self._checkout_worker()
+        completed = 0
+        error = None
+        try:
+            if not worker.driver:
+                return 0, time.perf_counter() - started, "Browser failed to start"
+            for step in branch:
+                if self._timed_out():
+                    error = "Deadline exceeded"
+                    break
+                console.print(f"[dim]\\[branch {number}][/dim] {step}")
+                error = self._execute_command(step.command, step.args, str(step), browser=worker)
+                self._log_execution(str(step), step.command, step.args, error is None, error, branch=number)
+                if error:
+                    break
+                completed += 1
+        finally:
+            idle.put(worker)
+        return completed, time.perf_counter() - started, error
+
+    def _execute_parallel(self, step: PlanStep) -> Optional[str]:
+        """Run the branches of a PARALLEL step concurrently and join them.
+        
+        Branches run at most execution.max_parallel_branches at a time, on the
+        main browser and as many worker browsers as that requires. A browser is
+        reused by the next branch as soon as its branch finishes, and worker
+        browsers stay open for later PARALLEL steps until close_browser.
+        
+        Returns:
+            An error message naming the failed branches, or None
+        """
+        max_parallel = max(1, int(self.config.get("execution", {}).get("max_parallel_branches", 3)))
+        workers = min(len(step.branches), max_parallel)
+        console.print(f"[bold blue]Running {len(step.branches)} branches on {workers} browsers...[/bold blue]")
+        
+        idle = queue.Queue()
+        idle.put(self.browser)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(self._run_branch, number, branch, idle)
+                for number, branch in enumerate(step.branches, 1)
+            ]
+            results = [future.result() for future in futures]
+        
+        while not idle.empty():
+            browser = idle.get_nowait()
+            if browser is not self.browser:
+                self._release_worker(browser)
+        
+        branch_table = Table(title="Parallel Branches")
+        branch_table.add_column("Branch", style="bold")
+        branch_table.add_column("Steps", style="green")
+        branch_table.add_column("Time")
+        branch_table.add_column("Result")
+        for number, (branch, (completed, elapsed, error)) in enumerate(zip(step.branches, results), 1):
+            branch_table.add_row(str(number), f"{completed}/{len(branch)}", f"{elapsed:.2f}s",
+                                 f"[red]{error}[/red]" if error else "[green]ok[/green]")
+        console.print(branch_table)
+        
+        failed = [str(number) for number, (_, _, error) in enumerate(results, 1) if error]
+        if failed:
+            return f"Branch {', '.join(failed)} of {len(step.branches)} failed"
+        return None
+
+    def _resolved_args(self, command: str, args: List[str]) -> Optional[List[str]]:
+        """Replace the selector argument with the one the browser resolved, if any."""
+        if not self.record_selectors or command not in ("TYPE", "CLICK", "SUBMIT") or not args:
+            return None
+        resolved = self.browser.last_resolved_selector if self.browser else None
+        if not resolved:
+            return None
+        return [resolved] + list(args[1:])
+
+    def _begin_checkpoint(self, checkpoint: Checkpoint) -> None:
+        """Start checkpointing a run, unless execution.checkpoints is disabled."""
+        if not self.config.get("execution", {}).get("checkpoints", True):
+            self.checkpoint = None
+            return
+        self.checkpoint = checkpoint
+        console.print(f"[dim]Run ID: {checkpoint.run_id}[/dim]")
+
+    @staticmethod
+    def _checkpoint_plan(plan: List[PlanStep], produced: List[PlanStep],
+                         planning_done: bool) -> Tuple[List[PlanStep], bool]:
+        """The steps to checkpoint and whether they are the complete plan."""
+        steps = list(plan if planning_done else produced)
+        return steps, bool(steps) and steps[-1].command == "DONE"
+
+    def _save_checkpoint(self, plan: List[PlanStep], plan_complete: bool, next_step: int,
+                         run_log_start: int) -> None:
+        """Persist the plan, progress and browser state after a completed step."""
+        checkpoint = self.checkpoint
+        if checkpoint is None:
+            return
+        checkpoint.steps = list(plan)
+        checkpoint.next_step = next_step
+        checkpoint.plan_complete = plan_complete
+        if self.browser:
+            state = self.browser.get_state()
+            checkpoint.url, checkpoint.cookies = state["url"], state["cookies"]
+        checkpoint.execution_log = self.execution_log[run_log_start:]
+        self.checkpoints.save(checkpoint)
+
+    def _finish_checkpoint(self, status: str, plan: Optional[List[PlanStep]] = None,
+                           plan_complete: bool = True) -> None:
+        """Record how a run ended. Checkpoints of successful runs are deleted."""
+        checkpoint = self.checkpoint
+        if checkpoint is None:
+            return
+        if plan is not None:
+            checkpoint.steps, checkpoint.plan_complete = list(plan), plan_complete
+        if status == "succeeded":
+            self.checkpoints.delete(checkpoint.run_id)
+            return
+        checkpoint.status = status
+        self.checkpoints.save(checkpoint)
+        if checkpoint.resumable:
+            console.print(f"[yellow]Progress saved. Continue with: seif resume {checkpoint.run_id}[/yellow]")
+
+    def replay(self, steps: List[PlanStep], interactive_mode: bool = False,
+               deadline: Optional[Union[Deadline, float]] = None) -> bool:
+        """Execute a fixed list of steps directly, without planning.
+        
+        Used to replay recorded macros; no LLM is created or called.
+        
+        Args:
+            steps: The steps to execute
+            interactive_mode: Keep the browser open afterwards
+            deadline: Optional deadline, as a Deadline or seconds
+            
+        Returns:
+            True if no step was aborted
+        """
+        self.checkpoint = None
+        return self._run_fixed_steps(steps, interactive_mode, deadline)
+
+    def resume(self, run_id: str, interactive_mode: bool = False,
+               deadline: Optional[Union[Deadline, float]] = None) -> bool:
+        """Continue a checkpointed run from the step after the last completed one.
+        
+        The browser's cookies and page are restored and the saved plan runs
+        from there; the planner is not called.
+        
+        Args:
+            run_id: The run to resume, as shown when it started
+            interactive_mode: Keep the browser open afterwards
+            deadline: Optional deadline for the rest of the run
+            
+        Returns:
+            True if the remaining steps ran without being aborted
+        """
+        checkpoint = self.checkpoints.get(run_id)
+        if checkpoint is None:
+            console.print(f"[bold red]No checkpoint for run '{run_id}'.[/bold red]")
+            return False
+        if not checkpoint.resumable:
+            console.print(f"[bold red]Run '{run_id}' has no steps left to resume.[/bold red]")
+            return False
+        if not checkpoint.plan_complete:
+            console.print("[yellow]Warning: The run stopped while its plan was still being generated; "
+                          f"only the {len(checkpoint.steps)} steps planned so far will run.[/yellow]")
+        
+        console.print(f"[bold green]Resuming run {run_id} at step {checkpoint.next_step + 1}/"
+                      f"{len(checkpoint.steps)}.[/bold green]")
+        checkpoint.status = "running"
+        self.checkpoint = checkpoint
+        return self._run_fixed_steps(checkpoint.steps, interactive_mode, deadline, checkpoint)
+
+    def _run_fixed_steps(self, steps: List[PlanStep], interactive_mode: bool,
+                         deadline: Optional[Union[Deadline, float]],
+                         checkpoint: Optional[Checkpoint] = None) -> bool:
+        """Run steps that are already planned, from a checkpoint's next step if one is given."""
+        self._start_deadline(deadline)
+        task_started = time.perf_counter()
+        self.phase_timings = {}
+        self.plan_rewrites = []
+        pacing_started = self._pacing_seconds()
+        self.used_fast_path = False
+        
+        browser_started = time.perf_counter()
+        self._initialize_browser()
+        self.phase_timings["browser_startup"] = time.perf_counter() - browser_started
+        if not self.browser or not self.browser.driver:
+            console.print("[bold red]Browser failed to start. Aborting.[/bold red]")
+            self.close_browser()
+            return False
+        
+        run_log_start = len(self.execution_log)
+        i = 0
+        if checkpoint:
+            restore_error = self.browser.restore_state(checkpoint.url, checkpoint.cookies)
+            if restore_error:
+                console.print(f"[yellow]Warning: Could not restore the page: {restore_error}[/yellow]")
+            self.execution_log.extend(checkpoint.execution_log)
+            i = checkpoint.next_step
+        
+        execution_started = time.perf_counter()
+        status = "succeeded"
+        while i < len(steps):
+            if self._timed_out():
+                status = "timed_out"
+                break
+            outcome = self._run_step(steps[i], f"{i+1}/{len(steps)}", i + 1)
+            if outcome == "retry":
+                continue
+            if outcome == "timeout":
+                status = "timed_out"
+                break
+            if outcome in ("abort", "replan"):
+                # Replays never call the LLM, so a failure that retries could not fix ends the run
+                status = "aborted" if outcome == "abort" else "failed"
+                break
             i += 1
+            self._save_checkpoint(steps, checkpoint.plan_complete if checkpoint else True, i, run_log_start)
+        success = status == "succeeded"
+        
+        finished = time.perf_counter()
+        self.phase_timings["execution"] = finished - execution_started
+        self.phase_timings["wall_clock"] = finished - task_started
+        self.phase_timings["pacing"] = self._pacing_seconds() - pacing_started
+        self.last_run_log = self.execution_log[run_log_start:]
+        error = None if success else self.last_error
+        if status == "timed_out":
+            error = f"Deadline of {self.deadline.seconds:g}s exceeded"
+            console.print(f"[bold red]{error} after {i} of {len(steps)} steps. Stopping.[/bold red]")
+        self.last_result = TaskResult(status, i, self.phase_timings["wall_clock"], error,
+                                      self.deadline.seconds if self.deadline else None)
+        self._finish_checkpoint(status)
         
         self._display_execution_summary()
         
         if not interactive_mode:
             self.close_browser()
-            
         return success
 
-    def _execute_command(self, command: str, args: List[str], step: str) -> Optional[str]:
-        """Execute a single command and return error message if any."""
+    def _execute_command(self, command: str, args: List[str], step: str,
+                         browser: Optional[Browser] = None) -> Optional[str]:
+        """Execute a single command and return error message if any.
+        
+        Commands run in the main browser unless another browser is given.
+        """
+        browser = browser or self.browser
         try:
             if command == "GOTO":
-                return self.browser.goto(args[0]) if args else "No URL provided"
+                return browser.goto(args[0]) if args else "No URL provided"
             elif command == "TYPE":
                 if len(args) < 2:
                     return "TYPE requires selector and text arguments"
-                return self.browser.type(args[0], args[1])
+                return browser.type(args[0], args[1])
             elif command == "CLICK":
-                return self.browser.click(args[0]) if args else "No selector provided"
+                return browser.click(args[0]) if args else "No selector provided"
+            elif command == "SUBMIT":
+                if len(args) < 2:
+                    return "SUBMIT requires selector and text arguments"
+                return browser.submit(args[0], args[1], args[2] if len(args) > 2 else None)
             elif command == "SCROLL":
-                return self.browser.scroll(args[0]) if args else "No direction provided"
+                if not args:
+                    return "No direction provided"
+                return browser.scroll(args[0], int(args[1]) if len(args) > 1 else None)
             elif command in self.skills:
-                result = self.skills[command](self.browser, *args)
+                result = self.skills[command](browser, *args)
                 console.print(f"[green]Skill {command} executed: {result}[/green]")
                 return None
             elif command == "DONE":
@@ -268,31 +939,75 @@ class Agent:
         except Exception as e:
             return f"Unexpected error executing '{step}': {e}"
 
+    def _pacing_seconds(self) -> float:
+        """Time the open browsers have spent in pacing delays so far."""
+        with self._workers_lock:
+            browsers = [self.browser] + self.worker_browsers
+        return sum(browser.pacer.slept for browser in browsers if browser)
+
     def _display_execution_summary(self):
         """Display a summary of the execution."""
-        if not self.execution_log:
+        outcomes = [entry for entry in self.execution_log if not entry.get("retry")]
+        if not outcomes:
             return
             
-        successful = sum(1 for entry in self.execution_log if entry["success"])
-        failed = len(self.execution_log) - successful
+        successful = sum(1 for entry in outcomes if entry["success"])
+        failed = len(outcomes) - successful
         
         summary_table = Table(title="Execution Summary")
         summary_table.add_column("Metric", style="bold")
         summary_table.add_column("Value", style="green")
         
-        summary_table.add_row("Total Steps", str(len(self.execution_log)))
+        summary_table.add_row("Total Steps", str(len(outcomes)))
         summary_table.add_row("Successful", str(successful))
         summary_table.add_row("Failed", str(failed))
-        summary_table.add_row("Success Rate", f"{(successful/len(self.execution_log)*100):.1f}%")
+        retries = len(self.execution_log) - len(outcomes)
+        if retries:
+            summary_table.add_row("Retries", str(retries))
+        summary_table.add_row("Success Rate", f"{(successful/len(outcomes)*100):.1f}%")
+        
+        timings = self.phase_timings
+        if "wall_clock" in timings:
+            for label, key in (("Browser Startup", "browser_startup"), ("Planning", "planning"),
+                               ("Replanning", "replanning"), ("Execution", "execution"),
+                               ("Wall Clock", "wall_clock")):
+                if key in timings:
+                    summary_table.add_row(label, f"{timings[key]:.2f}s")
+            if timings.get("pacing"):
+                profile = self.config.get("browser", {}).get("pacing", "human")
+                summary_table.add_row("Pacing Delays", f"{timings['pacing']:.2f}s of execution ({profile} profile)")
+            # Planning overlaps both browser startup and execution; the sum of the
+            # phases minus the wall clock is the time the overlap saved
+            sequential = sum(timings.get(key, 0) for key in ("browser_startup", "planning", "replanning", "execution"))
+            summary_table.add_row("Saved by Overlap", f"{max(sequential - timings['wall_clock'], 0):.2f}s")
+            if self.used_fast_path:
+                average = self.intent_stats.average_planning()
+                saved = f"~{average:.2f}s (average planner time)" if average is not None else "planner skipped"
+                summary_table.add_row("Saved by Fast Path", saved)
+        
+        if self.plan_rewrites:
+            summary_table.add_row("Plan Rewrites", str(len(self.plan_rewrites)))
+        
+        if self.deadline:
+            result = self.last_result
+            state = "[red]exceeded[/red]" if result and result.timed_out else f"{self.deadline.remaining():.2f}s left"
+            summary_table.add_row("Deadline", f"{self.deadline.seconds:g}s ({state})")
         
         console.print(summary_table)
+        
+        for rewrite in self.plan_rewrites:
+            console.print(f"[dim]  • {rewrite}[/dim]")
 
     def get_execution_log(self) -> List[Dict]:
         """Return the execution log for analysis."""
         return self.execution_log.copy()
 
     def close_browser(self):
-        """Close the browser and cleanup."""
+        """Close the browser, and any worker browsers, and cleanup."""
         if self.browser:
             self.browser.close()
-            self.browser = None
\ No newline at end of file
+            self.browser = None
+        with self._workers_lock:
+            workers, self.worker_browsers = self.worker_browsers, []
+        for worker in workers:
+            worker.close()
\ No newline at end of file
@@ -13,19 +13,195 @@ from selenium.common.exceptions import WebDriverException, TimeoutException, NoS
 from rich.console import Console
 from rich.prompt import Prompt
 from selenium_stealth import stealth
+import re
 import time
-import random
 from typing import Dict, Optional, List
 from urllib.parse import urlparse
 
+from .deadline import Deadline
+from .pacing import DEFAULT_PROFILE, Pacer
+from .readiness import Readiness
+from .selector_cache import get_selector_cache
+
 console = Console()
 
+# Selenium's own default page load timeout, restored once no deadline applies
+DEFAULT_PAGE_LOAD_TIMEOUT = 300
+
+DEFAULT_USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                      "(KHTML, like Gecko) Chrome/120 Safari/537.36")
+
+
+def chrome_arguments(config: Dict) -> List[str]:
+    """Chrome command-line switches for a browser config, shared by Browser and the browser pool."""
+    arguments = []
+    if config.get("headless", False):
+        arguments.append("--headless")
+    arguments += [
+        f"--window-size={config.get('window_size', '1920,1080')}",
+        # Enhanced stealth options
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-blink-features=AutomationControlled",
+        f"user-agent={config.get('user_agent', DEFAULT_USER_AGENT)}"
+    ]
+    return arguments
+
+# Sets an input's value, fires input/change events and submits it. Returns what
+# performed the submission ("submit button" or "form"), or null if neither exists.
+SUBMIT_SCRIPT = """
+const [input, text, submitSelector] = arguments;
+input.focus();
+const descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(input), 'value');
+if (descriptor && descriptor.set) { descriptor.set.call(input, text); } else { input.value = text; }
+input.dispatchEvent(new Event('input', { bubbles: true }));
+input.dispatchEvent(new Event('change', { bubbles: true }));
+let button = null;
+if (submitSelector) {
+    try {
+        button = (input.form && input.form.querySelector(submitSelector)) || document.querySelector(submitSelector);
+    } catch (e) {}
+}
+if (button) { button.click(); return 'submit button'; }
+if (input.form) {
+    if (input.form.requestSubmit) { input.form.requestSubmit(); } else { input.form.submit(); }
+    return 'form';
+}
+return null;
+"""
+
+# Sets the text of an input or editable element in one call, firing the events
+# a user's typing would
+FILL_SCRIPT = """
+const [input, text] = arguments;
+input.focus();
+if (input.isContentEditable) {
+    input.textContent = text;
+} else {
+    const descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(input), 'value');
+    if (descriptor && descriptor.set) { descriptor.set.call(input, text); } else { input.value = text; }
+}
+input.dispatchEvent(new Event('input', { bubbles: true }));
+input.dispatchEvent(new Event('change', { bubbles: true }));
+"""
+
+# Lists the visible interactive elements of the page with a selector hint and label
+DESCRIBE_PAGE_SCRIPT = r"""
+const limit = arguments[0];
+const items = [];
+for (const el of document.querySelectorAll('input, textarea, select, button, a[href], [role="button"]')) {
+    if (items.length >= limit) { break; }
+    const rect = el.getBoundingClientRect();
+    if (!rect.width || !rect.height || el.disabled || el.type === 'hidden') { continue; }
+    const tag = el.tagName.toLowerCase();
+    let hint = tag;
+    if (el.id) { hint += '#' + el.id; }
+    else if (el.name) { hint += '[name="' + el.name + '"]'; }
+    else if (el.type && tag === 'input') { hint += '[type="' + el.type + '"]'; }
+    const label = (el.innerText || el.value || el.placeholder || el.getAttribute('aria-label') || el.title || '')
+        .trim().replace(/\s+/g, ' ').slice(0, 60);
+    items.push(hint + (label ? ' "' + label + '"' : ''));
+}
+return items;
+"""
+
+# Finds the element for a selector in one call. Each selector is tried with the
+# strategies below in priority order, and the first element that is visible and
+# enabled wins. A selector given as a [selector, strategy] pair, such as a
+# cached resolution, is tried with that strategy only. Returns the element with its metadata, the strategy that matched,
+# how many candidates were seen and, when requested, a unique CSS selector for
+# it; or null with the candidate count when no candidate was usable.
+RESOLVE_ELEMENT_SCRIPT = r"""
+const [selectors, wantSelector] = arguments;
+const all = (list) => Array.from(list || []);
+const query = (selector) => { try { return all(document.querySelectorAll(selector)); } catch (e) { return []; } };
+const containing = (attr, value) => all(document.querySelectorAll('[' + attr + ']'))
+    .filter((el) => el.getAttribute(attr).includes(value));
+const withText = (value) => all(document.body ? document.body.getElementsByTagName('*') : [])
+    .filter((el) => all(el.childNodes).some((node) => node.nodeType === 3 && node.nodeValue.includes(value)));
+const strategies = [
+    ['css', query],
+    ['id', (value) => all(document.querySelectorAll('[id="' + value.replace(/["\\]/g, '\\$&') + '"]'))],
+    ['name', (value) => all(document.getElementsByName(value))],
+    ['class', (value) => /\s/.test(value) ? [] : all(document.getElementsByClassName(value))],
+    ['placeholder', (value) => containing('placeholder', value)],
+    ['aria-label', (value) => containing('aria-label', value)],
+    ['text', withText],
+];
+const usable = (el) => {
+    if (el.disabled || !el.getClientRects().length) { return false; }
+    const style = getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+};
+const unique = (selector) => document.querySelectorAll(selector).length === 1;
+const stableSelector = (el) => {
+    if (el.id && unique('#' + CSS.escape(el.id))) { return '#' + CSS.escape(el.id); }
+    const tag = el.tagName.toLowerCase();
+    for (const attr of ['name', 'aria-label', 'placeholder', 'data-testid', 'title', 'type']) {
+        const value = el.getAttribute(attr);
+        if (!value) { continue; }
+        const selector = tag + '[' + attr + '="' + value.replace(/\\/g, '\\\\').replace(/"/g, '\\"') + '"]';
+        if (unique(selector)) { return selector; }
+    }
+    return null;
+};
+let candidates = 0;
+for (const entry of selectors) {
+    const [selector, only] = Array.isArray(entry) ? entry : [entry, null];
+    for (const [strategy, find] of strategies) {
+        if (only && strategy !== only) { continue; }
+        const found = find(selector);
+        candidates += found.length;
+        const el = found.find(usable);
+        if (!el) { continue; }
+        const rect = el.getBoundingClientRect();
+        return {
+            element: el, selector: selector, strategy: strategy, candidates: candidates,
+            stable: wantSelector ? stableSelector(el) : null,
+            info: {
+                tag: el.tagName.toLowerCase(),
+                text: (el.innerText || '').slice(0, 100),
+                attributes: { id: el.id || null, class: el.getAttribute('class'), name: el.getAttribute('name'),
+                              type: el.getAttribute('type') },
+                location: { x: Math.round(rect.left + window.scrollX), y: Math.round(rect.top + window.scrollY) },
+                size: { width: Math.round(rect.width), height: Math.round(rect.height) },
+                visible: true, enabled: true
+            }
+        };
+    }
+}
+return { element: null, candidates: candidates };
+"""
+
 class Browser:
-    def __init__(self, config: Dict = None):
-        """Enhanced browser initialization with configuration."""
+    def __init__(self, config: Dict = None, session: Optional[Dict] = None, pool=None):
+        """Enhanced browser initialization with configuration.
+        
+        Args:
+            config: Browser settings
+            session: Optional pooled Chrome session to attach to instead of
+                launching Chrome, as returned by BrowserPool.checkout
+            pool: The BrowserPool the session is returned to on close
+        """
         self.config = config or {}
+        self.session = session
+        self.pool = pool
         self.driver = None
+        # Origins visited, so a pooled session's storage can be cleared on release
+        self.visited_origins = set()
         self.current_page_info = {}
+        # When enabled, type/click record a unique selector for the element they used
+        self.resolve_selectors = False
+        self.last_resolved_selector = None
+        # Optional deadline that caps every wait, page load and pause
+        self.deadline: Optional[Deadline] = None
+        # Artificial delays and typing strategy (browser.pacing, browser.pacing_domains)
+        self.pacer = Pacer(self.config.get("pacing", DEFAULT_PROFILE), self.config.get("pacing_domains"))
+        # Waits for the page to settle after each action (browser.readiness)
+        self.readiness = Readiness(self.config)
+        # Element resolutions learned from past runs (cache.selectors)
+        self.selector_cache = get_selector_cache()
+        self._page_load_timeout = DEFAULT_PAGE_LOAD_TIMEOUT
         self._initialize_driver()
 
     def _initialize_driver(self):
@@ -33,28 +209,20 @@ class Browser:
         try:
             options = Options()
             
-            # Configure based on config
-            if self.config.get("headless", False):
-                options.add_argument("--headless")
-            
-            # Window size
-            window_size = self.config.get("window_size", "1920,1080")
-            options.add_argument(f"--window-size={window_size}")
-            
-            # Enhanced stealth options
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
-            
-            # User agent
-            user_agent = self.config.get("user_agent", 
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36")
-            options.add_argument(f"user-agent={user_agent}")
+            if self.session:
+                # Attach to a pooled Chrome that was launched with the same switches
+                options.debugger_address = f"127.0.0.1:{self.session['port']}"
+                driver_path = self.session.get("driver_path") or ChromeDriverManager().install()
+            else:
+                for argument in chrome_arguments(self.config):
+                    options.add_argument(argument)
+                options.add_experimental_option("excludeSwitches", ["enable-automation"])
+                options.add_experimental_option('useAutomationExtension', False)
+                driver_path = None
             
-            with console.status("[bold blue]Starting enhanced browser...", spinner="earth"):
-                service = ChromeService(ChromeDriverManager().install())
+            status = "Attaching to pooled browser..." if self.session else "Starting enhanced browser..."
+            with console.status(f"[bold blue]{status}", spinner="earth"):
+                service = ChromeService(driver_path or ChromeDriverManager().install())
                 driver = webdriver.Chrome(service=service, options=options)
                 
                 # Apply stealth settings
@@ -72,6 +240,7 @@ class Browser:
                 
                 self.driver = driver
                 self.wait = WebDriverWait(driver, self.config.get("timeout", 10))
+                self.readiness.install(driver)
 
             console.print("[bold green]Enhanced browser started successfully.[/bold green]")
             
@@ -79,6 +248,67 @@ class Browser:
             console.print(f"[bold red]Error initializing browser: {e}[/bold red]")
             self.driver = None
 
+    def _timeout(self, default: float) -> float:
+        """A timeout of at most default seconds, shortened to fit the deadline."""
+        return self.deadline.timeout(default) if self.deadline else default
+
+    def _wait(self, timeout: Optional[float] = None) -> WebDriverWait:
+        """A WebDriverWait bounded by the configured timeout and the deadline."""
+        if timeout is None:
+            timeout = self.config.get("timeout", 10)
+        return WebDriverWait(self.driver, self._timeout(timeout))
+
+    def _pause(self, kind: str, url: Optional[str] = None) -> None:
+        """Sleep for the pacing profile's delay of an action, cut short by the deadline."""
+        self.pacer.delay(kind, url or self.current_page_info.get("url"), limit=self._timeout)
+
+    def _deadline_error(self, action: str) -> Optional[str]:
+        """Error message if the deadline has already passed."""
+        if self.deadline and self.deadline.expired():
+            return f"Deadline exceeded before {action}"
+        return None
+
+    def _apply_page_load_timeout(self) -> None:
+        """Bound driver.get by the deadline, restoring the default when there is none."""
+        timeout = max(1, int(self._timeout(DEFAULT_PAGE_LOAD_TIMEOUT)))
+        if timeout != self._page_load_timeout:
+            self.driver.set_page_load_timeout(timeout)
+            self._page_load_timeout = timeout
+
+    def wait_until(self, conditions: List[str], since: Optional[float] = None, start_url: str = "",
+                   timeout: Optional[float] = None, quiet_ms: Optional[int] = None,
+                   idle_ms: Optional[int] = None, idle_timeout: Optional[float] = None) -> List[str]:
+        """Wait for readiness conditions such as dom_quiet, network_idle or url_changed.
+        
+        Args:
+            conditions: The conditions to wait for (see readiness.CONDITIONS)
+            since: Epoch seconds of the action being waited on; defaults to now
+            start_url: The URL before the action, for url_changed
+            timeout: Seconds to wait at most, further bounded by the deadline
+            quiet_ms: DOM quiet period in milliseconds
+            idle_ms: Network idle period in milliseconds
+            idle_timeout: Seconds after which network_idle no longer holds up
+                the wait; by default it is waited on like the other conditions
+            
+        Returns:
+            The conditions that were not met before the wait ended
+        """
+        if not self.driver:
+            return list(conditions)
+        timeout = self._timeout(self.readiness.timeout if timeout is None else timeout)
+        return self.readiness.wait(self.driver, conditions, timeout, since, start_url, quiet_ms, idle_ms,
+                                   idle_timeout)
+
+    def _settle(self, command: str, since: float, start_url: str) -> List[str]:
+        """Wait for the page to settle after a command, using its configured conditions."""
+        unmet = self.wait_until(self.readiness.conditions_for(command), since, start_url,
+                                idle_timeout=self.readiness.idle_timeout)
+        if unmet:
+            console.print(f"[dim]Page not settled after {command}: waiting on {', '.join(unmet)} timed out[/dim]")
+        if "url_changed" not in unmet and self.driver.current_url != start_url:
+            self._update_page_info()
+        return unmet
+
     def _update_page_info(self):
         """Update information about the current page."""
         if not self.driver:
@@ -91,28 +321,78 @@ class Browser:
                 "domain": urlparse(self.driver.current_url).netloc,
                 "timestamp": time.time()
             }
+            self._track_origin(self.current_page_info["url"])
         except Exception:
             pass
 
-    def _get_element_info(self, element) -> Dict:
-        """Get detailed information about an element."""
+    def _track_origin(self, url: str) -> None:
+        parsed = urlparse(url)
+        if parsed.scheme in ("http", "https") and parsed.netloc:
+            self.visited_origins.add(f"{parsed.scheme}://{parsed.netloc}")
+
+    def _resolve_element(self, selectors: List) -> Dict:
+        """Find the first visible, enabled element matching any selector in one round trip.
+        
+        Args:
+            selectors: Selectors in order of preference, each tried with every
+                lookup strategy (CSS, id, name, class, placeholder, aria-label, text),
+                or [selector, strategy] pairs tried with one strategy
+            
+        Returns:
+            Dictionary with the element (None if no candidate was usable), the
+            number of candidates seen and, for a match, the selector and strategy
+            that found it, its metadata under "info" and, when selector
+            resolution is enabled, a unique CSS selector under "stable"
+        """
         try:
-            return {
-                "tag": element.tag_name,
-                "text": element.text[:100],  # Truncate long text
-                "attributes": {
-                    "id": element.get_attribute("id"),
-                    "class": element.get_attribute("class"),
-                    "name": element.get_attribute("name"),
-                    "type": element.get_attribute("type")
-                },
-                "location": element.location,
-                "size": element.size,
-                "visible": element.is_displayed(),
-                "enabled": element.is_enabled()
-            }
+            want_selector = self.resolve_selectors or self.selector_cache is not None
+            resolved = self.driver.execute_script(RESOLVE_ELEMENT_SCRIPT, selectors, want_selector)
         except Exception:
-            return {}
+            resolved = None
+        return resolved or {"element": None, "candidates": 0}
+
+    def _use_resolved(self, resolved: Dict):
+        """Record the stable selector of a resolved element and return the element."""
+        self.last_resolved_selector = resolved.get("stable") if self.resolve_selectors else None
+        return resolved["element"]
+
+    def _cached_resolutions(self, selector: str) -> List[List[str]]:
+        """The cached [selector, strategy] resolution of a selector on this page, as a list to prepend."""
+        if not self.selector_cache:
+            return []
+        cached = self.selector_cache.get(self.current_page_info.get("url", ""), selector)
+        return [cached] if cached else []
+
+    def _learn(self, url: str, selector: str, resolved: Optional[Dict], succeeded: bool) -> None:
+        """Update the selector cache once the action on a resolved element has run.
+        
+        Counts a hit when the cached resolution was used and the action
+        succeeded, and drops the cached resolution otherwise. After a
+        successful action, stores the unique selector of the element found,
+        or the selector and strategy that found it when it has none, unless
+        it was found by a generic fallback selector rather than the one asked for.
+        
+        Args:
+            url: The URL of the page the element was resolved on
+            selector: The selector as requested by the plan
+            resolved: The dictionary returned by _resolve_element, or None
+            succeeded: Whether the action on the element succeeded
+        """
+        if not self.selector_cache:
+            return
+        cached = self.selector_cache.get(url, selector)
+        element = (resolved or {}).get("element")
+        worked = succeeded and element is not None
+        if cached and worked and [resolved["selector"], resolved["strategy"]] == cached:
+            self.selector_cache.hit(url, selector)
+            return
+        if cached:
+            self.selector_cache.invalidate(url, selector)
+        if worked and not resolved.get("fallback"):
+            if resolved.get("stable"):
+                self.selector_cache.store(url, selector, resolved["stable"], "css")
+            else:
+                self.selector_cache.store(url, selector, resolved["selector"], resolved["strategy"])
 
     def goto(self, url: str) -> Optional[str]:
         """Navigate to URL with enhanced error handling."""
@@ -123,15 +403,23 @@ class Browser:
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
             
+        error = self._deadline_error(f"navigating to {url}")
+        if error:
+            return error
+            
         console.print(f"Navigating to [cyan]{url}[/cyan]...")
         
         try:
+            self._apply_page_load_timeout()
+            started = time.time()
             self.driver.get(url)
-            time.sleep(random.uniform(1, 3))  # Random delay to appear human
+            self._pause("navigate", url)
             self._update_page_info()
             
-            # Wait for page to load
-            self.wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
+            # Wait for the page to load and settle
+            if "load" in self.wait_until(self.readiness.conditions_for("GOTO"), started,
+                                         idle_timeout=self.readiness.idle_timeout):
+                return f"Timeout loading {url}"
             
             console.print(f"[green]Successfully loaded: {self.driver.title}[/green]")
             return None
@@ -144,186 +432,241 @@ class Browser:
             return f"Unexpected error navigating to {url}: {str(e)}"
 
     def find_elements_smart(self, selector: str) -> List:
-        """Smart element finding with multiple strategies."""
-        if not self.driver:
-            return []
-            
-        strategies = [
-            (By.CSS_SELECTOR, selector),
-            (By.XPATH, f"//*[@id='{selector}']"),
-            (By.NAME, selector),
-            (By.CLASS_NAME, selector),
-            (By.XPATH, f"//*[contains(@placeholder, '{selector}')]"),
-            (By.XPATH, f"//*[contains(@aria-label, '{selector}')]"),
-            (By.XPATH, f"//*[contains(text(), '{selector}')]")
-        ]
+        """Smart element finding with multiple strategies.
         
-        for by, value in strategies:
-            try:
-                elements = self.driver.find_elements(by, value)
-                if elements:
-                    return elements
-            except Exception:
-                continue
-                
-        return []
-
-    def type(self, selector: str, text: str) -> Optional[str]:
-        """Enhanced typing with multiple fallback strategies."""
+        Returns the first visible, enabled match as a one-element list, or an
+        empty list.
+        """
         if not self.driver:
-            return "Browser not initialized."
-
-        console.print(f"Typing '{text[:50]}{'...' if len(text) > 50 else ''}' into element...")
+            return []
+        element = self._resolve_element([selector])["element"]
+        return [element] if element else []
 
-        # Domain-specific optimizations
-        domain = self.current_page_info.get("domain", "")
+    def _find_input(self, selector: str):
+        """Find the input element for a selector, returning (resolved, error).
+        
+        The resolved dictionary is the one returned by _resolve_element, with
+        "fallback" set when only a generic input selector matched. A
+        resolution cached by a previous run is tried before the selector itself.
+        """
+        cached = self._cached_resolutions(selector)
         
         # Strategy 1: Smart element finding
-        elements = self.find_elements_smart(selector)
+        resolved = self._resolve_element(cached + [selector])
+        candidates = resolved["candidates"]
         
-        if not elements:
+        if not resolved["element"] and not candidates:
             # Strategy 2: Wait for element to appear
+            def appeared(_):
+                result = self._resolve_element(cached + [selector])
+                return result if result["element"] else None
             try:
-                element = self.wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                elements = [element]
+                resolved = self._wait().until(appeared)
             except TimeoutException:
                 pass
         
         # Strategy 3: Try common input selectors
-        if not elements:
+        if not resolved["element"]:
+            candidates = max(candidates, resolved["candidates"])
             common_selectors = [
                 "input[type='text']", "input[type='search']", "textarea",
                 "input[name='q']", "input[name='search']", "#search", ".search-input"
             ]
-            
-            for sel in common_selectors:
-                elements = self.find_elements_smart(sel)
-                if elements:
-                    break
+            resolved = {**self._resolve_element(common_selectors), "fallback": True}
         
-        if not elements:
-            return f"Could not find element with selector: {selector}"
+        if not resolved["element"]:
+            self._learn(self.current_page_info.get("url", ""), selector, resolved, False)
+            if candidates or resolved["candidates"]:
+                return None, "No suitable input element found"
+            return None, f"Could not find element with selector: {selector}"
         
-        # Use the first visible and enabled element
-        target_element = None
-        for element in elements:
-            try:
-                if element.is_displayed() and element.is_enabled():
-                    target_element = element
-                    break
-            except Exception:
-                continue
-        
-        if not target_element:
-            return "No suitable input element found"
+        return resolved, None
+
+    def type(self, selector: str, text: str) -> Optional[str]:
+        """Enhanced typing with multiple fallback strategies."""
+        if not self.driver:
+            return "Browser not initialized."
+        error = self._deadline_error(f"typing into {selector}")
+        if error:
+            return error
+
+        console.print(f"Typing '{text[:50]}{'...' if len(text) > 50 else ''}' into element...")
+
+        self.last_resolved_selector = None
+        url = self.current_page_info.get("url", "")
+        resolved, error = self._find_input(selector)
+        if error:
+            return error
+        target_element = self._use_resolved(resolved)
         
         try:
             # Enhanced typing strategy
-            element_info = self._get_element_info(target_element)
-            console.print(f"[dim]Found {element_info.get('tag', 'element')} element[/dim]")
-            
-            # Clear existing content
-            target_element.clear()
-            time.sleep(random.uniform(0.1, 0.3))
-            
-            # Focus the element
-            target_element.click()
-            time.sleep(random.uniform(0.1, 0.3))
+            console.print(f"[dim]Found {resolved['info']['tag']} element by {resolved['strategy']}[/dim]")
+            started, start_url = time.time(), self.current_page_info.get("url", "")
             
-            # Type with human-like behavior
-            for char in text:
-                target_element.send_keys(char)
-                time.sleep(random.uniform(0.05, 0.15))
-            
-            # Trigger input event for modern web apps
-            self.driver.execute_script(
-                "arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", 
-                target_element
-            )
+            typing = self.pacer.profile_for(self.current_page_info.get("url")).typing
+            if typing == "bulk":
+                # Replace the content and fire input/change in a single round trip
+                self.driver.execute_script(FILL_SCRIPT, target_element, text)
+            else:
+                # Clear existing content
+                target_element.clear()
+                self._pause("focus")
+                
+                # Focus the element
+                target_element.click()
+                self._pause("focus")
+                
+                # Type with human-like behavior, a character or a word per call
+                chunks = text if typing == "keys" else re.findall(r"\S+\s*|\s+", text)
+                for chunk in chunks:
+                    target_element.send_keys(chunk)
+                    self._pause("keystroke")
+                
+                # Trigger input event for modern web apps
+                self.driver.execute_script(
+                    "arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", 
+                    target_element
+                )
             
+            self._settle("TYPE", started, start_url)
+            self._learn(url, selector, resolved, True)
             console.print("[green]✅ Text typed successfully[/green]")
             return None
             
         except Exception as e:
+            self._learn(url, selector, resolved, False)
             return f"Error typing text: {str(e)}"
 
+    def submit(self, selector: str, text: str, submit_selector: Optional[str] = None) -> Optional[str]:
+        """Fill an input and submit its form in a single script call.
+        
+        Used for TYPE+CLICK pairs fused by the plan optimizer. The value is set
+        through the native setter so framework-managed inputs see the change,
+        then the submit control is clicked, or the form is submitted when no
+        control matches. Falls back to separate type and click calls when the
+        input has neither a matching submit control nor a form.
+        """
+        if not self.driver:
+            return "Browser not initialized."
+        error = self._deadline_error(f"submitting {selector}")
+        if error:
+            return error
+
+        console.print(f"Submitting '{text[:50]}{'...' if len(text) > 50 else ''}' via {selector}...")
+
+        self.last_resolved_selector = None
+        url = self.current_page_info.get("url", "")
+        resolved, error = self._find_input(selector)
+        if error:
+            return error
+        target_element = self._use_resolved(resolved)
+        
+        try:
+            started, start_url = time.time(), self.current_page_info.get("url", "")
+            submitted = self.driver.execute_script(SUBMIT_SCRIPT, target_element, text, submit_selector)
+        except Exception as e:
+            self._learn(url, selector, resolved, False)
+            return f"Error submitting text: {str(e)}"
+        
+        if not submitted:
+            return self._type_then_click(selector, text, submit_selector)
+        
+        self._learn(url, selector, resolved, True)
+        self._settle("SUBMIT", started, start_url)
+        console.print(f"[green]✅ Submitted using the {submitted}[/green]")
+        return None
+
+    def _type_then_click(self, selector: str, text: str, submit_selector: Optional[str]) -> Optional[str]:
+        """Unfused fallback for submit()."""
+        error = self.type(selector, text)
+        if error or not submit_selector:
+            return error
+        return self.click(submit_selector)
+
     def click(self, selector: str) -> Optional[str]:
         """Enhanced clicking with multiple strategies."""
         if not self.driver:
             return "Browser not initialized."
+        error = self._deadline_error(f"clicking {selector}")
+        if error:
+            return error
             
         console.print(f"Clicking element: {selector}")
+        self.last_resolved_selector = None
         
-        # Find elements using smart strategy
-        elements = self.find_elements_smart(selector)
+        # A resolution cached by a previous run goes first
+        url = self.current_page_info.get("url", "")
+        cached = self._cached_resolutions(selector)
+        selectors = cached + [selector]
         
         # Domain-specific optimizations
         domain = self.current_page_info.get("domain", "")
+        fallbacks = []
         if "google.com" in domain:
-            google_selectors = [
+            fallbacks = [
                 "input[name='btnK']", "button[type='submit']", 
                 "input[type='submit']", "button[jsname='VlcLAe']"
             ]
-            for sel in google_selectors:
-                google_elements = self.find_elements_smart(sel)
-                if google_elements:
-                    elements.extend(google_elements)
-        
-        if not elements:
-            return f"Could not find clickable element: {selector}"
-        
-        # Find the best element to click
-        target_element = None
-        for element in elements:
-            try:
-                if element.is_displayed() and element.is_enabled():
-                    target_element = element
-                    break
-            except Exception:
-                continue
         
-        if not target_element:
+        # Find the best element to click, with its metadata, in one call
+        resolved = self._resolve_element(selectors + fallbacks)
+        if resolved["element"] and resolved["selector"] not in [s for s, _ in cached] + [selector]:
+            resolved["fallback"] = True
+        if not resolved["element"]:
+            self._learn(url, selector, resolved, False)
+            if not resolved["candidates"]:
+                return f"Could not find clickable element: {selector}"
             return "No clickable element found"
+        # The stable selector is resolved before clicking, which may navigate away
+        target_element = self._use_resolved(resolved)
         
         try:
             # Multiple click strategies
-            element_info = self._get_element_info(target_element)
-            console.print(f"[dim]Clicking {element_info.get('tag', 'element')}[/dim]")
+            console.print(f"[dim]Clicking {resolved['info']['tag']} found by {resolved['strategy']}[/dim]")
             
             # Strategy 1: Scroll to element and click
             self.driver.execute_script("arguments[0].scrollIntoView(true);", target_element)
-            time.sleep(random.uniform(0.5, 1.0))
-            
-            # Strategy 2: Try ActionChains for more human-like clicking
-            try:
-                ActionChains(self.driver).move_to_element(target_element).click().perform()
-                console.print("[green]✅ Clicked using ActionChains[/green]")
-                return None
-            except Exception:
-                pass
-            
-            # Strategy 3: Direct click
-            try:
-                target_element.click()
-                console.print("[green]✅ Clicked directly[/green]")
-                return None
-            except Exception:
-                pass
+            self._pause("click")
             
-            # Strategy 4: JavaScript click
-            self.driver.execute_script("arguments[0].click();", target_element)
-            console.print("[green]✅ Clicked using JavaScript[/green]")
+            started, start_url = time.time(), self.current_page_info.get("url", "")
+            method = self._click_element(target_element)
+            self._learn(url, selector, resolved, True)
+            self._settle("CLICK", started, start_url)
+            console.print(f"[green]✅ Clicked {method}[/green]")
             return None
             
         except Exception as e:
+            self._learn(url, selector, resolved, False)
             return f"Error clicking element: {str(e)}"
 
+    def _click_element(self, element) -> str:
+        """Click an element with the first strategy that works, returning how it was clicked."""
+        # Strategy 2: Try ActionChains for more human-like clicking
+        try:
+            ActionChains(self.driver).move_to_element(element).click().perform()
+            return "using ActionChains"
+        except Exception:
+            pass
+        
+        # Strategy 3: Direct click
+        try:
+            element.click()
+            return "directly"
+        except Exception:
+            pass
+        
+        # Strategy 4: JavaScript click
+        self.driver.execute_script("arguments[0].click();", element)
+        return "using JavaScript"
+
     def scroll(self, direction: str, amount: int = None) -> Optional[str]:
         """Enhanced scrolling with configurable amount."""
         if not self.driver:
             return "Browser not initialized."
+        error = self._deadline_error(f"scrolling {direction}")
+        if error:
+            return error
             
         if amount is None:
             amount = 500 if direction in ["down", "up"] else 0
@@ -331,6 +674,7 @@ class Browser:
         console.print(f"Scrolling {direction}...")
         
         try:
+            started, start_url = time.time(), self.current_page_info.get("url", "")
             if direction == "down":
                 self.driver.execute_script(f"window.scrollBy(0, {amount});")
             elif direction == "up":
@@ -342,7 +686,8 @@ class Browser:
             else:
                 return f"Unknown scroll direction: {direction}"
                 
-            time.sleep(random.uniform(0.5, 1.0))
+            self._pause("scroll")
+            self._settle("SCROLL", started, start_url)
             return None
             
         except Exception as e:
@@ -365,6 +710,30 @@ class Browser:
         except Exception as e:
             return f"Failed to take screenshot: {str(e)}"
 
+    def describe_page(self, max_elements: int = 30) -> str:
+        """Compact description of the current page for replanning.
+        
+        Args:
+            max_elements: Maximum number of interactive elements to list
+            
+        Returns:
+            The URL, title and visible interactive elements, one per line
+        """
+        if not self.driver:
+            return "Browser not initialized."
+        
+        lines = []
+        try:
+            lines.append(f"URL: {self.driver.current_url}")
+            lines.append(f"Title: {self.driver.title}")
+            elements = self.driver.execute_script(DESCRIBE_PAGE_SCRIPT, max_elements) or []
+            if elements:
+                lines.append("Interactive elements:")
+                lines.extend(f"- {element}" for element in elements)
+        except Exception as e:
+            lines.append(f"(page could not be inspected: {e})")
+        return "\n".join(lines)
+
     def get_page_source(self) -> str:
         """Get the current page source."""
         if not self.driver:
@@ -377,19 +746,100 @@ class Browser:
             return ""
         return self.driver.current_url
 
+    def get_state(self) -> Dict:
+        """Current URL and cookies, for checkpointing a run.
+
+        All cookies are read through the DevTools protocol, not only those of
+        the current domain, falling back to WebDriver if that is unavailable.
+        """
+        if not self.driver:
+            return {"url": "", "cookies": []}
+        try:
+            cookies = self.driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+        except Exception:
+            cookies = [
+                {**cookie, "expires": cookie.pop("expiry")} if "expiry" in cookie else cookie
+                for cookie in self.driver.get_cookies()
+            ]
+        return {"url": self.driver.current_url, "cookies": cookies}
+
+    def restore_state(self, url: str, cookies: List[Dict]) -> Optional[str]:
+        """Restore cookies saved by get_state and load the page the run was on.
+
+        Returns:
+            Error message if the page could not be loaded, None on success
+        """
+        if not self.driver:
+            return "Browser not initialized."
+
+        keys = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+        params = [{key: cookie[key] for key in keys if key in cookie} for cookie in cookies]
+        try:
+            if params:
+                self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": params})
+        except Exception:
+            # Without the DevTools protocol cookies can only be set on their own domain
+            if url:
+                self.goto(url)
+            host = urlparse(self.driver.current_url).hostname or ""
+            for cookie in params:
+                if host.endswith(cookie.get("domain", "").lstrip(".")):
+                    selenium_cookie = {key: value for key, value in cookie.items() if key != "expires"}
+                    if "expires" in cookie and cookie["expires"] > 0:
+                        selenium_cookie["expiry"] = int(cookie["expires"])
+                    try:
+                        self.driver.add_cookie(selenium_cookie)
+                    except Exception:
+                        pass
+
+        console.print(f"[green]Restored {len(params)} cookies[/green]")
+        return self.goto(url) if url else None
+
     def wait_for_element(self, selector: str, timeout: int = 10):
         """Wait for an element to be present."""
         if not self.driver:
             return None
         try:
-            return WebDriverWait(self.driver, timeout).until(
+            return self._wait(timeout).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, selector))
             )
         except TimeoutException:
             return None
 
+    def reset(self) -> None:
+        """Return the browser to a blank state for its next user.
+        
+        Closes every tab but one, navigates it to about:blank, and clears
+        cookies, the HTTP cache and the storage (local and session storage,
+        IndexedDB, service workers, cache storage) of every origin visited.
+        
+        Raises:
+            WebDriverException: If the browser could not be reset
+        """
+        handles = self.driver.window_handles
+        for handle in handles[1:]:
+            self.driver.switch_to.window(handle)
+            self._track_origin(self.driver.current_url)
+            self.driver.close()
+        self.driver.switch_to.window(handles[0])
+        self._track_origin(self.driver.current_url)
+        self.driver.get("about:blank")
+        self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        self.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        for origin in self.visited_origins:
+            self.driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        self.visited_origins = set()
+        self.current_page_info = {}
+
     def close(self):
-        """Close the browser with cleanup."""
+        """Close the browser with cleanup.
+        
+        A pooled session is reset and returned to its pool instead of quitting
+        Chrome; one that cannot be reset is recycled.
+        """
+        if self.session:
+            self._release_session()
+            return
         if self.driver:
             try:
                 console.print("[bold blue]Closing browser...[/bold blue]")
@@ -398,4 +848,23 @@ class Browser:
             except Exception as e:
                 console.print(f"[yellow]Warning: Error closing browser: {e}[/yellow]")
             finally:
-                self.driver = None
\ No newline at end of file
+                self.driver = None
+
+    def _release_session(self) -> None:
+        """Reset a pooled session, detach from it and return it to the pool."""
+        recycle = self.driver is None
+        if self.driver:
+            try:
+                self.reset()
+            except Exception as e:
+                console.print(f"[yellow]Warning: Could not reset pooled browser, recycling it: {e}[/yellow]")
+                recycle = True
+            try:
+                # Ends the WebDriver session only; Chrome was not launched by it and keeps running
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+        self.pool.release(self.session["id"], recycle=recycle)
+        console.print("[green]Browser returned to the pool[/green]")
+        self.session = None
@@ -0,0 +1,418 @@
+# seifcli/seif/browser_pool.py
+
+import json
+import os
+import secrets
+import shutil
+import signal
+import socket
+import subprocess
+import time
+import urllib.request
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+from rich.console import Console
+from webdriver_manager.chrome import ChromeDriverManager
+
+from .browser import chrome_arguments
+from .config import config
+
+console = Console()
+
+# Chrome executables looked up when pool.chrome_path is not set
+CHROME_CANDIDATES = [
+    "google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+]
+
+# A lock whose holder has died is left over from a crash. One older than
+# this is also broken, in case the holder's pid was reused since
+STALE_LOCK_SECONDS = 300
+
+# Windows API constants used to probe processes without psutil
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+ERROR_ACCESS_DENIED = 5
+STILL_ACTIVE = 259
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    """Whether a process with this pid is running."""
+    if not pid:
+        return False
+    if os.name == "nt":
+        return _windows_pid_alive(pid)
+    try:
+        os.kill(pid, 0)
+        return True
+    except PermissionError:
+        return True
+    except (OSError, SystemError):
+        return False
+
+
+def _windows_pid_alive(pid: int) -> bool:
+    # os.kill(pid, 0) terminates the process on Windows instead of probing it
+    try:
+        import psutil
+        return psutil.pid_exists(pid)
+    except ImportError:
+        pass
+    import ctypes
+    from ctypes import wintypes
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        # Access is denied to processes of other users, which are still running
+        return ctypes.get_last_error() == ERROR_ACCESS_DENIED
+    try:
+        exit_code = wintypes.DWORD()
+        if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+            return False
+        return exit_code.value == STILL_ACTIVE
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def _process_tree_rss(pid: int) -> Optional[float]:
+    """Resident memory in MB of a process and its descendants, or None if it cannot be measured."""
+    try:
+        import psutil
+        process = psutil.Process(pid)
+        return sum(p.memory_info().rss for p in [process] + process.children(recursive=True)) / 2**20
+    except ImportError:
+        pass
+    except Exception:
+        return None
+    # Without psutil, read /proc where it exists
+    proc = Path("/proc")
+    if not proc.exists():
+        return None
+    parents, rss_pages = {}, {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+            fields = stat[stat.rindex(")") + 2:].split()
+            parents[int(entry.name)] = int(fields[1])
+            rss_pages[int(entry.name)] = int(fields[21])
+        except Exception:
+            continue
+    if pid not in rss_pages:
+        return None
+    tree, frontier = {pid}, [pid]
+    while frontier:
+        parent = frontier.pop()
+        children = [child for child, ppid in parents.items() if ppid == parent and child not in tree]
+        tree.update(children)
+        frontier.extend(children)
+    return sum(rss_pages[p] for p in tree) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+class BrowserPool:
+    """
+    A pool of pre-launched Chrome processes shared by every SeifCLI process.
+
+    Each session is a Chrome started with remote debugging and its own
+    profile, recorded in a state file under the config directory. A task
+    checks a session out, attaches to it with WebDriver instead of launching
+    Chrome, and releases it when done: the browser is reset in between and
+    recycled once it has served pool.max_tasks tasks or its memory exceeds
+    pool.max_rss_mb. Released and recycled sessions are replaced so pool.size
+    stay ready.
+    """
+
+    def __init__(self, browser_config: Optional[Dict] = None, root: Optional[Path] = None):
+        """
+        Args:
+            browser_config: Browser settings used to launch Chrome (headless,
+                window_size, user_agent); defaults to the browser section of the config
+            root: Directory of the state file and profiles
+        """
+        self.browser_config = browser_config if browser_config is not None else config.config.get("browser", {})
+        self.root = Path(root) if root else config.get_config_dir() / "pool"
+        self.state_path = self.root / "state.json"
+        self.lock_path = self.root / "state.lock"
+        self.size = config.get("pool", "size", 2)
+        self.max_tasks = config.get("pool", "max_tasks", 20)
+        self.max_rss_mb = config.get("pool", "max_rss_mb", 1500)
+        self.start_timeout = config.get("pool", "start_timeout", 20)
+        self.chrome_path = config.get("pool", "chrome_path", "")
+
+    def _lock_stale(self) -> bool:
+        """Whether the lock file was left behind by a process that no longer holds it."""
+        try:
+            age = time.time() - self.lock_path.stat().st_mtime
+            holder = self.lock_path.read_text().strip()
+        except FileNotFoundError:
+            return False
+        if age > STALE_LOCK_SECONDS:
+            return True
+        # An empty lock file is being written by its holder, or was left by one that died right after creating it
+        return not _pid_alive(int(holder)) if holder.isdigit() else age > 1
+
+    @contextmanager
+    def _locked(self):
+        """Hold the pool lock, which serializes state changes across processes."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        while True:
+            try:
+                fd = os.open(str(self.lock_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                break
+            except FileExistsError:
+                if self._lock_stale():
+                    try:
+                        self.lock_path.unlink()
+                    except FileNotFoundError:
+                        pass
+                    continue
+                time.sleep(0.05)
+        try:
+            yield
+        finally:
+            os.close(fd)
+            try:
+                self.lock_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _load(self) -> Dict:
+        if not self.state_path.exists():
+            return {"sessions": [], "driver_path": ""}
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not load browser pool state: {e}[/yellow]")
+            return {"sessions": [], "driver_path": ""}
+
+    def _save(self, state: Dict) -> None:
+        """Persist the pool state. Caller must hold the lock."""
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+        tmp_path.replace(self.state_path)
+
+    def active(self) -> bool:
+        """Whether the pool has been started and not stopped."""
+        return bool(self._load()["sessions"])
+
+    def _chrome(self) -> str:
+        """
+        Raises:
+            FileNotFoundError: If no Chrome executable can be found
+        """
+        for candidate in ([self.chrome_path] if self.chrome_path else CHROME_CANDIDATES):
+            path = shutil.which(candidate) or (candidate if Path(candidate).is_file() else None)
+            if path:
+                return path
+        raise FileNotFoundError("Chrome executable not found; set pool.chrome_path")
+
+    def _driver_path(self) -> str:
+        """
+        The chromedriver path, resolved once and kept in the state file.
+
+        Must be called without the lock: resolving it may download a driver,
+        which would hold every other process up.
+        """
+        driver_path = self._load().get("driver_path")
+        if driver_path and Path(driver_path).exists():
+            return driver_path
+        driver_path = ChromeDriverManager().install()
+        with self._locked():
+            state = self._load()
+            state["driver_path"] = driver_path
+            self._save(state)
+        return driver_path
+
+    def _launch(self, state: Dict) -> Dict:
+        """Launch a Chrome session without waiting for it to be ready. Caller must hold the lock."""
+        session_id = secrets.token_hex(4)
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        profile = self.root / "profiles" / session_id
+        command = [self._chrome(), f"--remote-debugging-port={port}", f"--user-data-dir={profile}",
+                   "--no-first-run", "--no-default-browser-check"] + chrome_arguments(self.browser_config)
+        # Detached so the session outlives the process that launched it
+        if os.name == "nt":
+            detach = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            detach = {"start_new_session": True}
+        process = subprocess.Popen(command + ["about:blank"], stdin=subprocess.DEVNULL,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **detach)
+        session = {
+            "id": session_id,
+            "pid": process.pid,
+            "port": port,
+            "profile": str(profile),
+            "status": "idle",
+            "owner": None,
+            "tasks": 0,
+            "started_at": time.time(),
+            "last_used": None
+        }
+        state["sessions"].append(session)
+        return session
+
+    def _kill(self, session: Dict) -> None:
+        """Terminate a session's Chrome and delete its profile."""
+        try:
+            if os.name == "nt":
+                os.kill(session["pid"], signal.SIGTERM)
+            else:
+                os.killpg(session["pid"], signal.SIGTERM)
+        except OSError:
+            pass
+        shutil.rmtree(session["profile"], ignore_errors=True)
+
+    def _prune(self, state: Dict) -> None:
+        """Drop sessions whose Chrome exited or whose owner died mid-task. Caller must hold the lock."""
+        kept = []
+        for session in state["sessions"]:
+            if not _pid_alive(session["pid"]):
+                shutil.rmtree(session["profile"], ignore_errors=True)
+            elif session["status"] == "busy" and not _pid_alive(session["owner"]):
+                # Never reset after its last task, so it cannot be handed out again
+                self._kill(session)
+            else:
+                kept.append(session)
+        state["sessions"] = kept
+
+    def _fill(self, state: Dict) -> None:
+        """Launch sessions until the pool has its configured size. Caller must hold the lock."""
+        while len(state["sessions"]) < self.size:
+            self._launch(state)
+
+    def _endpoint(self, session: Dict, path: str, method: str = "GET"):
+        request = urllib.request.Request(f"http://127.0.0.1:{session['port']}{path}", method=method)
+        with urllib.request.urlopen(request, timeout=2) as response:
+            return json.loads(response.read().decode("utf-8") or "null")
+
+    def healthy(self, session: Dict) -> bool:
+        """Whether a session's DevTools endpoint responds."""
+        try:
+            self._endpoint(session, "/json/version")
+            return True
+        except Exception:
+            return False
+
+    def _wait_ready(self, session: Dict) -> bool:
+        """Wait until a session accepts connections and has a page to attach to."""
+        ends_at = time.monotonic() + self.start_timeout
+        while time.monotonic() < ends_at:
+            try:
+                if not any(target.get("type") == "page" for target in self._endpoint(session, "/json/list")):
+                    self._endpoint(session, "/json/new?about:blank", method="PUT")
+                return True
+            except Exception:
+                time.sleep(0.1)
+        return False
+
+    def start(self) -> List[Dict]:
+        """
+        Launch sessions until the pool has its configured size and wait for them.
+
+        Raises:
+            FileNotFoundError: If no Chrome executable can be found
+
+        Returns:
+            The sessions of the pool
+        """
+        self._driver_path()
+        with self._locked():
+            state = self._load()
+            self._prune(state)
+            self._fill(state)
+            self._save(state)
+        for session in state["sessions"]:
+            if not self._wait_ready(session):
+                console.print(f"[yellow]Warning: Pooled browser {session['id']} did not start in time[/yellow]")
+        return state["sessions"]
+
+    def checkout(self) -> Optional[Dict]:
+        """
+        Reserve an idle session for the calling process, starting the pool if needed.
+
+        Returns:
+            The session, with the chromedriver path under "driver_path", or None
+            if no session is free, in which case the caller launches its own browser
+        """
+        try:
+            driver_path = self._driver_path()
+            with self._locked():
+                state = self._load()
+                self._prune(state)
+                self._fill(state)
+                session = next((s for s in state["sessions"] if s["status"] == "idle"), None)
+                if session:
+                    session.update(status="busy", owner=os.getpid(), last_used=time.time())
+                self._save(state)
+        except Exception as e:
+            console.print(f"[yellow]Warning: Browser pool unavailable: {e}[/yellow]")
+            return None
+        if session is None:
+            return None
+        if not self._wait_ready(session):
+            self.release(session["id"], recycle=True)
+            return None
+        return {**session, "driver_path": driver_path}
+
+    def release(self, session_id: str, recycle: bool = False) -> None:
+        """
+        Return a checked-out session to the pool after its browser was reset.
+
+        The session is recycled, and replaced by a fresh one, when recycle is
+        set or it has reached pool.max_tasks tasks or pool.max_rss_mb.
+
+        Args:
+            session_id: The id of the session
+            recycle: Whether the session must not be reused
+        """
+        with self._locked():
+            state = self._load()
+            session = next((s for s in state["sessions"] if s["id"] == session_id), None)
+            if session:
+                session["tasks"] += 1
+                rss = _process_tree_rss(session["pid"])
+                if recycle or session["tasks"] >= self.max_tasks or (rss is not None and rss > self.max_rss_mb):
+                    self._kill(session)
+                    state["sessions"].remove(session)
+                else:
+                    session.update(status="idle", owner=None)
+            self._prune(state)
+            try:
+                self._fill(state)
+            except Exception as e:
+                console.print(f"[yellow]Warning: Could not replenish the browser pool: {e}[/yellow]")
+            self._save(state)
+
+    def status(self) -> List[Dict]:
+        """The sessions of the pool with their health and memory use."""
+        with self._locked():
+            state = self._load()
+            self._prune(state)
+            self._save(state)
+        return [{**session, "healthy": self.healthy(session), "rss_mb": _process_tree_rss(session["pid"])}
+                for session in state["sessions"]]
+
+    def stop(self) -> int:
+        """Terminate every session, busy ones included. Returns how many were stopped."""
+        with self._locked():
+            state = self._load()
+            for session in state["sessions"]:
+                self._kill(session)
+            stopped = len(state["sessions"])
+            state["sessions"] = []
+            self._save(state)
+        return stopped
+
+
+def pool_enabled() -> bool:
+    """Whether tasks should check browsers out of the pool: it is enabled or has been started."""
+    return config.get("pool", "enabled", False) or BrowserPool().active()
@@ -1,13 +1,16 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Union
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.status import Status
 from rich.prompt import Prompt
 import time
 
+from .intents import IntentMatcher
 from .llm import LLM
 from .memory import Memory
 from .config import config
+from .tokens import message_tokens
 
 console = Console()
 
@@ -21,15 +24,21 @@ class ChatManager:
     - Chat history persistence
     """
     
-    def __init__(self, model: Optional[str] = None):
+    def __init__(self, model: Optional[str] = None, intent_matcher: Optional[IntentMatcher] = None):
         """Initialize the chat manager.
         
         Args:
             model: Optional model name to use for the LLM
+            intent_matcher: Optional rule-based matcher used to plan simple
+                'task:' commands without the LLM
         """
         self.llm = LLM(model=model)
-        self.memory = Memory()
+        self.intent_matcher = intent_matcher
+        self.memory = Memory(token_counter=self.llm.count_tokens)
         self.system_prompt = self._get_system_prompt()
+        self.system_prompt_tokens = message_tokens(self.system_prompt, self.llm.count_tokens)
+        self.continue_context = config.get("chat", "continue_context", True)
+        self._memory_revision = self.memory.revision
         
         self.memory.add_message("system", self.system_prompt)
     
@@ -89,12 +98,33 @@ class ChatManager:
                 
         elif user_input.lower().startswith('task:'):
             task = user_input[5:].strip()
-            return {"action": "task", "content": task}
+            # A plan from the fast path lets the agent skip the planner
+            plan = self.intent_matcher.match(task) if self.intent_matcher else None
+            return {"action": "task", "content": task, "plan": plan}
         
         self.memory.add_message("user", user_input)
         
         return {"action": "chat", "content": user_input}
     
+    def _context_history(self, user_input: str) -> List[Dict[str, str]]:
+        """Build the token-bounded history sent alongside the current input.
+        
+        Args:
+            user_input: The user's input text, which is sent separately
+            
+        Returns:
+            The most recent messages that fit the context window
+        """
+        context = self.memory.get_formatted_context(
+            include_system=False,
+            reserve_tokens=self.system_prompt_tokens
+        )
+        
+        # process_input() already stored the current input; it is sent as the prompt
+        if context and context[-1]["role"] == "user" and context[-1]["content"] == user_input:
+            context = context[:-1]
+        return context
+    
     def generate_response(self, user_input: str) -> str:
         """Generate a response to the user input.
         
@@ -104,27 +134,85 @@ class ChatManager:
         Returns:
             The generated response
         """
-        context = self.memory.get_formatted_context()
-        
         with console.status("[bold green]Thinking...[/bold green]", spinner="dots") as status:
             response = self.llm.generate(
                 prompt=user_input,
                 system_prompt=self.system_prompt,
-                with_history=True
+                history=self._context_history(user_input)
             )
         
         self.memory.add_message("assistant", response)
         
         return response
     
-    def display_response(self, response: str) -> None:
+    def generate_response_stream(self, user_input: str) -> Iterator[str]:
+        """Generate a response to the user input, yielding tokens as they arrive.
+        
+        The complete response is added to memory once the stream is exhausted.
+        
+        Args:
+            user_input: The user's input text
+            
+        Yields:
+            Response tokens
+        """
+        if self.memory.revision != self._memory_revision:
+            # History was cleared or replaced; the server-side context no longer matches it
+            self.llm.reset_continuation()
+            self._memory_revision = self.memory.revision
+        
+        if self.continue_context:
+            stream = self.llm.continue_stream(
+                prompt=user_input,
+                system_prompt=self.system_prompt,
+                history=self._context_history(user_input)
+            )
+        else:
+            stream = self.llm.generate_stream(
+                prompt=user_input,
+                system_prompt=self.system_prompt,
+                history=self._context_history(user_input)
+            )
+        
+        chunks = []
+        for token in stream:
+            chunks.append(token)
+            yield token
+        
+        self.memory.add_message("assistant", "".join(chunks))
+    
+    def display_response(self, response: Union[str, Iterable[str]]) -> str:
         """Display the response to the user.
         
         Args:
-            response: The response text
+            response: The response text, or an iterable of tokens which is
+                rendered incrementally as Markdown while it is consumed
+                
+        Returns:
+            The full response text
         """
         console.print(f"[bold green]🤖 Assistant:[/bold green]")
-        console.print(Markdown(response))
+        
+        if isinstance(response, str):
+            console.print(Markdown(response))
+            return response
+        
+        text = ""
+        with Live(Markdown(text), console=console, refresh_per_second=12, vertical_overflow="visible") as live:
+            for token in response:
+                text += token
+                live.update(Markdown(text))
+        
+        stats = self.llm.last_stats
+        if stats.get("prompt_eval_count") is not None:
+            mode = "continued context" if stats.get("continued") else "full history"
+            console.print(f"[dim]Prompt eval: {stats['prompt_eval_count']} tokens ({mode})[/dim]")
+        if stats and config.get("ui", "verbose_logging", False):
+            console.print(
+                f"[dim]First token after {stats['time_to_first_token']:.2f}s, "
+                f"completed in {stats['total_time']:.2f}s[/dim]"
+            )
+        return text
     
     def list_sessions(self) -> None:
         """List all saved chat sessions."""
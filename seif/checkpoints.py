@@ -0,0 +1,137 @@
+# seifcli/seif/checkpoints.py
+
+import json
+import secrets
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+from rich.console import Console
+
+from .config import config
+from .plan import PlanStep
+
+console = Console()
+
+
+def new_run_id() -> str:
+    """A sortable, unique run identifier, e.g. 20261018-143055-3fa2."""
+    return time.strftime("%Y%m%d-%H%M%S") + "-" + secrets.token_hex(2)
+
+
+@dataclass
+class Checkpoint:
+    """The state of a task run after its last completed step."""
+
+    run_id: str
+    prompt: str
+    steps: List[PlanStep]
+    # Index of the first step that has not completed
+    next_step: int = 0
+    # False while the planner was still streaming steps
+    plan_complete: bool = True
+    url: str = ""
+    # Browser cookies, as returned by the DevTools protocol
+    cookies: List[Dict] = field(default_factory=list)
+    execution_log: List[Dict] = field(default_factory=list)
+    # "running" until the run ends; a run that died keeps "running"
+    status: str = "running"
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    @property
+    def resumable(self) -> bool:
+        return self.status != "succeeded" and self.next_step < len(self.steps)
+
+    def to_dict(self) -> Dict:
+        return {
+            "run_id": self.run_id,
+            "prompt": self.prompt,
+            "steps": [step.to_dict() for step in self.steps],
+            "next_step": self.next_step,
+            "plan_complete": self.plan_complete,
+            "url": self.url,
+            "cookies": self.cookies,
+            "execution_log": self.execution_log,
+            "status": self.status,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Checkpoint":
+        return cls(
+            run_id=data["run_id"],
+            prompt=data.get("prompt", ""),
+            steps=[PlanStep.from_dict(step) for step in data["steps"]],
+            next_step=data.get("next_step", 0),
+            plan_complete=data.get("plan_complete", True),
+            url=data.get("url", ""),
+            cookies=data.get("cookies", []),
+            execution_log=data.get("execution_log", []),
+            status=data.get("status", "running"),
+            created_at=data.get("created_at", 0),
+            updated_at=data.get("updated_at", 0)
+        )
+
+
+class CheckpointStore:
+    """
+    Checkpoints of task runs under the config directory, one JSON file per run.
+
+    Files are replaced atomically so a run killed mid-write leaves the previous
+    checkpoint intact, and are readable only by the owner since they hold cookies.
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else config.get_config_dir() / "runs"
+        self._lock = threading.Lock()
+
+    def _path(self, run_id: str) -> Path:
+        return self.root / f"{run_id}.json"
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        """Persist a checkpoint, replacing the previous one of the same run."""
+        checkpoint.updated_at = time.time()
+        path = self._path(checkpoint.run_id)
+        with self._lock:
+            try:
+                self.root.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(".tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(checkpoint.to_dict(), f)
+                tmp_path.chmod(0o600)
+                tmp_path.replace(path)
+            except Exception as e:
+                console.print(f"[yellow]Warning: Could not save checkpoint: {e}[/yellow]")
+
+    def get(self, run_id: str) -> Optional[Checkpoint]:
+        """Load the checkpoint of a run, or None if it does not exist."""
+        path = self._path(run_id)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return Checkpoint.from_dict(json.load(f))
+        except Exception as e:
+            console.print(f"[bold red]Error loading checkpoint '{run_id}': {e}[/bold red]")
+            return None
+
+    def list(self) -> List[Checkpoint]:
+        """All stored checkpoints, most recently updated first."""
+        checkpoints = []
+        if self.root.exists():
+            for path in self.root.glob("*.json"):
+                checkpoint = self.get(path.stem)
+                if checkpoint:
+                    checkpoints.append(checkpoint)
+        return sorted(checkpoints, key=lambda checkpoint: checkpoint.updated_at, reverse=True)
+
+    def delete(self, run_id: str) -> bool:
+        """Delete the checkpoint of a run. Returns False if it does not exist."""
+        path = self._path(run_id)
+        if not path.exists():
+            return False
+        path.unlink()
+        return True
@@ -19,19 +19,60 @@ class Config:
         "llm": {
             "provider": "ollama",  # 'ollama', 'llama_cpp', or 'openai'
             "model": "mistral",    # Default model name
+            "host": None,          # Server address; None uses the provider default
+            "keep_alive": "30m",   # How long the server keeps the model loaded after a request
+            "warm_up_on_start": True, # Preload the model in the background when a session starts
+            "model_path": "",      # GGUF file for llama_cpp; defaults to the model name
+            "n_ctx": 4096,         # llama_cpp context window in tokens
+            "n_threads": None,     # llama_cpp CPU threads; None lets llama.cpp decide
+            "prompt_cache_mb": 512, # llama_cpp RAM cache for reusing prompt-prefix KV state
+            "use_mlock": False,    # Pin llama_cpp weights in RAM
+            "max_history_tokens": 4096, # Token bound for LLM.conversation_history
             "api_key": "",        # Only used for API-based providers
+            "base_url": "https://api.openai.com/v1", # OpenAI-compatible server root (vLLM, LM Studio, ...)
+            "connect_timeout": 5,  # Seconds to establish an HTTP connection
+            "read_timeout": 60,    # Seconds to wait between bytes of an HTTP response
+            "max_retries": 3,      # Retries on 429/5xx and connection errors
             "temperature": 0.7,    # Creativity level (0.0 to 1.0)
-            "max_tokens": 1000     # Maximum response length
+            "max_tokens": 1000,    # Maximum response length
+            "max_concurrency": 4,  # Simultaneous requests made by AsyncLLM
+            "request_timeout": 120 # Total per-request timeout in seconds, retries included
+        },
+        "cache": {
+            "enabled": True,       # Cache LLM responses on disk
+            "ttl_seconds": 86400,  # Time-to-live for cached responses
+            "max_entries": 2000,   # Least recently used entries beyond this are evicted
+            "max_plans": 500,      # Maximum number of cached task plans
+            "selectors": True,     # Reuse element resolutions learned from past runs
+            "max_selectors": 2000, # Maximum number of cached selector resolutions
+            "model_check_ttl": 300 # Seconds a successful model availability check is trusted
         },
         "browser": {
             "headless": False,     # Run browser in headless mode
             "stealth_mode": True,  # Use stealth mode to avoid detection
             "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36"
         },
+        "pool": {
+            "enabled": False,      # Check browsers out of the pool even before 'seif pool start'
+            "size": 2,             # Pre-launched browsers kept ready
+            "max_tasks": 20,       # Tasks a pooled browser serves before it is replaced
+            "max_rss_mb": 1500,    # Memory of a pooled browser, children included, above which it is replaced
+            "start_timeout": 20,   # Seconds to wait for a launched browser to accept connections
+            "chrome_path": ""      # Chrome executable; found on the PATH or in standard locations if empty
+        },
         "security": {
             "confirm_actions": True,  # Ask for confirmation before sensitive actions
             "safe_browsing": True     # Enable safe browsing checks
         },
+        "memory": {
+            "max_context_tokens": 2048 # Token budget for conversation context sent to the LLM
+        },
+        "chat": {
+            "continue_context": True # Reuse Ollama's context state so each turn only prefills the new message
+        },
+        "planner": {
+            "fast_path": True      # Plan simple commands like "go to github.com" with rules instead of the LLM
+        },
         "skills": {
             "custom_skills_path": ""  # Path to custom skills directory
         },
@@ -63,6 +104,15 @@ class Config:
         config_dir.mkdir(parents=True, exist_ok=True)
         return config_dir
         
+    def get_config_dir(self) -> Path:
+        """
+        Get the configuration directory path.
+        
+        Returns:
+            The directory holding the config file, caches and saved state
+        """
+        return self.config_dir
+        
     def _load_config(self) -> dict:
         """
         Load configuration from file or create default if not exists.
@@ -173,7 +223,9 @@ class Config:
         
         
         api_key = ""
+        base_url = self.config["llm"].get("base_url", "https://api.openai.com/v1")
         if provider == "openai":
+            base_url = Prompt.ask("API base URL", default=base_url)
             api_key = Prompt.ask("API Key", default=self.config["llm"]["api_key"], password=True)
             
         
@@ -196,6 +248,7 @@ class Config:
         self.set("llm", "provider", provider)
         self.set("llm", "model", model)
         if provider == "openai":
+            self.set("llm", "base_url", base_url)
             self.set("llm", "api_key", api_key)
         self.set("browser", "headless", headless)
         self.set("security", "confirm_actions", confirm_actions)
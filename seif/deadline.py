@@ -0,0 +1,77 @@
+# seifcli/seif/deadline.py
+
+import re
+import time
+from typing import Optional
+
+_DURATION = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(ms|s|sec|secs|seconds?|m|min|mins|minutes?|h|hours?)?\s*$", re.IGNORECASE)
+
+_UNIT_SECONDS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when an operation is not started or not finished before its deadline."""
+
+
+def parse_duration(text: str) -> float:
+    """
+    Parse a duration such as "30s", "2m", "1.5h", "500ms" or a bare number of seconds.
+
+    Raises:
+        ValueError: If the text is not a positive duration
+    """
+    m = _DURATION.match(text)
+    if not m:
+        raise ValueError(f"Invalid duration '{text}'. Use e.g. 30s, 2m or 1h")
+    unit = (m.group(2) or "s").lower()
+    seconds = float(m.group(1)) * _UNIT_SECONDS["ms" if unit == "ms" else unit[0]]
+    if seconds <= 0:
+        raise ValueError(f"Duration must be positive: '{text}'")
+    return seconds
+
+
+class Deadline:
+    """
+    A point in time by which work must finish.
+
+    Timeouts passed to waits and requests are derived from the time remaining,
+    so they shrink as the budget runs out. Based on the monotonic clock.
+    """
+
+    def __init__(self, seconds: float, parent: Optional["Deadline"] = None):
+        """
+        Args:
+            seconds: Budget from now
+            parent: Optional enclosing deadline; this deadline never ends after it
+        """
+        self.seconds = seconds
+        self.started = time.monotonic()
+        self.expires_at = self.started + seconds
+        if parent is not None:
+            self.expires_at = min(self.expires_at, parent.expires_at)
+
+    def child(self, seconds: float) -> "Deadline":
+        """A deadline at most seconds from now that also respects this one."""
+        return Deadline(seconds, parent=self)
+
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def timeout(self, default: float) -> float:
+        """The smaller of a default timeout and the time remaining."""
+        return min(default, self.remaining())
+
+    def check(self, what: str = "operation") -> None:
+        """
+        Raises:
+            DeadlineExceeded: If the deadline has passed
+        """
+        if self.expired():
+            raise DeadlineExceeded(f"Deadline exceeded before {what}")
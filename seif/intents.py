@@ -0,0 +1,193 @@
+# seifcli/seif/intents.py
+
+import json
+import re
+import shlex
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from rich.console import Console
+
+from .config import config
+from .plan import PlanStep, command_signatures
+
+console = Console()
+
+# Separators between clauses of a compound command, e.g. "go to x.com and scroll down"
+CLAUSE_SEPARATOR = re.compile(r"\s*(?:,?\s*\band then\b|,?\s*\bthen\b|,?\s*\band\b|;|,)\s*", re.IGNORECASE)
+
+URL = r"(?P<url>(?:https?://)?[\w-]+(?:\.[\w-]+)+(?:[/?#:]\S*)?)"
+
+# Top-level domains accepted in addresses written without a scheme or "www.".
+# Country codes that double as common file extensions (md, py, sh, rs, pl, ...)
+# are left out, so "open notes.md" goes to the planner instead of the browser.
+WEB_TLDS = {
+    "com", "org", "net", "edu", "gov", "mil", "int", "io", "ai", "dev", "app", "co", "me", "tv",
+    "info", "biz", "xyz", "tech", "site", "online", "blog", "news", "cloud", "store", "shop",
+    "uk", "us", "ca", "au", "nz", "ie", "de", "fr", "es", "it", "nl", "be", "ch", "at", "se",
+    "no", "dk", "fi", "pt", "gr", "cz", "ro", "hu", "ua", "ru", "tr", "il", "jp", "cn", "kr",
+    "tw", "hk", "sg", "in", "id", "th", "vn", "br", "ar", "mx", "cl", "za", "eg", "ma", "tn", "eu",
+}
+
+
+def is_web_address(url: str) -> bool:
+    """Whether text names a web page: it has a scheme, starts with www. or ends in a known TLD."""
+    if re.match(r"https?://", url, re.IGNORECASE):
+        return True
+    host = re.split(r"[/?#:]", url, maxsplit=1)[0].lower()
+    return host.startswith("www.") or host.rsplit(".", 1)[-1] in WEB_TLDS
+
+# Phrasings of the built-in commands and common skills. Each pattern maps a whole
+# clause to a builder returning the step for the match, or None to reject it.
+PHRASES = [
+    (r"(?:go to|goto|open|navigate to|visit|browse to|load)\s+(?:the\s+)?(?:site\s+|page\s+)?" + URL,
+     lambda m: PlanStep("GOTO", [m.group("url")]) if is_web_address(m.group("url")) else None),
+    (r"scroll\s+(?:the\s+page\s+)?(?P<direction>up|down)(?:\s+(?:by\s+)?(?P<amount>\d+)\s*(?:px|pixels)?)?",
+     lambda m: PlanStep("SCROLL", [m.group("direction").lower()] + ([m.group("amount")] if m.group("amount") else []))),
+    (r"scroll\s+(?:to\s+)?(?:the\s+)?(?P<direction>top|bottom)(?:\s+of\s+the\s+page)?",
+     lambda m: PlanStep("SCROLL", [m.group("direction").lower()])),
+    (r"(?:take|capture|grab|save)\s+(?:a\s+)?screenshot(?:\s+(?:called|named|as|to)\s+(?P<filename>\S+))?",
+     lambda m: PlanStep("SCREENSHOT", [m.group("filename") or "screenshot.png"])),
+]
+
+_LEADING_FILLER = re.compile(r"^(?:please\s+|can you\s+|could you\s+)", re.IGNORECASE)
+
+
+class IntentMatcher:
+    """
+    Rule-based fast path that turns simple commands into plans without the LLM.
+
+    The input is split into clauses, and every clause must match either one
+    of the compiled phrasings or a command written exactly as the planner
+    would emit it, with the right number of arguments, e.g.
+    'EXTRACT_LINKS a.title links.json'. If any clause is not recognized the
+    whole input is left to the planner.
+    """
+
+    def __init__(self, skills: Optional[Dict[str, Callable]] = None):
+        self.signatures = command_signatures(skills)
+        self.phrases = [
+            (re.compile(pattern + r"$", re.IGNORECASE), build)
+            for pattern, build in PHRASES
+        ]
+        # Commands invoked by name; case-sensitive so prose such as
+        # "click the login button" is never mistaken for a CLICK step
+        names = sorted(self.signatures, key=len, reverse=True)
+        self.by_name = re.compile(
+            r"(?P<name>" + "|".join(re.escape(name) for name in names) + r")(?:\s+(?P<args>.+))?$"
+        )
+
+    def match(self, text: str) -> Optional[List[PlanStep]]:
+        """
+        Build a plan for a command if every part of it is recognized.
+
+        Args:
+            text: The natural language command
+
+        Returns:
+            The plan ending with DONE, or None if the planner is needed
+        """
+        text = _LEADING_FILLER.sub("", text.strip().rstrip(".!"))
+        clauses = [clause for clause in CLAUSE_SEPARATOR.split(text) if clause]
+        if not clauses:
+            return None
+
+        steps = []
+        for clause in clauses:
+            step = self._match_clause(clause)
+            if step is None:
+                return None
+            if step.command != "DONE":
+                steps.append(step)
+
+        return steps + [PlanStep("DONE")] if steps else None
+
+    def _match_clause(self, clause: str) -> Optional[PlanStep]:
+        for pattern, build in self.phrases:
+            m = pattern.match(clause)
+            if m:
+                step = build(m)
+                return step if step is not None and step.command in self.signatures else None
+
+        m = self.by_name.match(clause)
+        if not m:
+            return None
+        command = m.group("name")
+        try:
+            args = shlex.split(m.group("args") or "")
+        except ValueError:
+            return None
+        signature = self.signatures[command]
+        if not len(signature.required) <= len(args) <= len(signature.required) + len(signature.optional):
+            return None
+        return PlanStep(command, args)
+
+
+class IntentStats:
+    """
+    Persistent fast path counters, used to report the hit rate and the
+    planning time saved. Savings are estimated from the average time the
+    planner took on inputs the fast path did not recognize.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else config.get_config_dir() / "cache" / "intents.json"
+        self._lock = threading.Lock()
+        self.counters = self._load()
+
+    def _load(self) -> Dict[str, float]:
+        """Load the counters from disk."""
+        counters = {"hits": 0, "misses": 0, "planner_runs": 0, "planner_seconds": 0.0}
+        if self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    counters.update(json.load(f))
+            except Exception:
+                pass
+        return counters
+
+    def _save(self) -> None:
+        """Persist the counters to disk. Caller must hold the lock."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.counters, f, indent=2)
+            tmp_path.replace(self.path)
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not save fast path statistics: {e}[/yellow]")
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self.counters["hits"] += 1
+            self._save()
+
+    def record_miss(self, planning_seconds: Optional[float] = None) -> None:
+        """Record an input that went to the planner, with the time planning took."""
+        with self._lock:
+            self.counters["misses"] += 1
+            if planning_seconds is not None:
+                self.counters["planner_runs"] += 1
+                self.counters["planner_seconds"] += planning_seconds
+            self._save()
+
+    def average_planning(self) -> Optional[float]:
+        """Average planner latency, or None before the planner has run."""
+        runs = self.counters["planner_runs"]
+        return self.counters["planner_seconds"] / runs if runs else None
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """
+        Returns:
+            Dictionary with hits, misses, hit_rate, average_planning and estimated_saved
+        """
+        hits, misses = self.counters["hits"], self.counters["misses"]
+        total = hits + misses
+        average = self.average_planning()
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else None,
+            "average_planning": average,
+            "estimated_saved": hits * average if average is not None else None
+        }
@@ -0,0 +1,101 @@
+# seifcli/seif/llama_cpp_backend.py
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from rich.console import Console
+
+console = Console()
+
+class LlamaCppBackend:
+    """
+    In-process llama.cpp model kept resident for the lifetime of the process.
+    
+    The GGUF weights are memory-mapped rather than copied into RAM, so loading is
+    cheap and the pages are shared with any other process mapping the same file.
+    
+    Prompt-prefix reuse happens at two levels:
+    - llama.cpp keeps the KV cache of the previous call and only evaluates the
+      tokens after the longest common prefix, so consecutive requests with the
+      same system prompt skip re-evaluating it.
+    - A RAM prompt cache stores KV states keyed by token prefix, so alternating
+      between prompts (planner vs. chat system prompt) restores the matching
+      prefix instead of starting over.
+    """
+    
+    def __init__(self, model_path: str, n_ctx: int = 4096, n_threads: Optional[int] = None,
+                 prompt_cache_mb: int = 512, use_mlock: bool = False):
+        """
+        Load a GGUF model.
+        
+        Args:
+            model_path: Path to the GGUF file
+            n_ctx: Context window size in tokens
+            n_threads: Number of CPU threads; None lets llama.cpp decide
+            prompt_cache_mb: Size of the prefix KV-state cache, 0 disables it
+            use_mlock: Pin the mapped weights in RAM so they are never paged out
+        
+        Raises:
+            ImportError: If llama-cpp-python is not installed
+            FileNotFoundError: If the model file does not exist
+        """
+        from llama_cpp import Llama, LlamaRAMCache
+        
+        path = Path(os.path.expanduser(model_path))
+        if not path.is_file():
+            raise FileNotFoundError(f"GGUF model not found: {path}")
+        
+        self.model_path = str(path)
+        self._lock = threading.Lock()
+        
+        started = time.perf_counter()
+        with console.status(f"[bold green]Loading {path.name}...[/bold green]", spinner="dots"):
+            self.llama = Llama(
+                model_path=self.model_path,
+                n_ctx=n_ctx,
+                n_threads=n_threads,
+                use_mmap=True,
+                use_mlock=use_mlock,
+                verbose=False
+            )
+            if prompt_cache_mb:
+                self.llama.set_cache(LlamaRAMCache(capacity_bytes=prompt_cache_mb * 1024 * 1024))
+        self.load_time = time.perf_counter() - started
+        console.print(f"[green]Loaded {path.name} in {self.load_time:.2f}s[/green]")
+    
+    def complete(self, messages: List[Dict[str, str]], temperature: float, max_tokens: int,
+                 response_format: Optional[Dict] = None) -> Dict:
+        """
+        Run a blocking chat completion.
+        
+        Returns:
+            The OpenAI-style completion response
+        """
+        with self._lock:
+            return self.llama.create_chat_completion(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format=response_format
+            )
+    
+    def stream(self, messages: List[Dict[str, str]], temperature: float, max_tokens: int,
+               response_format: Optional[Dict] = None) -> Iterator[str]:
+        """
+        Run a chat completion, yielding content tokens as they are sampled.
+        """
+        with self._lock:
+            for chunk in self.llama.create_chat_completion(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format=response_format,
+                stream=True
+            ):
+                yield chunk["choices"][0].get("delta", {}).get("content") or ""
+    
+    def tokenize(self, text: str) -> List[int]:
+        """Tokenize text with the model's own tokenizer."""
+        return self.llama.tokenize(text.encode("utf-8"), add_bos=False, special=True)
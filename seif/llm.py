@@ -1,16 +1,380 @@
 import ollama
+import asyncio
 from rich.console import Console
 from rich.status import Status
 from rich.prompt import Prompt
 import json
 import os
+import hashlib
+import sqlite3
+import threading
+import queue
 from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 import time
 
 from .config import config
+from . import registry
+from .tokens import approximate_tokens, message_tokens, tiktoken_counter
+from .deadline import Deadline, DeadlineExceeded
 
 console = Console()
 
+
+def _raise_if_expired(deadline: Optional[Deadline], error: Exception) -> None:
+    """Report a provider error caused by the deadline running out as DeadlineExceeded."""
+    if deadline is not None and deadline.expired():
+        raise DeadlineExceeded(f"Deadline exceeded during the LLM request: {error}") from error
+
+
+# Marks the end of a stream relayed by _iterate_within
+_STREAM_END = object()
+
+
+def _iterate_within(make_stream: Callable[[], Iterator], deadline: Deadline) -> Iterator:
+    """
+    Iterates a blocking stream on a worker thread, waiting for each item no
+    longer than the deadline allows.
+
+    The shared Ollama client has no per-request timeout, so a stalled server
+    would otherwise block the caller past its deadline. The worker is
+    abandoned when the deadline passes and stops once its call returns.
+
+    Raises:
+        DeadlineExceeded: If the deadline passes before the stream ends
+    """
+    items = queue.Queue()
+    abandoned = threading.Event()
+
+    def _run():
+        try:
+            stream = make_stream()
+            try:
+                for item in stream:
+                    if abandoned.is_set():
+                        return
+                    items.put((item, None))
+            finally:
+                if hasattr(stream, "close"):
+                    stream.close()
+        except Exception as e:
+            items.put((None, e))
+        items.put((_STREAM_END, None))
+
+    threading.Thread(target=_run, name="llm-request", daemon=True).start()
+    try:
+        while True:
+            try:
+                item, error = items.get(timeout=deadline.remaining())
+            except queue.Empty:
+                raise DeadlineExceeded("Deadline exceeded during the LLM request") from None
+            if error is not None:
+                raise error
+            if item is _STREAM_END:
+                return
+            yield item
+    finally:
+        abandoned.set()
+
+
+class LLMError(Exception):
+    """Raised when the configured provider cannot serve a request."""
+
+
+class ResponseCache:
+    """
+    Persistent cache of LLM responses backed by SQLite.
+    
+    Entries expire after a TTL and the cache is bounded to a maximum number of
+    entries, evicting the least recently used ones first. Concurrent identical
+    requests within the process are coalesced so only one generation runs;
+    a request waits at most coalesce_timeout seconds for another to finish.
+    """
+
+    def __init__(self, path: Path, ttl: float = 86400, max_entries: int = 2000,
+                 coalesce_timeout: float = 120):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.coalesce_timeout = coalesce_timeout
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        # Key -> (event set when the generation ends, id of the thread running it)
+        self._inflight: Dict[str, Tuple[threading.Event, int]] = {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "created_at REAL NOT NULL, last_access REAL NOT NULL, hits INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(provider: str, model: str, messages: list, temperature: float, num_predict: int, **extra) -> str:
+        """
+        Hashes the parameters that determine a response into a cache key.
+        """
+        payload = json.dumps(
+            {
+                "provider": provider,
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "num_predict": num_predict,
+                **extra
+            },
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _read(self, key: str) -> Optional[str]:
+        """
+        Reads an entry, dropping it if it has expired. Caller must hold the lock.
+        """
+        row = self._conn.execute(
+            "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        now = time.time()
+        if self.ttl and row[1] + self.ttl < now:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+            return None
+
+        self._conn.execute(
+            "UPDATE responses SET last_access = ?, hits = hits + 1 WHERE key = ?", (now, key)
+        )
+        self._conn.commit()
+        return row[0]
+
+    def _write(self, key: str, value: str) -> None:
+        """
+        Stores an entry and enforces the size bound. Caller must hold the lock.
+        """
+        now = time.time()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, value, created_at, last_access, hits) VALUES (?, ?, ?, ?, 0)",
+            (key, value, now, now)
+        )
+        if self.ttl:
+            self._conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl,))
+        self._conn.execute(
+            "DELETE FROM responses WHERE key IN ("
+            "SELECT key FROM responses ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+        self._conn.commit()
+
+    def acquire(self, key: str) -> Tuple[Optional[str], bool]:
+        """
+        Looks up a key, waiting for an identical in-flight request to finish first.
+        
+        The wait lasts at most coalesce_timeout, and is skipped when the
+        in-flight request was started by the calling thread, for instance a
+        stream it has not finished reading, which it would wait on forever.
+        
+        Returns:
+            (value, False) on a hit, (None, True) when the caller must generate
+            the response and then call release() with the result, or
+            (None, False) when it must generate the response without
+            calling release() because the wait was skipped or timed out.
+        """
+        ends_at = time.monotonic() + self.coalesce_timeout
+        while True:
+            with self._lock:
+                value = self._read(key)
+                if value is not None:
+                    self.hits += 1
+                    return value, False
+
+                inflight = self._inflight.get(key)
+                if inflight is None:
+                    self._inflight[key] = (threading.Event(), threading.get_ident())
+                    self.misses += 1
+                    return None, True
+
+                event, owner = inflight
+                remaining = ends_at - time.monotonic()
+                if owner == threading.get_ident() or remaining <= 0:
+                    self.misses += 1
+                    return None, False
+
+                self.coalesced += 1
+            event.wait(remaining)
+
+    def release(self, key: str, value: Optional[str] = None) -> None:
+        """
+        Finishes a generation claimed by acquire(), storing the value if one was produced.
+        """
+        with self._lock:
+            if value is not None:
+                self._write(key, value)
+            inflight = self._inflight.pop(key, None)
+        if inflight:
+            inflight[0].set()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Non-blocking lookup that ignores in-flight requests.
+        """
+        with self._lock:
+            value = self._read(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        """
+        Stores a value without going through acquire()/release().
+        """
+        with self._lock:
+            self._write(key, value)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Removes an entry from the cache.
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache.
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns process-local hit/miss counters alongside on-disk totals.
+        """
+        with self._lock:
+            entries, stored_hits = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(hits), 0) FROM responses"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "entries": entries,
+            "lifetime_hits": stored_hits
+        }
+
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Returns the process-wide response cache, or None if caching is disabled or unavailable.
+    """
+    global _response_cache
+    if not config.get("cache", "enabled", True):
+        return None
+
+    with _response_cache_lock:
+        if _response_cache is None:
+            try:
+                _response_cache = ResponseCache(
+                    config.get_config_dir() / "cache" / "llm_responses.sqlite3",
+                    ttl=config.get("cache", "ttl_seconds", 86400),
+                    max_entries=config.get("cache", "max_entries", 2000),
+                    coalesce_timeout=config.get("llm", "request_timeout", 120)
+                )
+            except Exception as e:
+                console.print(f"[yellow]Response cache unavailable: {e}[/yellow]")
+                config.config.setdefault("cache", {})["enabled"] = False
+                return None
+        return _response_cache
+
+
+_warmup_state: Dict[str, Dict] = {}
+_warmup_threads: Dict[str, threading.Thread] = {}
+
+
+def start_background_warmup(model: Optional[str] = None) -> Optional[threading.Thread]:
+    """
+    Preloads a model on a daemon thread so startup work can overlap the model load.
+    
+    Calling this again for a model that is already warming up is a no-op.
+    
+    Args:
+        model: Model name; defaults to the configured model
+        
+    Returns:
+        The warm-up thread, or None if warm-up is not applicable
+    """
+    model = model or config.get("llm", "model", "mistral")
+    if config.get("llm", "provider", "ollama") not in ("ollama", "llama_cpp"):
+        return None
+    if model in _warmup_threads:
+        return _warmup_threads[model]
+
+    def _run():
+        try:
+            LLM(model=model).warm_up()
+        except Exception:
+            pass
+
+    thread = threading.Thread(target=_run, name=f"warmup-{model}", daemon=True)
+    _warmup_threads[model] = thread
+    thread.start()
+    return thread
+
+
+def _warmup_state_path() -> Path:
+    return config.get_config_dir() / "cache" / "warmup.json"
+
+
+def _load_warmup_states() -> Dict[str, Dict]:
+    try:
+        with open(_warmup_state_path(), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _record_warmup(model: str, load_time: float, wall_time: float) -> None:
+    """
+    Keeps the result of a warm-up in this process and in the config directory,
+    so later commands such as `model status` can report it.
+    """
+    state = {"load_time": load_time, "wall_time": wall_time, "warmed_at": time.time()}
+    _warmup_state[model] = state
+    try:
+        path = _warmup_state_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        states = _load_warmup_states()
+        states[model] = state
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(states, f, indent=2)
+        tmp_path.replace(path)
+    except Exception as e:
+        console.print(f"[yellow]Warning: Could not save warm-up state: {e}[/yellow]")
+
+
+def get_warmup_state(model: Optional[str] = None) -> Optional[Dict]:
+    """
+    Returns the load/wall times and time of the last warm-up of a model, if any,
+    whether it ran in this process or an earlier one.
+    """
+    model = model or config.get("llm", "model", "mistral")
+    return _warmup_state.get(model) or _load_warmup_states().get(model)
+
+
 class LLM:
     def __init__(self, model=None):
         """
@@ -22,10 +386,17 @@ class LLM:
         self.provider = config.get("llm", "provider", "ollama")
         self.temperature = config.get("llm", "temperature", 0.7)
         self.max_tokens = config.get("llm", "max_tokens", 1000)
+        self.host = config.get("llm", "host", None)
+        self.keep_alive = config.get("llm", "keep_alive", "30m")
         
- 
-        self.conversation_history = []
+        self.max_history_tokens = config.get("llm", "max_history_tokens", 4096)
         
+        self.conversation_history = []
+        self._history_tokens = []
+        self._tokenizer = None
+        self._continuation = None
+        self._last_usage = {}
+        self.last_stats = {}
         
         self._initialize_client()
         
@@ -50,7 +421,7 @@ class LLM:
         Initialize the Ollama client.
         """
         try:
-            self.client = ollama.Client()
+            self.client = registry.get_client("ollama", self.host)
             self._check_model_availability()
         except Exception as e:
             console.print(f"[bold red]Error initializing Ollama client: {e}[/bold red]")
@@ -59,45 +430,70 @@ class LLM:
     
     def _initialize_llama_cpp(self):
         """
-        Initialize the llama.cpp client.
-        This is a placeholder for future implementation.
+        Initialize the in-process llama.cpp backend.
+        The model is loaded once per process and shared by every LLM instance.
         """
+        model_path = config.get("llm", "model_path", "") or self.model
         try:
-           
-            console.print("[yellow]llama.cpp support is not yet implemented.[/yellow]")
-            console.print("[yellow]Falling back to Ollama...[/yellow]")
-            self.provider = "ollama"
-            self._initialize_ollama()
+            from .llama_cpp_backend import LlamaCppBackend
+            
+            self.client = registry.get_client(
+                "llama_cpp",
+                model_path,
+                factory=lambda: LlamaCppBackend(
+                    model_path,
+                    n_ctx=config.get("llm", "n_ctx", 4096),
+                    n_threads=config.get("llm", "n_threads", None),
+                    prompt_cache_mb=config.get("llm", "prompt_cache_mb", 512),
+                    use_mlock=config.get("llm", "use_mlock", False)
+                )
+            )
         except ImportError:
             console.print("[bold red]llama-cpp-python is not installed.[/bold red]")
             console.print("[yellow]Install with: pip install llama-cpp-python[/yellow]")
             console.print("[yellow]Falling back to Ollama...[/yellow]")
             self.provider = "ollama"
             self._initialize_ollama()
+        except Exception as e:
+            console.print(f"[bold red]Error loading llama.cpp model '{model_path}': {e}[/bold red]")
+            console.print("[yellow]Falling back to Ollama...[/yellow]")
+            self.provider = "ollama"
+            self._initialize_ollama()
     
     def _initialize_openai(self):
         """
-        Initialize the OpenAI client.
-        This is a placeholder for future implementation.
+        Initialize the OpenAI-compatible HTTP client.
+        Works with the OpenAI API and with local servers such as vLLM,
+        llama.cpp server or LM Studio via `llm.base_url`.
         """
+        base_url = config.get("llm", "base_url", "https://api.openai.com/v1")
+        api_key = config.get("llm", "api_key", "") or os.environ.get("OPENAI_API_KEY", "")
         try:
-            
-            api_key = config.get("llm", "api_key", "")
-            if not api_key:
+            if not api_key and "api.openai.com" in base_url:
                 console.print("[bold red]OpenAI API key not configured.[/bold red]")
                 console.print("[yellow]Falling back to Ollama...[/yellow]")
                 self.provider = "ollama"
                 self._initialize_ollama()
                 return
-                
             
-            console.print("[yellow]OpenAI support is not yet implemented.[/yellow]")
-            console.print("[yellow]Falling back to Ollama...[/yellow]")
-            self.provider = "ollama"
-            self._initialize_ollama()
+            from .openai_backend import OpenAICompatBackend
+            
+            self.client = registry.get_client(
+                "openai",
+                base_url,
+                factory=lambda: OpenAICompatBackend(
+                    base_url,
+                    api_key=api_key,
+                    connect_timeout=config.get("llm", "connect_timeout", 5),
+                    read_timeout=config.get("llm", "read_timeout", 60),
+                    total_timeout=config.get("llm", "request_timeout", 120),
+                    max_retries=config.get("llm", "max_retries", 3),
+                    pool_size=config.get("llm", "max_concurrency", 4)
+                )
+            )
         except ImportError:
-            console.print("[bold red]openai package is not installed.[/bold red]")
-            console.print("[yellow]Install with: pip install openai[/yellow]")
+            console.print("[bold red]requests package is not installed.[/bold red]")
+            console.print("[yellow]Install with: pip install requests[/yellow]")
             console.print("[yellow]Falling back to Ollama...[/yellow]")
             self.provider = "ollama"
             self._initialize_ollama()
@@ -108,9 +504,17 @@ class LLM:
         """
         if not self.client or self.provider != "ollama":
             return
+        availability = registry.get_model_availability()
+        if availability.is_available(self.provider, self.host, self.model):
+            return
         try:
             models = self.client.list()["models"]
-            if not any(m.get('name', '').startswith(self.model) for m in models):
+            for m in models:
+                if m.get('name'):
+                    availability.mark(self.provider, self.host, m['name'])
+            if any(m.get('name', '').startswith(self.model) for m in models):
+                availability.mark(self.provider, self.host, self.model)
+            else:
                 console.print(f"[bold yellow]Warning: Model '{self.model}' not found. Attempting to pull it...[/bold yellow]")
                 self._pull_model()
         except Exception as e:
@@ -125,12 +529,60 @@ class LLM:
             
         try:
             with console.status(f"[bold green]Pulling model '{self.model}'...[/bold green]", spinner="dots") as status:
-                ollama.pull(self.model)
+                self.client.pull(self.model)
+            registry.get_model_availability().mark(self.provider, self.host, self.model)
             console.print(f"[bold green]Model '{self.model}' pulled successfully.[/bold green]")
         except Exception as e:
             console.print(f"[bold red]Failed to pull model '{self.model}': {e}[/bold red]")
 
-    def generate(self, prompt: str, system_prompt: str = None, with_history: bool = False) -> str:
+    def warm_up(self) -> Optional[float]:
+        """
+        Preloads the model into memory with an empty request.
+        
+        Returns:
+            The server-reported load time in seconds, or None if warm-up failed
+        """
+        if self.provider == "llama_cpp" and self.client:
+            # The model is loaded and kept resident when the backend is created
+            _record_warmup(self.model, self.client.load_time, self.client.load_time)
+            return self.client.load_time
+        if self.provider != "ollama" or not self.client:
+            return None
+        try:
+            started = time.perf_counter()
+            response = self.client.generate(model=self.model, prompt="", keep_alive=self.keep_alive)
+            wall_time = time.perf_counter() - started
+            load_time = response.get("load_duration", 0) / 1e9 if response.get("load_duration") else wall_time
+            _record_warmup(self.model, load_time, wall_time)
+            return load_time
+        except Exception as e:
+            console.print(f"[yellow]Model warm-up failed: {e}[/yellow]")
+            return None
+
+    def model_status(self) -> List[Dict]:
+        """
+        Lists the models currently loaded by the server.
+        
+        Returns:
+            One dictionary per loaded model with its name, memory size and expiry
+        """
+        if self.provider != "ollama" or not self.client:
+            return []
+        if hasattr(self.client, "ps"):
+            return list(self.client.ps().get("models", []))
+
+        import requests
+        base = self.host or os.environ.get("OLLAMA_HOST") or "http://127.0.0.1:11434"
+        if not base.startswith(("http://", "https://")):
+            base = "http://" + base
+        response = requests.get(f"{base.rstrip('/')}/api/ps", timeout=5)
+        response.raise_for_status()
+        return list(response.json().get("models", []))
+
+    def generate(self, prompt: str, system_prompt: str = None, with_history: bool = False,
+                 on_token: Optional[Callable[[str], None]] = None, use_cache: Optional[bool] = None,
+                 history: Optional[List[Dict[str, str]]] = None, json_schema: Optional[Dict] = None,
+                 deadline: Optional[Deadline] = None) -> str:
         """
         Generates a response from the LLM.
         
@@ -138,61 +590,528 @@ class LLM:
             prompt: The user prompt
             system_prompt: Optional system prompt
             with_history: Whether to include conversation history
+            history: Explicit prior messages to send instead of the internal
+                conversation history. The caller owns this history, so the
+                exchange is not recorded.
+            on_token: Optional callback invoked with each token as it is generated.
+                When given, the response is streamed instead of generated in one blocking call.
+            use_cache: Whether the response cache may be used; by default only
+                when sampling is deterministic (temperature 0), so sampled
+                replies are not replayed for identical prompts
+            json_schema: Optional JSON schema the response must conform to
+            deadline: Optional deadline for the request
             
         Returns:
             The generated response
+            
+        Raises:
+            DeadlineExceeded: If the deadline passes before the response is complete
+        """
+        if on_token is not None:
+            chunks = []
+            for token in self.generate_stream(prompt, system_prompt, with_history, use_cache=use_cache,
+                                              history=history, json_schema=json_schema, deadline=deadline):
+                chunks.append(token)
+                on_token(token)
+            return "".join(chunks)
+
+        messages = self._build_messages(prompt, system_prompt, with_history, history)
+        cache, key = self._cache_for(messages, use_cache, json_schema)
+        content = None
+        if cache:
+            content, leader = cache.acquire(key)
+            if content is not None:
+                self.last_stats = {"time_to_first_token": 0.0, "total_time": 0.0, "cached": True}
+
+        if content is None:
+            try:
+                if deadline:
+                    deadline.check("the LLM request")
+                content = self._complete(messages, json_schema, deadline)
+                if deadline:
+                    deadline.check("the LLM response completed")
+            except DeadlineExceeded:
+                raise
+            except LLMError as e:
+                _raise_if_expired(deadline, e)
+                return str(e)
+            except Exception as e:
+                _raise_if_expired(deadline, e)
+                console.print(f"[bold red]Error during model generation: {e}[/bold red]")
+                return "Error generating response."
+            finally:
+                if cache and leader:
+                    cache.release(key, content)
+
+        if with_history and history is None:
+            self._record_exchange(prompt, content)
+        return content
+
+    def generate_stream(self, prompt: str, system_prompt: str = None, with_history: bool = False,
+                        use_cache: Optional[bool] = None, history: Optional[List[Dict[str, str]]] = None,
+                        json_schema: Optional[Dict] = None, deadline: Optional[Deadline] = None) -> Iterator[str]:
+        """
+        Generates a response from the LLM, yielding tokens as they are produced.
+        
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt
+            with_history: Whether to include conversation history
+            use_cache: Whether the response cache may be used; by default only
+                when sampling is deterministic (temperature 0)
+            history: Explicit prior messages to send instead of the internal conversation history
+            json_schema: Optional JSON schema the response must conform to
+            deadline: Optional deadline; generation stops once it passes
+            
+        Yields:
+            Response tokens in generation order
+            
+        Raises:
+            DeadlineExceeded: If the deadline passes before the response is complete
+        """
+        messages = self._build_messages(prompt, system_prompt, with_history, history)
+        record = with_history and history is None
+        cache, key = self._cache_for(messages, use_cache, json_schema)
+        if cache:
+            cached, leader = cache.acquire(key)
+            if cached is not None:
+                self.last_stats = {"time_to_first_token": 0.0, "total_time": 0.0, "cached": True}
+                if record:
+                    self._record_exchange(prompt, cached)
+                yield cached
+                return
+
+        chunks = []
+        completed = False
+        started = time.perf_counter()
+        first_token_at = None
+        self._last_usage = {}
+
+        try:
+            if deadline:
+                deadline.check("the LLM request")
+            for token in self._stream(messages, json_schema, deadline):
+                if deadline:
+                    deadline.check("the LLM response completed")
+                if not token:
+                    continue
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                chunks.append(token)
+                yield token
+            completed = True
+        except DeadlineExceeded:
+            raise
+        except LLMError as e:
+            _raise_if_expired(deadline, e)
+            yield str(e)
+            return
+        except Exception as e:
+            _raise_if_expired(deadline, e)
+            console.print(f"[bold red]Error during model generation: {e}[/bold red]")
+            if not chunks:
+                yield "Error generating response."
+            return
+        finally:
+            finished = time.perf_counter()
+            self.last_stats = {
+                "time_to_first_token": (first_token_at or finished) - started,
+                "total_time": finished - started,
+                **self._last_usage
+            }
+            if cache and leader:
+                cache.release(key, "".join(chunks) if completed else None)
+
+        if record:
+            self._record_exchange(prompt, "".join(chunks))
+
+    def _complete(self, messages: list, json_schema: Optional[Dict] = None,
+                  deadline: Optional[Deadline] = None) -> str:
+        """
+        Runs a blocking completion against the configured provider.
+        
+        The deadline bounds the request for the Ollama and OpenAI-compatible
+        providers; callers check it around the call for llama.cpp.
+        
+        Raises:
+            LLMError: If the provider cannot serve the request
         """
         if self.provider == "ollama":
-            return self._generate_ollama(prompt, system_prompt, with_history)
+            return self._generate_ollama(messages, json_schema, deadline)
         elif self.provider == "llama_cpp":
-            return "llama.cpp support is not yet implemented."
+            return self._generate_llama_cpp(messages, json_schema)
         elif self.provider == "openai":
-            return "OpenAI support is not yet implemented."
+            return self._generate_openai(messages, json_schema, deadline)
         else:
-            return f"Unknown provider: {self.provider}"
+            raise LLMError(f"Unknown provider: {self.provider}")
 
-    def _generate_ollama(self, prompt: str, system_prompt: str = None, with_history: bool = False) -> str:
+    def _stream(self, messages: list, json_schema: Optional[Dict] = None,
+                deadline: Optional[Deadline] = None) -> Iterator[str]:
         """
-        Generates a response using Ollama.
+        Streams a completion from the configured provider.
+        
+        Raises:
+            LLMError: If the provider cannot serve the request
+        """
+        if self.provider == "ollama":
+            return self._generate_ollama_stream(messages, json_schema, deadline)
+        elif self.provider == "llama_cpp":
+            return self._generate_llama_cpp_stream(messages, json_schema)
+        elif self.provider == "openai":
+            return self._generate_openai_stream(messages, json_schema, deadline)
+        else:
+            raise LLMError(f"Unknown provider: {self.provider}")
+
+    def _build_messages(self, prompt: str, system_prompt: str = None, with_history: bool = False,
+                        history: Optional[List[Dict[str, str]]] = None) -> list:
+        """
+        Builds the chat message list for a request.
         """
-        if not self.client:
-            return "Ollama client not initialized."
-            
         messages = []
         
-        
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         
-        
-        if with_history and self.conversation_history:
+        if history is not None:
+            messages.extend(history)
+        elif with_history and self.conversation_history:
             messages.extend(self.conversation_history)
         
-        
         messages.append({"role": "user", "content": prompt})
+        return messages
 
-        try:
-            with console.status("[bold green]Generating response...[/bold green]", spinner="dots") as status:
-                response = self.client.chat(
-                    model=self.model,
-                    messages=messages,
-                    options={
-                        "temperature": self.temperature,
-                        "num_predict": self.max_tokens
-                    }
-                )
-            
-            content = response['message']['content']
-            
+    def _record_exchange(self, prompt: str, content: str) -> None:
+        """
+        Appends a completed prompt/response pair to the conversation history.
+        """
+        self.conversation_history.append({"role": "user", "content": prompt})
+        self.conversation_history.append({"role": "assistant", "content": content})
+        self._trim_history()
+
+    def count_tokens(self, text: str) -> int:
+        """
+        Counts tokens in text, using the model's real tokenizer when one is available
+        (llama.cpp, or tiktoken for OpenAI models) and a fast approximation otherwise.
+        """
+        if self._tokenizer is None:
+            if self.provider == "llama_cpp" and self.client:
+                self._tokenizer = lambda text: len(self.client.tokenize(text))
+            elif self.provider == "openai":
+                self._tokenizer = tiktoken_counter(self.model) or approximate_tokens
+            else:
+                self._tokenizer = approximate_tokens
+        return self._tokenizer(text) if text else 0
+
+    def _trim_history(self) -> None:
+        """
+        Drops the oldest history messages until the history fits in max_history_tokens.
+        Token counts are cached per message so each message is only counted once.
+        """
+        counts = self._history_tokens
+        if len(counts) > len(self.conversation_history):
+            del counts[:]
+        for message in self.conversation_history[len(counts):]:
+            counts.append(message_tokens(message["content"], self.count_tokens))
+
+        total = sum(counts)
+        drop = 0
+        while total > self.max_history_tokens and drop < len(counts) - 1:
+            total -= counts[drop]
+            drop += 1
+        if drop:
+            del self.conversation_history[:drop]
+            del counts[:drop]
+
+    def _cache_key(self, messages: list, json_schema: Optional[Dict] = None) -> str:
+        """
+        Computes the response cache key for a request.
+        """
+        extra = {"json_schema": json_schema} if json_schema else {}
+        return ResponseCache.make_key(
+            self.provider, self.model, messages, self.temperature, self.max_tokens, **extra
+        )
+
+    def _cache_for(self, messages: list, use_cache: Optional[bool], json_schema: Optional[Dict] = None):
+        """
+        Returns the response cache and key for a request, or (None, None) when caching is off.
+        
+        Unless use_cache says otherwise, only deterministic requests are cached.
+        """
+        if use_cache is None:
+            use_cache = self.temperature == 0
+        if not use_cache:
+            return None, None
+        cache = get_response_cache()
+        if cache is None:
+            return None, None
+        return cache, self._cache_key(messages, json_schema)
+
+    def invalidate_cache(self, prompt: str, system_prompt: str = None, with_history: bool = False,
+                         json_schema: Optional[Dict] = None) -> None:
+        """
+        Drops the cached response for a request, if any.
+        
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt
+            with_history: Whether the request included conversation history
+        """
+        cache = get_response_cache()
+        if cache:
+            cache.invalidate(self._cache_key(self._build_messages(prompt, system_prompt, with_history), json_schema))
+
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Returns the response cache counters for this process.
+        """
+        cache = get_response_cache()
+        return cache.stats() if cache else {}
+
+    def _generate_ollama(self, messages: list, json_schema: Optional[Dict] = None,
+                         deadline: Optional[Deadline] = None) -> str:
+        """
+        Generates a response using Ollama, giving up when the deadline passes.
+        """
+        if not self.client:
+            raise LLMError("Ollama client not initialized.")
+
+        def chat():
+            return self.client.chat(
+                model=self.model,
+                messages=messages,
+                format=json_schema or '',
+                options={
+                    "temperature": self.temperature,
+                    "num_predict": self.max_tokens
+                },
+                keep_alive=self.keep_alive
+            )
+
+        started = time.perf_counter()
+        with console.status("[bold green]Generating response...[/bold green]", spinner="dots") as status:
+            if deadline:
+                response = next(_iterate_within(lambda: iter([chat()]), deadline))
+            else:
+                response = chat()
+        elapsed = time.perf_counter() - started
+        self.last_stats = {"time_to_first_token": elapsed, "total_time": elapsed}
+        
+        return response['message']['content']
+
+    def _generate_ollama_stream(self, messages: list, json_schema: Optional[Dict] = None,
+                                deadline: Optional[Deadline] = None) -> Iterator[str]:
+        """
+        Streams a response from Ollama token by token, giving up when the deadline passes.
+        """
+        if not self.client:
+            raise LLMError("Ollama client not initialized.")
+
+        def chat():
+            return self.client.chat(
+                model=self.model,
+                messages=messages,
+                stream=True,
+                format=json_schema or '',
+                options={
+                    "temperature": self.temperature,
+                    "num_predict": self.max_tokens
+                },
+                keep_alive=self.keep_alive
+            )
+
+        stream = _iterate_within(chat, deadline) if deadline else chat()
+        for part in stream:
+            if part.get('done'):
+                self._last_usage = self._ollama_usage(part)
+            yield part.get('message', {}).get('content', '')
+
+    @staticmethod
+    def _ollama_usage(part: Dict) -> Dict:
+        """
+        Extracts token counts from the final chunk of an Ollama response.
+        """
+        return {
+            "prompt_eval_count": part.get("prompt_eval_count", 0),
+            "eval_count": part.get("eval_count", 0)
+        }
+
+    def supports_continuation(self) -> bool:
+        """
+        Whether this provider can continue a conversation from server-side context state.
+        """
+        return self.provider == "ollama" and self.client is not None
+
+    def reset_continuation(self) -> None:
+        """
+        Drops the server-side context state so the next turn resends the full history.
+        """
+        self._continuation = None
+
+    @staticmethod
+    def _render_transcript(history: List[Dict[str, str]], prompt: str) -> str:
+        """
+        Renders prior messages and the new prompt as one prompt for seeding a continuation.
+        """
+        if not history:
+            return prompt
+        names = {"user": "User", "assistant": "Assistant", "system": "System"}
+        lines = ["Conversation so far:"]
+        lines.extend(f"{names.get(m['role'], m['role'])}: {m['content']}" for m in history)
+        lines.append("")
+        lines.append(f"User: {prompt}")
+        return "\n".join(lines)
+
+    def continue_stream(self, prompt: str, system_prompt: str = None,
+                        history: Optional[List[Dict[str, str]]] = None) -> Iterator[str]:
+        """
+        Streams the next turn of a conversation, reusing the server-side context
+        returned by the previous turn so only the new prompt is prefilled.
+        
+        When there is no usable context (first turn, model change, system prompt
+        change, context grown past max_history_tokens, or reset_continuation()),
+        the turn is sent with the full history instead and its context is kept
+        for the next turn. Providers without context support always use the
+        full history.
+        
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt
+            history: The full prior conversation, used when the context is unusable
             
-            if with_history:
-                self.conversation_history.append({"role": "user", "content": prompt})
-                self.conversation_history.append({"role": "assistant", "content": content})
-                
-            return content
+        Yields:
+            Response tokens in generation order
+        """
+        if not self.supports_continuation():
+            yield from self.generate_stream(prompt, system_prompt, history=history or [], use_cache=False)
+            return
+
+        state = self._continuation
+        if state and (state["model"] != self.model or state["system"] != (system_prompt or "")
+                      or len(state["context"]) > self.max_history_tokens):
+            state = None
+        self._continuation = None
+
+        chunks = []
+        new_context = None
+        started = time.perf_counter()
+        first_token_at = None
+        usage = {}
+
+        try:
+            stream = self.client.generate(
+                model=self.model,
+                prompt=prompt if state else self._render_transcript(history or [], prompt),
+                system=system_prompt or "",
+                context=state["context"] if state else None,
+                stream=True,
+                options={
+                    "temperature": self.temperature,
+                    "num_predict": self.max_tokens
+                },
+                keep_alive=self.keep_alive
+            )
+            for part in stream:
+                if part.get("done"):
+                    new_context = part.get("context")
+                    usage = self._ollama_usage(part)
+                token = part.get("response", "")
+                if not token:
+                    continue
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                chunks.append(token)
+                yield token
         except Exception as e:
-            console.print(f"[bold red]Error during model generation: {e}[/bold red]")
-            return "Error generating response."
+            if chunks:
+                console.print(f"[bold red]Error during model generation: {e}[/bold red]")
+                return
+            console.print(f"[dim]Context continuation unavailable ({e}); resending full history.[/dim]")
+            yield from self.generate_stream(prompt, system_prompt, history=history or [], use_cache=False)
+            return
+        finally:
+            finished = time.perf_counter()
+            self.last_stats = {
+                "time_to_first_token": (first_token_at or finished) - started,
+                "total_time": finished - started,
+                "continued": bool(state),
+                **usage
+            }
+
+        if new_context:
+            self._continuation = {"model": self.model, "system": system_prompt or "", "context": new_context}
+
+    def _generate_llama_cpp(self, messages: list, json_schema: Optional[Dict] = None) -> str:
+        """
+        Generates a response using the in-process llama.cpp model.
+        """
+        if not self.client:
+            raise LLMError("llama.cpp model not loaded.")
+
+        started = time.perf_counter()
+        with console.status("[bold green]Generating response...[/bold green]", spinner="dots") as status:
+            response = self.client.complete(
+                messages, self.temperature, self.max_tokens,
+                response_format={"type": "json_object", "schema": json_schema} if json_schema else None
+            )
+        elapsed = time.perf_counter() - started
+        self.last_stats = {"time_to_first_token": elapsed, "total_time": elapsed}
+
+        return response["choices"][0]["message"]["content"]
+
+    def _generate_llama_cpp_stream(self, messages: list, json_schema: Optional[Dict] = None) -> Iterator[str]:
+        """
+        Streams a response from the in-process llama.cpp model token by token.
+        """
+        if not self.client:
+            raise LLMError("llama.cpp model not loaded.")
+
+        return self.client.stream(
+            messages, self.temperature, self.max_tokens,
+            response_format={"type": "json_object", "schema": json_schema} if json_schema else None
+        )
+
+    def _generate_openai(self, messages: list, json_schema: Optional[Dict] = None,
+                         deadline: Optional[Deadline] = None) -> str:
+        """
+        Generates a response using an OpenAI-compatible server.
+        """
+        if not self.client:
+            raise LLMError("OpenAI-compatible client not initialized.")
+
+        started = time.perf_counter()
+        with console.status("[bold green]Generating response...[/bold green]", spinner="dots") as status:
+            response = self.client.complete(
+                messages, self.model, self.temperature, self.max_tokens,
+                response_format=self._openai_response_format(json_schema),
+                timeout=deadline.remaining() if deadline else None
+            )
+        elapsed = time.perf_counter() - started
+        self.last_stats = {"time_to_first_token": elapsed, "total_time": elapsed}
+
+        return response["choices"][0]["message"]["content"]
+
+    @staticmethod
+    def _openai_response_format(json_schema: Optional[Dict]) -> Optional[Dict]:
+        """
+        Wraps a JSON schema in the chat-completions structured-output format.
+        """
+        if not json_schema:
+            return None
+        return {"type": "json_schema", "json_schema": {"name": "response", "schema": json_schema}}
+
+    def _generate_openai_stream(self, messages: list, json_schema: Optional[Dict] = None,
+                                deadline: Optional[Deadline] = None) -> Iterator[str]:
+        """
+        Streams a response from an OpenAI-compatible server token by token.
+        """
+        if not self.client:
+            raise LLMError("OpenAI-compatible client not initialized.")
+
+        return self.client.stream(
+            messages, self.model, self.temperature, self.max_tokens,
+            response_format=self._openai_response_format(json_schema),
+            timeout=deadline.remaining() if deadline else None
+        )
 
     def add_to_history(self, role: str, content: str):
         """
@@ -207,12 +1126,14 @@ class LLM:
             return
             
         self.conversation_history.append({"role": role, "content": content})
+        self._trim_history()
         
     def clear_history(self):
         """
         Clear the conversation history.
         """
         self.conversation_history = []
+        self._history_tokens = []
         console.print("[green]Conversation history cleared.[/green]")
         
     def save_history(self, filename: str = None):
@@ -264,6 +1185,238 @@ class LLM:
                 return
                 
             self.conversation_history = history
+            self._history_tokens = []
+            self._trim_history()
             console.print(f"[green]Loaded {len(history)} messages from {filename}[/green]")
         except Exception as e:
-            console.print(f"[bold red]Error loading conversation history: {e}[/bold red]")
\ No newline at end of file
+            console.print(f"[bold red]Error loading conversation history: {e}[/bold red]")
+
+
+class _LeaderCancelled(Exception):
+    """Set on a shared AsyncLLM request whose issuing task was cancelled."""
+
+
+class AsyncLLM:
+    """
+    asyncio-native client for the Ollama API.
+    
+    Requests share one pooled HTTP connection pool and are bounded by a
+    semaphore so batch workloads keep the model server busy without
+    oversubscribing it. Each request can carry its own timeout, and cancelling
+    the awaiting task aborts the underlying HTTP request.
+    """
+
+    def __init__(self, model: Optional[str] = None, max_concurrency: Optional[int] = None,
+                 timeout: Optional[float] = None):
+        """
+        Initializes the async client.
+        
+        Args:
+            model: Model name; defaults to the configured model
+            max_concurrency: Maximum number of simultaneous requests
+            timeout: Default per-request timeout in seconds (None disables it)
+        """
+        import httpx
+
+        self.model = model or config.get("llm", "model", "mistral")
+        self.provider = config.get("llm", "provider", "ollama")
+        self.temperature = config.get("llm", "temperature", 0.7)
+        self.max_tokens = config.get("llm", "max_tokens", 1000)
+        self.max_concurrency = max_concurrency or config.get("llm", "max_concurrency", 4)
+        self.timeout = timeout if timeout is not None else config.get("llm", "request_timeout", 120)
+
+        if self.provider != "ollama":
+            console.print(f"[yellow]AsyncLLM only supports Ollama; ignoring provider '{self.provider}'.[/yellow]")
+            self.provider = "ollama"
+
+        # The connection pool is created here so aclose can release it
+        self._transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency
+            )
+        )
+        self.client = ollama.AsyncClient(host=config.get("llm", "host", None), transport=self._transport)
+        self._semaphore = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Closes the pooled HTTP connections.
+        """
+        await self._transport.aclose()
+
+    def _limiter(self) -> asyncio.Semaphore:
+        """
+        Returns the concurrency semaphore, creating it inside the running loop.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def _options(self) -> dict:
+        return {"temperature": self.temperature, "num_predict": self.max_tokens}
+
+    @staticmethod
+    def _build_messages(prompt: str, system_prompt: Optional[str] = None) -> list:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    async def _chat(self, messages: list, timeout: Optional[float]) -> str:
+        """
+        Sends one chat request once a concurrency slot is free.
+        
+        The timeout covers the request only, not the wait for a slot.
+        
+        Raises:
+            asyncio.TimeoutError: If the request takes longer than timeout
+        """
+        async with self._limiter():
+            response = await asyncio.wait_for(
+                self.client.chat(
+                    model=self.model,
+                    messages=messages,
+                    options=self._options()
+                ),
+                timeout
+            )
+        return response['message']['content']
+
+    async def generate(self, prompt: str, system_prompt: Optional[str] = None,
+                       timeout: Optional[float] = None, use_cache: Optional[bool] = None) -> str:
+        """
+        Generates a response from the LLM.
+        
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt
+            timeout: Per-request timeout in seconds, not counting time queued
+                behind other requests; defaults to the client timeout
+            use_cache: Whether the response cache may be used; by default only
+                when sampling is deterministic (temperature 0)
+            
+        Returns:
+            The generated response
+        """
+        messages = self._build_messages(prompt, system_prompt)
+        timeout = self.timeout if timeout is None else timeout
+        if use_cache is None:
+            use_cache = self.temperature == 0
+        cache = get_response_cache() if use_cache else None
+        key = ResponseCache.make_key(self.provider, self.model, messages, self.temperature, self.max_tokens)
+
+        if cache:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        # Identical requests already running in this loop share their result.
+        # If the request sharing it is cancelled, the next waiter issues it again.
+        while key in self._inflight:
+            try:
+                return await asyncio.shield(self._inflight[key])
+            except _LeaderCancelled:
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            content = await self._chat(messages, timeout)
+            if cache:
+                cache.put(key, content)
+        except asyncio.TimeoutError:
+            console.print(f"[bold red]Model generation timed out after {timeout}s[/bold red]")
+            content = "Error: request timed out."
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            # Marks the exception retrieved when no request was waiting on it
+            future.exception()
+            raise
+        except Exception as e:
+            console.print(f"[bold red]Error during model generation: {e}[/bold red]")
+            content = "Error generating response."
+        finally:
+            self._inflight.pop(key, None)
+
+        if not future.done():
+            future.set_result(content)
+        return content
+
+    async def generate_stream(self, prompt: str, system_prompt: Optional[str] = None,
+                              timeout: Optional[float] = None) -> AsyncIterator[str]:
+        """
+        Generates a response from the LLM, yielding tokens as they are produced.
+        
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt
+            timeout: Overall timeout for the whole stream in seconds, counted
+                from when a concurrency slot is free
+            
+        Yields:
+            Response tokens in generation order
+        """
+        messages = self._build_messages(prompt, system_prompt)
+        timeout = self.timeout if timeout is None else timeout
+        produced = False
+
+        async with self._limiter():
+            deadline = time.monotonic() + timeout if timeout else None
+            try:
+                stream = await self.client.chat(
+                    model=self.model,
+                    messages=messages,
+                    stream=True,
+                    options=self._options()
+                )
+                iterator = stream.__aiter__()
+                while True:
+                    remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+                    try:
+                        part = await asyncio.wait_for(iterator.__anext__(), remaining)
+                    except StopAsyncIteration:
+                        break
+                    token = part.get('message', {}).get('content', '')
+                    if token:
+                        produced = True
+                        yield token
+            except asyncio.TimeoutError:
+                console.print(f"[bold red]Model generation timed out after {timeout}s[/bold red]")
+                if not produced:
+                    yield "Error: request timed out."
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                console.print(f"[bold red]Error during model generation: {e}[/bold red]")
+                if not produced:
+                    yield "Error generating response."
+
+    async def generate_many(self, prompts: List[str], system_prompt: Optional[str] = None,
+                            timeout: Optional[float] = None) -> List[str]:
+        """
+        Generates responses for a batch of prompts concurrently.
+        
+        At most max_concurrency requests are in flight at once; results are
+        returned in the same order as the prompts.
+        
+        Args:
+            prompts: The user prompts
+            system_prompt: Optional system prompt shared by every request
+            timeout: Per-request timeout in seconds, not counting time queued
+                behind other requests
+            
+        Returns:
+            The generated responses
+        """
+        return list(await asyncio.gather(
+            *(self.generate(prompt, system_prompt=system_prompt, timeout=timeout) for prompt in prompts)
+        ))
@@ -0,0 +1,241 @@
+# seifcli/seif/macros.py
+
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from rich.console import Console
+
+from .config import config
+from .plan import PlanStep
+
+console = Console()
+
+# Placeholders in recorded arguments, e.g. "{query}"
+PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+MACRO_NAME = re.compile(r"^[\w-]+$")
+
+# Commands whose second argument is typed text, parameterized by default
+_TEXT_COMMANDS = {"TYPE", "SUBMIT"}
+
+
+@dataclass
+class Macro:
+    """A recorded plan that can be replayed with different parameter values."""
+
+    name: str
+    prompt: str
+    steps: List[PlanStep]
+    # Parameter names mapped to the values they had when the macro was recorded
+    params: Dict[str, str] = field(default_factory=dict)
+    created_at: float = field(default_factory=time.time)
+
+    def bind(self, values: Optional[Dict[str, str]] = None) -> List[PlanStep]:
+        """
+        Substitute parameter values into the recorded steps.
+
+        Parameters without a value keep the value they were recorded with.
+
+        Args:
+            values: Parameter values keyed by name
+
+        Returns:
+            The steps ready for execution
+
+        Raises:
+            ValueError: If a value is given for an unknown parameter
+        """
+        values = values or {}
+        unknown = set(values) - set(self.params)
+        if unknown:
+            raise ValueError(
+                f"Unknown parameter(s) for macro '{self.name}': {', '.join(sorted(unknown))}. "
+                f"Available: {', '.join(self.params) or 'none'}"
+            )
+        bound = {**self.params, **values}
+
+        def substitute(arg: str) -> str:
+            return PLACEHOLDER.sub(lambda m: bound.get(m.group(1), m.group(0)), arg)
+
+        return [_map_args(step, substitute) for step in self.steps]
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "prompt": self.prompt,
+            "steps": [step.to_dict() for step in self.steps],
+            "params": dict(self.params),
+            "created_at": self.created_at
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Macro":
+        return cls(
+            name=data["name"],
+            prompt=data.get("prompt", ""),
+            steps=[PlanStep.from_dict(step) for step in data["steps"]],
+            params=data.get("params", {}),
+            created_at=data.get("created_at", 0)
+        )
+
+
+def _map_args(step: PlanStep, func: Callable[[str], str]) -> PlanStep:
+    """Apply a function to every argument of a step, including its branches."""
+    return PlanStep(
+        step.command,
+        [func(arg) for arg in step.args],
+        [[_map_args(branch_step, func) for branch_step in branch] for branch in step.branches]
+    )
+
+
+def parameterize(steps: List[PlanStep], params: Optional[Dict[str, str]] = None):
+    """
+    Replace argument values with named placeholders.
+
+    With explicit parameters, each occurrence of a parameter's value inside any
+    argument is replaced by {name}, so a search term also matches inside a URL.
+    Without them, the text of every TYPE or SUBMIT step becomes a parameter
+    named text, text2, text3, ...
+
+    Args:
+        steps: The executed steps
+        params: Parameter names mapped to the recorded values they replace
+
+    Returns:
+        A tuple of the parameterized steps and the parameters that were used
+    """
+    if not params:
+        return _parameterize_text(steps)
+
+    # Longer values first so a value containing another is replaced whole
+    ordered = sorted(params.items(), key=lambda item: len(item[1]), reverse=True)
+    used = {}
+
+    def replace(arg: str) -> str:
+        for name, value in ordered:
+            if value and value in arg:
+                arg = arg.replace(value, "{" + name + "}")
+                used[name] = value
+        return arg
+
+    result = [_map_args(step, replace) for step in steps]
+    return result, {name: value for name, value in params.items() if name in used}
+
+
+def _parameterize_text(steps: List[PlanStep]):
+    """Turn the typed text of TYPE and SUBMIT steps into parameters."""
+    params = {}
+    names_by_value = {}
+
+    def convert(step: PlanStep) -> PlanStep:
+        args = list(step.args)
+        if step.command in _TEXT_COMMANDS and len(args) >= 2 and args[1]:
+            if args[1] not in names_by_value:
+                name = "text" if not params else f"text{len(params) + 1}"
+                params[name] = args[1]
+                names_by_value[args[1]] = name
+            args[1] = "{" + names_by_value[args[1]] + "}"
+        return PlanStep(step.command, args, [[convert(branch_step) for branch_step in branch]
+                                             for branch in step.branches])
+
+    return [convert(step) for step in steps], params
+
+
+class MacroLibrary:
+    """
+    Macros stored under the config directory, one JSON file per macro, with an
+    index file holding each macro's metadata so listing does not read every macro.
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else config.get_config_dir() / "macros"
+        self.index_path = self.root / "index.json"
+        self._lock = threading.Lock()
+        self.index = self._load_index()
+
+    def _load_index(self) -> Dict[str, Dict]:
+        """Load the macro index from disk."""
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not load macro index: {e}[/yellow]")
+            return {}
+
+    def _write_json(self, path: Path, data) -> None:
+        """Write JSON atomically."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        tmp_path.replace(path)
+
+    def save(self, macro: Macro) -> Path:
+        """
+        Store a macro, replacing any macro with the same name.
+
+        Raises:
+            ValueError: If the name is not a valid macro name
+        """
+        if not MACRO_NAME.match(macro.name):
+            raise ValueError(f"Invalid macro name '{macro.name}': use letters, digits, '_' and '-'")
+
+        path = self.root / f"{macro.name}.json"
+        with self._lock:
+            self._write_json(path, macro.to_dict())
+            self.index[macro.name] = {
+                "file": path.name,
+                "prompt": macro.prompt,
+                "params": list(macro.params),
+                "steps": len(macro.steps),
+                "created_at": macro.created_at,
+                "runs": 0,
+                "last_run": None
+            }
+            self._write_json(self.index_path, self.index)
+        return path
+
+    def get(self, name: str) -> Optional[Macro]:
+        """Load a macro by name, or None if it does not exist."""
+        entry = self.index.get(name)
+        if not entry:
+            return None
+        try:
+            with open(self.root / entry["file"], "r", encoding="utf-8") as f:
+                return Macro.from_dict(json.load(f))
+        except Exception as e:
+            console.print(f"[bold red]Error loading macro '{name}': {e}[/bold red]")
+            return None
+
+    def list(self) -> Dict[str, Dict]:
+        """Return the index entries of all macros keyed by name."""
+        return dict(self.index)
+
+    def record_run(self, name: str) -> None:
+        """Update a macro's run statistics."""
+        with self._lock:
+            entry = self.index.get(name)
+            if not entry:
+                return
+            entry["runs"] = entry.get("runs", 0) + 1
+            entry["last_run"] = time.time()
+            try:
+                self._write_json(self.index_path, self.index)
+            except Exception as e:
+                console.print(f"[yellow]Warning: Could not update macro index: {e}[/yellow]")
+
+    def delete(self, name: str) -> bool:
+        """Delete a macro. Returns False if it does not exist."""
+        with self._lock:
+            entry = self.index.pop(name, None)
+            if not entry:
+                return False
+            (self.root / entry["file"]).unlink(missing_ok=True)
+            self._write_json(self.index_path, self.index)
+        return True
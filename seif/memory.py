@@ -1,13 +1,15 @@
 import json
 import os
 import time
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import Callable, List, Dict, Optional, Any
 from rich.console import Console
 from rich.prompt import Confirm
 
 
 from .config import config
+from .tokens import approximate_tokens, message_tokens
 
 console = Console()
 
@@ -20,10 +22,19 @@ class Memory:
     - Summarization of long conversations
     - Tagging and searching conversations
     - Memory pruning for context window management
+    
+    Token counts are computed once per message when it is added, and a sliding
+    window over the most recent non-system messages is maintained incrementally
+    with a running token total, so building the context is linear in the window.
     """
     
-    def __init__(self):
-        """Initialize the memory system."""
+    def __init__(self, token_counter: Optional[Callable[[str], int]] = None):
+        """Initialize the memory system.
+        
+        Args:
+            token_counter: Optional function counting tokens with the model's
+                tokenizer; a fast approximation is used when omitted
+        """
         self.memory_dir = self._get_memory_dir()
         self.current_session = {
             "id": time.strftime("%Y%m%d-%H%M%S"),
@@ -33,6 +44,12 @@ class Memory:
             "tags": []
         }
         self.max_context_length = config.get("memory", "max_context_length", 4000)
+        self.max_context_tokens = config.get("memory", "max_context_tokens", 2048)
+        self.count_tokens = token_counter or approximate_tokens
+        self._window = deque()
+        self._window_tokens = 0
+        # Bumped whenever existing history is replaced rather than appended to
+        self.revision = 0
         self.auto_summarize = config.get("memory", "auto_summarize", True)
         self.summarize_threshold = config.get("memory", "summarize_threshold", 10)
     
@@ -56,10 +73,12 @@ class Memory:
         message = {
             "role": role,
             "content": content,
-            "timestamp": time.time()
+            "timestamp": time.time(),
+            "tokens": message_tokens(content, self.count_tokens)
         }
         
         self.current_session["messages"].append(message)
+        self._extend_window(len(self.current_session["messages"]) - 1)
         
         if (self.auto_summarize and 
             len(self.current_session["messages"]) % self.summarize_threshold == 0):
@@ -78,15 +97,49 @@ class Memory:
             return self.current_session["messages"]
         return self.current_session["messages"][-limit:]
     
-    def get_formatted_context(self, include_summary: bool = True) -> List[Dict[str, str]]:
+    def _message_tokens(self, message: Dict[str, Any]) -> int:
+        """Return the cached token count of a message, computing it if missing."""
+        if "tokens" not in message:
+            message["tokens"] = message_tokens(message["content"], self.count_tokens)
+        return message["tokens"]
+    
+    def _extend_window(self, index: int) -> None:
+        """Slide the context window forward to include the message at index."""
+        message = self.current_session["messages"][index]
+        if message["role"] == "system":
+            return
+        
+        self._window.append(index)
+        self._window_tokens += self._message_tokens(message)
+        
+        messages = self.current_session["messages"]
+        while self._window_tokens > self.max_context_tokens and len(self._window) > 1:
+            self._window_tokens -= messages[self._window.popleft()]["tokens"]
+    
+    def _rebuild_window(self) -> None:
+        """Recompute the context window after the message list was replaced."""
+        self._window = deque()
+        self._window_tokens = 0
+        for index in range(len(self.current_session["messages"])):
+            self._extend_window(index)
+    
+    def get_formatted_context(self, include_summary: bool = True, include_system: bool = True,
+                              reserve_tokens: int = 0) -> List[Dict[str, str]]:
         """Get the current context formatted for LLM consumption.
         
+        The most recent messages that fit in max_context_tokens are returned,
+        after room is made for the summary, system messages and reserve_tokens.
+        
         Args:
             include_summary: Whether to include the session summary
+            include_system: Whether to include system messages from the session
+            reserve_tokens: Tokens to keep free for content the caller adds,
+                such as a separately supplied system prompt
             
         Returns:
             List of message dictionaries in the format expected by LLMs
         """
+        messages = self.current_session["messages"]
         context = []
         
         if include_summary and self.current_session["summary"]:
@@ -95,18 +148,28 @@ class Memory:
                 "content": f"Previous conversation summary: {self.current_session['summary']}"
             })
         
-        total_length = sum(len(msg["content"]) for msg in context)
-        messages = []
+        if include_system:
+            context.extend(
+                {"role": msg["role"], "content": msg["content"]}
+                for msg in messages if msg["role"] == "system"
+            )
+        
+        fixed_tokens = reserve_tokens + sum(message_tokens(msg["content"], self.count_tokens) for msg in context)
+        budget = self.max_context_tokens - fixed_tokens
         
-        for msg in reversed(self.current_session["messages"]):
-            msg_length = len(msg["content"])
-            if total_length + msg_length <= self.max_context_length:
-                messages.insert(0, {"role": msg["role"], "content": msg["content"]})
-                total_length += msg_length
-            else:
-                break
+        # The window already fits max_context_tokens; drop from its oldest end
+        # only as far as the fixed content requires
+        window = list(self._window)
+        total = self._window_tokens
+        start = 0
+        while total > budget and start < len(window) - 1:
+            total -= messages[window[start]]["tokens"]
+            start += 1
         
-        context.extend(messages)
+        context.extend(
+            {"role": messages[i]["role"], "content": messages[i]["content"]}
+            for i in window[start:]
+        )
         return context
     
     def clear(self) -> None:
@@ -118,6 +181,8 @@ class Memory:
             "summary": "",
             "tags": []
         }
+        self._rebuild_window()
+        self.revision += 1
         console.print("[green]Memory cleared.[/green]")
     
     def save(self, filename: Optional[str] = None) -> str:
@@ -181,6 +246,8 @@ class Memory:
                 return False
             
             self.current_session = session
+            self._rebuild_window()
+            self.revision += 1
             console.print(f"[green]Loaded {len(session['messages'])} messages from {file_path}[/green]")
             return True
         except Exception as e:
@@ -0,0 +1,192 @@
+# seifcli/seif/openai_backend.py
+
+import json
+import random
+import time
+from typing import Dict, Iterator, List, Optional
+from rich.console import Console
+
+console = Console()
+
+class OpenAICompatError(Exception):
+    """Raised when an OpenAI-compatible server cannot serve a request."""
+
+
+class OpenAICompatBackend:
+    """
+    Client for servers speaking the OpenAI chat-completions protocol
+    (OpenAI, vLLM, llama.cpp server, LM Studio, ...).
+    
+    Requests go through one persistent requests.Session with a pooled
+    keep-alive adapter. 429 and 5xx responses and connection failures are
+    retried with exponential backoff and jitter, honouring Retry-After.
+    Connect and read timeouts apply per attempt; the total timeout bounds the
+    whole request including retries and, for streams, the time spent reading.
+    """
+    
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    
+    def __init__(self, base_url: str, api_key: str = "", connect_timeout: float = 5,
+                 read_timeout: float = 60, total_timeout: float = 300, max_retries: int = 3,
+                 backoff: float = 0.5, pool_size: int = 8):
+        """
+        Create the pooled HTTP session.
+        
+        Args:
+            base_url: API root, e.g. http://localhost:8000/v1
+            api_key: Bearer token; optional for local servers
+            connect_timeout: Seconds to wait for a connection
+            read_timeout: Seconds to wait between bytes of the response
+            total_timeout: Seconds the whole request may take, retries included
+            max_retries: Retries after the first attempt for retryable failures
+            backoff: Base delay in seconds, doubled after every retry
+            pool_size: Number of keep-alive connections kept per host
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        self.base_url = base_url.rstrip("/")
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.total_timeout = total_timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+        if api_key:
+            self.session.headers["Authorization"] = f"Bearer {api_key}"
+    
+    def _retry_delay(self, attempt: int, response=None) -> float:
+        """Compute the delay before the next attempt."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return float(retry_after)
+                except ValueError:
+                    pass
+        return self.backoff * (2 ** attempt) * random.uniform(0.8, 1.2)
+    
+    def _request(self, method: str, path: str, deadline: float, payload: Optional[Dict] = None,
+                 stream: bool = False):
+        """
+        Send a request, retrying transient failures until the deadline.
+        
+        Raises:
+            OpenAICompatError: On a non-retryable error or when retries are exhausted
+        """
+        import requests
+        
+        url = f"{self.base_url}{path}"
+        attempt = 0
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise OpenAICompatError(f"Request to {url} exceeded the total timeout of {self.total_timeout}s")
+            
+            response = None
+            try:
+                response = self.session.request(
+                    method,
+                    url,
+                    json=payload,
+                    stream=stream,
+                    timeout=(min(self.connect_timeout, remaining), min(self.read_timeout, remaining))
+                )
+                if response.status_code not in self.RETRY_STATUSES:
+                    if response.status_code >= 400:
+                        raise OpenAICompatError(f"HTTP {response.status_code} from {url}: {response.text[:200]}")
+                    return response
+                failure = f"HTTP {response.status_code}"
+            except (requests.ConnectionError, requests.Timeout) as e:
+                failure = str(e)
+            
+            if attempt >= self.max_retries:
+                raise OpenAICompatError(f"Request to {url} failed after {attempt + 1} attempts: {failure}")
+            
+            delay = self._retry_delay(attempt, response)
+            if response is not None:
+                response.close()
+            if time.monotonic() + delay >= deadline:
+                raise OpenAICompatError(f"Request to {url} failed and no time is left to retry: {failure}")
+            time.sleep(delay)
+            attempt += 1
+    
+    def _payload(self, messages: List[Dict[str, str]], model: str, temperature: float,
+                 max_tokens: int, stream: bool, response_format: Optional[Dict] = None) -> Dict:
+        payload = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": stream
+        }
+        if response_format:
+            payload["response_format"] = response_format
+        return payload
+    
+    def _deadline(self, timeout: Optional[float]) -> float:
+        """Monotonic deadline of a request, optionally shortened by a caller timeout."""
+        total = self.total_timeout if timeout is None else min(self.total_timeout, timeout)
+        return time.monotonic() + total
+    
+    def complete(self, messages: List[Dict[str, str]], model: str, temperature: float,
+                 max_tokens: int, response_format: Optional[Dict] = None,
+                 timeout: Optional[float] = None) -> Dict:
+        """
+        Run a blocking chat completion.
+        
+        Args:
+            timeout: Optional seconds the request may take, if shorter than the total timeout
+        
+        Returns:
+            The decoded completion response
+        """
+        deadline = self._deadline(timeout)
+        response = self._request(
+            "POST", "/chat/completions", deadline,
+            self._payload(messages, model, temperature, max_tokens, False, response_format)
+        )
+        return response.json()
+    
+    def stream(self, messages: List[Dict[str, str]], model: str, temperature: float,
+               max_tokens: int, response_format: Optional[Dict] = None,
+               timeout: Optional[float] = None) -> Iterator[str]:
+        """
+        Run a streaming chat completion, yielding content tokens from the
+        server-sent events as they arrive.
+        
+        Args:
+            timeout: Optional seconds the request may take, if shorter than the total timeout
+        """
+        deadline = self._deadline(timeout)
+        response = self._request(
+            "POST", "/chat/completions", deadline,
+            self._payload(messages, model, temperature, max_tokens, True, response_format),
+            stream=True
+        )
+        with response:
+            # Server-sent events are UTF-8 by definition; requests would decode a
+            # text/event-stream without a charset as ISO-8859-1
+            for raw in response.iter_lines():
+                if time.monotonic() > deadline:
+                    raise OpenAICompatError(f"Stream exceeded the total timeout of {self.total_timeout}s")
+                line = raw.decode("utf-8")
+                if not line or not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                chunk = json.loads(data)
+                choices = chunk.get("choices") or [{}]
+                yield choices[0].get("delta", {}).get("content") or ""
+    
+    def list_models(self) -> List[str]:
+        """Return the ids of the models the server offers."""
+        deadline = time.monotonic() + self.total_timeout
+        response = self._request("GET", "/models", deadline)
+        return [model.get("id", "") for model in response.json().get("data", [])]
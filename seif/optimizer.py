@@ -0,0 +1,156 @@
+# seifcli/seif/optimizer.py
+
+import re
+from typing import Iterable, Iterator, List, Optional
+from rich.console import Console
+
+from .plan import PARALLEL, PlanStep
+
+console = Console()
+
+# Pixels scrolled by a relative SCROLL without an explicit amount (see Browser.scroll)
+DEFAULT_SCROLL_AMOUNT = 500
+
+# CLICK selectors that look like the submit control of a form
+SUBMIT_SELECTOR = re.compile(r"submit|btnK", re.IGNORECASE)
+
+# Commands that do not change the page URL; any other step makes it unknown
+_NON_NAVIGATING = {"TYPE", "SCROLL", "DONE"}
+
+# Steps that can merge with the step after them are held back until it arrives.
+# GOTO is never held, so navigation starts while later steps are still planned.
+_MERGEABLE = {"SCROLL", "TYPE"}
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL the way Browser.goto does, ignoring a trailing slash."""
+    url = url.strip()
+    if not url.startswith(("http://", "https://")):
+        url = "https://" + url
+    return url.rstrip("/")
+
+
+class PlanOptimizer:
+    """
+    Peephole optimizer that rewrites a plan before it is executed.
+
+    Steps are consumed from a stream and emitted as soon as they can no longer
+    be merged with a following step, so optimization keeps pace with a plan
+    that is still being generated. The rewrites are:
+
+    - GOTO to the page the plan is already on is dropped
+    - consecutive SCROLL steps are merged into one, and a relative scroll
+      followed by SCROLL top or bottom is dropped
+    - TYPE followed by a CLICK on a submit control becomes a single SUBMIT step
+      that fills the field and submits it in one scripted action
+
+    The branches of a PARALLEL step are optimized independently, each
+    starting from an unknown page.
+    """
+
+    def __init__(self):
+        self.rewrites: List[str] = []
+        self._current_url: Optional[str] = None
+
+    def optimize(self, steps: Iterable[PlanStep]) -> Iterator[PlanStep]:
+        """
+        Rewrite a stream of plan steps.
+
+        Args:
+            steps: The plan steps as produced by the planner
+
+        Yields:
+            The optimized plan steps
+        """
+        pending = None
+
+        for step in steps:
+            if pending is not None:
+                merged = self._merge(pending, step)
+                if merged is not False:
+                    pending = merged
+                    continue
+                yield self._emit(pending)
+                pending = None
+
+            if step.command == "GOTO" and step.args and normalize_url(step.args[0]) == self._current_url:
+                self._record(f"Removed GOTO {step.args[0]}: already on that page")
+                continue
+
+            if step.command == PARALLEL:
+                step = PlanStep(PARALLEL, step.args, [self._optimize_branch(branch) for branch in step.branches])
+
+            if step.command in _MERGEABLE:
+                pending = step
+            else:
+                yield self._emit(step)
+
+        if pending is not None:
+            yield self._emit(pending)
+
+    def _optimize_branch(self, branch: List[PlanStep]) -> List[PlanStep]:
+        """Optimize one branch of a PARALLEL step, sharing the rewrite log."""
+        optimizer = PlanOptimizer()
+        optimizer.rewrites = self.rewrites
+        return list(optimizer.optimize(branch))
+
+    def _emit(self, step: PlanStep) -> PlanStep:
+        """Track the page URL implied by the steps emitted so far."""
+        if step.command == "GOTO" and step.args:
+            self._current_url = normalize_url(step.args[0])
+        elif step.command not in _NON_NAVIGATING:
+            self._current_url = None
+        return step
+
+    def _record(self, description: str) -> None:
+        self.rewrites.append(description)
+        console.print(f"[dim]Optimizer: {description}[/dim]")
+
+    def _merge(self, first: PlanStep, second: PlanStep):
+        """
+        Merge two consecutive steps.
+
+        Returns:
+            The merged step, None if the two steps cancel out, or False if
+            they cannot be merged
+        """
+        if first.command == "SCROLL" and second.command == "SCROLL" and first.args and second.args:
+            return self._merge_scrolls(first, second)
+
+        if (first.command == "TYPE" and second.command == "CLICK" and len(first.args) >= 2
+                and second.args and SUBMIT_SELECTOR.search(second.args[0])):
+            self._record(f"Fused TYPE {first.args[0]} and CLICK {second.args[0]} into one SUBMIT")
+            return PlanStep("SUBMIT", [first.args[0], first.args[1], second.args[0]])
+
+        return False
+
+    def _merge_scrolls(self, first: PlanStep, second: PlanStep):
+        """Merge two SCROLL steps into one, or None if they cancel out."""
+        if second.args[0] in ("top", "bottom"):
+            self._record(f"Removed SCROLL {first.args[0]}: followed by SCROLL {second.args[0]}")
+            return second
+
+        offsets = [self._scroll_offset(step) for step in (first, second)]
+        if None in offsets:
+            return False
+
+        net = sum(offsets)
+        if net == 0:
+            self._record(f"Removed SCROLL {first.args[0]} and SCROLL {second.args[0]}: they cancel out")
+            return None
+
+        merged = PlanStep("SCROLL", ["down" if net > 0 else "up", str(abs(net))])
+        self._record(f"Merged SCROLL {' '.join(first.args)} and SCROLL {' '.join(second.args)} into {merged}")
+        return merged
+
+    @staticmethod
+    def _scroll_offset(step: PlanStep) -> Optional[int]:
+        """Signed pixel offset of a relative scroll, or None for top/bottom."""
+        direction = step.args[0]
+        if direction not in ("up", "down"):
+            return None
+        try:
+            amount = int(step.args[1]) if len(step.args) > 1 else DEFAULT_SCROLL_AMOUNT
+        except ValueError:
+            return None
+        return amount if direction == "down" else -amount
@@ -0,0 +1,106 @@
+# seifcli/seif/pacing.py
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+
+@dataclass(frozen=True)
+class PacingProfile:
+    """Artificial delays, as (min, max) seconds, and the typing strategy of a browser."""
+
+    name: str
+    navigate: Tuple[float, float]   # After a page load
+    focus: Tuple[float, float]      # Around clearing and focusing an input
+    keystroke: Tuple[float, float]  # After each send_keys call while typing
+    click: Tuple[float, float]      # Between scrolling an element into view and clicking it
+    scroll: Tuple[float, float]     # After scrolling the page
+    # How text is entered: one send_keys call per character ("keys") or per
+    # word ("words"), or a single script call that sets the value ("bulk")
+    typing: str = "keys"
+
+
+PROFILES: Dict[str, PacingProfile] = {
+    # Paced like a person, one keystroke at a time
+    "human": PacingProfile("human", navigate=(1.0, 3.0), focus=(0.1, 0.3), keystroke=(0.05, 0.15),
+                           click=(0.5, 1.0), scroll=(0.5, 1.0), typing="keys"),
+    # Short pauses, text typed a word at a time
+    "balanced": PacingProfile("balanced", navigate=(0.3, 0.8), focus=(0.05, 0.1), keystroke=(0.02, 0.06),
+                              click=(0.1, 0.3), scroll=(0.1, 0.3), typing="words"),
+    # No artificial delays, text inserted in one round trip
+    "fast": PacingProfile("fast", navigate=(0, 0), focus=(0, 0), keystroke=(0, 0),
+                          click=(0, 0), scroll=(0, 0), typing="bulk"),
+}
+
+DEFAULT_PROFILE = "human"
+
+
+def get_profile(name: str) -> PacingProfile:
+    """
+    Look up a pacing profile by name.
+
+    Raises:
+        ValueError: If there is no profile with that name
+    """
+    try:
+        return PROFILES[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown pacing profile '{name}'. Available: {', '.join(PROFILES)}")
+
+
+class Pacer:
+    """
+    Applies the delays of a pacing profile and keeps count of the time they take.
+
+    Domains can override the default profile; a domain also matches its
+    subdomains, so "github.com" applies to "gist.github.com".
+    """
+
+    def __init__(self, profile: str = DEFAULT_PROFILE, domains: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            profile: Name of the default profile
+            domains: Domain names mapped to the profile used on them
+
+        Raises:
+            ValueError: If a profile name is unknown
+        """
+        self.profile = get_profile(profile)
+        self.domains = {domain.lower().lstrip("."): get_profile(name) for domain, name in (domains or {}).items()}
+        # Seconds spent in artificial delays
+        self.slept = 0.0
+
+    def profile_for(self, url: Optional[str] = None) -> PacingProfile:
+        """The profile that applies to a URL."""
+        host = (urlparse(url).hostname or "").lower() if url else ""
+        while host:
+            if host in self.domains:
+                return self.domains[host]
+            host = host.partition(".")[2]
+        return self.profile
+
+    def delay(self, kind: str, url: Optional[str] = None,
+              limit: Optional[Callable[[float], float]] = None) -> float:
+        """
+        Sleep for the profile's delay of a kind of action.
+
+        Args:
+            kind: One of navigate, focus, keystroke, click or scroll
+            url: The page the action happens on, for per-domain profiles
+            limit: Optional function shortening the delay, e.g. to fit a deadline
+
+        Returns:
+            The seconds slept
+        """
+        low, high = getattr(self.profile_for(url), kind)
+        if high <= 0:
+            return 0.0
+        seconds = random.uniform(low, high)
+        if limit is not None:
+            seconds = limit(seconds)
+        if seconds > 0:
+            time.sleep(seconds)
+            self.slept += seconds
+        return seconds
@@ -0,0 +1,219 @@
+# seifcli/seif/plan.py
+
+import inspect
+import json
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+# Built-in browser commands and the names of their arguments
+BUILTIN_COMMANDS = {
+    "GOTO": ["url"],
+    "TYPE": ["css_selector", "text"],
+    "CLICK": ["css_selector"],
+    "SCROLL": ["direction"],
+    "DONE": []
+}
+
+# Step that runs independent branches of steps concurrently and joins them
+PARALLEL = "PARALLEL"
+
+# Extra JSON-schema constraints applied to every argument of a command
+ARGUMENT_CONSTRAINTS = {
+    "SCROLL": {"enum": ["up", "down", "top", "bottom"]}
+}
+
+
+@dataclass
+class PlanStep:
+    """A single typed step of an execution plan.
+    
+    A PARALLEL step has no arguments; its branches are independent step
+    sequences that may run concurrently, and the steps after it only start
+    once every branch has finished.
+    """
+    
+    command: str
+    args: List[str] = field(default_factory=list)
+    branches: List[List["PlanStep"]] = field(default_factory=list)
+    
+    def __str__(self) -> str:
+        if self.command == PARALLEL:
+            return " ".join([self.command] + ["[" + " | ".join(str(step) for step in branch) + "]"
+                                              for branch in self.branches])
+        return " ".join([self.command] + [f'"{arg}"' for arg in self.args])
+    
+    def to_dict(self) -> Dict:
+        data = {"command": self.command, "args": list(self.args)}
+        if self.branches:
+            data["branches"] = [[step.to_dict() for step in branch] for branch in self.branches]
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PlanStep":
+        """
+        Build a step from its JSON form.
+        
+        Raises:
+            ValueError: If the data is not a valid step
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("command"), str):
+            raise ValueError(f"Invalid plan step: {data!r}")
+        args = data.get("args", [])
+        if not isinstance(args, list):
+            raise ValueError(f"Invalid arguments for {data['command']}: {args!r}")
+        command = data["command"].strip().upper()
+        branches = data.get("branches", [])
+        if not isinstance(branches, list) or not all(isinstance(branch, list) for branch in branches):
+            raise ValueError(f"Invalid branches for {command}: {branches!r}")
+        if command == PARALLEL and not branches:
+            raise ValueError("PARALLEL step without branches")
+        return cls(
+            command=command,
+            args=[str(arg) for arg in args],
+            branches=[[cls.from_dict(step) for step in branch] for branch in branches]
+        )
+
+
+@dataclass
+class CommandSignature:
+    """Argument names of a command, split into required and optional ones."""
+    
+    required: List[str]
+    optional: List[str] = field(default_factory=list)
+
+
+def command_signatures(skills: Optional[Dict[str, Callable]] = None) -> Dict[str, CommandSignature]:
+    """
+    Collect the signatures of the built-in commands and the loaded skills.
+    
+    A skill's first parameter is the browser passed in by the agent; the
+    remaining parameters become the command's arguments, with parameters that
+    have defaults treated as optional.
+    """
+    signatures = {name: CommandSignature(list(args)) for name, args in BUILTIN_COMMANDS.items()}
+    
+    for name, func in (skills or {}).items():
+        params = list(inspect.signature(func).parameters.values())[1:]
+        positional = [p for p in params if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)]
+        signatures[name] = CommandSignature(
+            required=[p.name for p in positional if p.default is p.empty],
+            optional=[p.name for p in positional if p.default is not p.empty]
+        )
+    return signatures
+
+
+def describe_commands(signatures: Dict[str, CommandSignature]) -> str:
+    """Render the available commands for the planner's system prompt."""
+    lines = []
+    for name, signature in signatures.items():
+        args = [f"<{arg}>" for arg in signature.required] + [f"[{arg}]" for arg in signature.optional]
+        lines.append(f"- {name} {' '.join(args)}".rstrip())
+    lines.append(f"- {PARALLEL} (runs independent branches of the commands above at the same time)")
+    return "\n".join(lines)
+
+
+def build_plan_schema(signatures: Dict[str, CommandSignature]) -> Dict:
+    """
+    Build the JSON schema that constrains the planner's output.
+    
+    Every step is an object whose command is one of the available commands and
+    whose argument list has exactly as many strings as that command accepts.
+    A PARALLEL step holds branches of such steps; branches do not nest.
+    """
+    variants = []
+    for name, signature in signatures.items():
+        args_schema = {
+            "type": "array",
+            "items": {"type": "string", **ARGUMENT_CONSTRAINTS.get(name, {})},
+            "minItems": len(signature.required),
+            "maxItems": len(signature.required) + len(signature.optional)
+        }
+        variants.append({
+            "type": "object",
+            "properties": {
+                "command": {"type": "string", "enum": [name]},
+                "args": args_schema
+            },
+            "required": ["command", "args"]
+        })
+    
+    branch_variants = [variant for variant in variants
+                       if variant["properties"]["command"]["enum"] != ["DONE"]]
+    parallel = {
+        "type": "object",
+        "properties": {
+            "command": {"type": "string", "enum": [PARALLEL]},
+            "args": {"type": "array", "maxItems": 0},
+            "branches": {
+                "type": "array",
+                "minItems": 2,
+                "items": {"type": "array", "minItems": 1, "items": {"anyOf": branch_variants}}
+            }
+        },
+        "required": ["command", "args", "branches"]
+    }
+    
+    return {
+        "type": "object",
+        "properties": {
+            "steps": {"type": "array", "items": {"anyOf": variants + [parallel]}}
+        },
+        "required": ["steps"]
+    }
+
+
+class PlanStreamParser:
+    """
+    Incremental parser for a streamed {"steps": [...]} JSON document.
+    
+    Text is fed in as it arrives and every step object is returned as soon as
+    its closing brace is seen, without waiting for the rest of the document.
+    The scanner keeps its position between calls so each character is only
+    examined once.
+    """
+    
+    def __init__(self):
+        self.buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._step_start = None
+    
+    def feed(self, text: str) -> List[PlanStep]:
+        """
+        Add streamed text and return the steps completed by it.
+        
+        Raises:
+            ValueError: If a completed step is not valid
+        """
+        self.buffer += text
+        steps = []
+        
+        while self._pos < len(self.buffer):
+            char = self.buffer[self._pos]
+            
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                # Depth 2 is inside the top-level object's steps array
+                if char == "{" and self._depth == 2:
+                    self._step_start = self._pos
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if char == "}" and self._depth == 2 and self._step_start is not None:
+                    raw = self.buffer[self._step_start:self._pos + 1]
+                    self._step_start = None
+                    steps.append(PlanStep.from_dict(json.loads(raw)))
+            
+            self._pos += 1
+        
+        return steps
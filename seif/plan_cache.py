@@ -0,0 +1,143 @@
+# seifcli/seif/plan_cache.py
+
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from rich.console import Console
+
+from .config import config
+
+console = Console()
+
+class PlanCache:
+    """
+    Cache of parsed plans keyed on normalized task prompts.
+    
+    Plans are stored as soon as they are generated, but only served once an
+    execution of them has completed successfully. A plan is evicted as soon as
+    an execution of it fails.
+    """
+    
+    def __init__(self, path: Optional[Path] = None, max_entries: Optional[int] = None):
+        self.path = Path(path) if path else config.get_config_dir() / "cache" / "plans.json"
+        self.max_entries = max_entries or config.get("cache", "max_plans", 500)
+        self._lock = threading.Lock()
+        self.entries = self._load()
+        
+    @staticmethod
+    def normalize(prompt: str) -> str:
+        """
+        Normalize a prompt so trivially different phrasings share a cache entry.
+        
+        Lowercases, drops punctuation (keeping characters common in URLs and
+        file names) and collapses whitespace.
+        """
+        text = prompt.lower()
+        text = re.sub(r"[^\w\s./:-]", " ", text)
+        text = re.sub(r"[.:-]+(\s|$)", r"\1", text)
+        return " ".join(text.split())
+    
+    def _load(self) -> Dict[str, Dict]:
+        """Load cached plans from disk."""
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not load plan cache: {e}[/yellow]")
+            return {}
+    
+    def _save(self) -> None:
+        """Persist cached plans to disk. Caller must hold the lock."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, indent=2)
+            tmp_path.replace(self.path)
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not save plan cache: {e}[/yellow]")
+    
+    def get(self, prompt: str) -> Optional[List[Dict]]:
+        """
+        Return the cached plan for a prompt if it has previously succeeded.
+        
+        Args:
+            prompt: The task prompt
+            
+        Returns:
+            The list of plan steps, or None on a miss
+        """
+        key = self.normalize(prompt)
+        with self._lock:
+            entry = self.entries.get(key)
+            if not entry or entry.get("status") != "succeeded":
+                return None
+            entry["hits"] = entry.get("hits", 0) + 1
+            entry["last_used"] = time.time()
+            self._save()
+            return list(entry["steps"])
+    
+    def store(self, prompt: str, steps: List[Dict]) -> None:
+        """
+        Store a freshly generated plan. It is served only after it succeeds.
+        
+        Args:
+            prompt: The task prompt
+            steps: The plan steps in their JSON form
+        """
+        key = self.normalize(prompt)
+        with self._lock:
+            existing = self.entries.get(key)
+            if existing and existing.get("status") == "succeeded" and existing["steps"] == steps:
+                return
+            self.entries[key] = {
+                "prompt": prompt,
+                "steps": list(steps),
+                "status": "pending",
+                "created_at": time.time(),
+                "last_used": time.time(),
+                "hits": 0,
+                "successes": 0
+            }
+            self._evict()
+            self._save()
+    
+    def record_outcome(self, prompt: str, success: bool) -> None:
+        """
+        Record the outcome of executing the cached plan for a prompt.
+        
+        Args:
+            prompt: The task prompt
+            success: Whether every step of the plan completed successfully
+        """
+        key = self.normalize(prompt)
+        with self._lock:
+            entry = self.entries.get(key)
+            if not entry:
+                return
+            if success:
+                entry["status"] = "succeeded"
+                entry["successes"] = entry.get("successes", 0) + 1
+            else:
+                del self.entries[key]
+            self._save()
+    
+    def _evict(self) -> None:
+        """Drop the least recently used plans beyond the size bound. Caller must hold the lock."""
+        overflow = len(self.entries) - self.max_entries
+        if overflow <= 0:
+            return
+        oldest = sorted(self.entries, key=lambda k: self.entries[k].get("last_used", 0))
+        for key in oldest[:overflow]:
+            del self.entries[key]
+    
+    def clear(self) -> None:
+        """Remove all cached plans."""
+        with self._lock:
+            self.entries = {}
+            self._save()
@@ -1,61 +1,181 @@
 from .llm import LLM
+from .plan import PlanStep, PlanStreamParser, build_plan_schema, command_signatures, describe_commands
+from .plan_cache import PlanCache
+from .deadline import Deadline
 from rich.console import Console
-import re
+from typing import Callable, Dict, Iterator, List, Optional
+import threading
 
 console = Console()
 
-class Planner:
-    def __init__(self, model: str = None):
-        self.llm = LLM(model=model)
-
-    def create_plan(self, prompt: str) -> list[str]:
-        """
-        Creates a sequence of executable steps from a natural language prompt.
-        """
-        system_prompt = """
+PLANNER_SYSTEM_PROMPT = """
 You are a task planner for an AI assistant. Your job is to break down a user's command into a series of precise, executable steps.
 The available commands are:
-- GOTO "<url>"
-- TYPE "<css_selector>" "<text>"
-- CLICK "<css_selector>"
-- SCROLL "<direction>"  (direction can be "up" or "down")
-- SCREENSHOT "<filename>"
-- DONE
+{commands}
 
 Guidelines:
 - Think step-by-step.
-- Always use the exact command format.
-- Use double quotes for all arguments.
+- Respond with a JSON object of the form {{"steps": [{{"command": "...", "args": ["..."]}}]}}.
+- Every argument is a string. Arguments in [brackets] are optional.
 - For the TYPE command, find a specific CSS selector for the input field.
 - For the CLICK command, find a specific CSS selector for the button or link.
+- SCROLL direction can be "up", "down", "top" or "bottom".
+- When parts of the task are independent of each other (for example visiting several sites),
+  put them in a PARALLEL step: {{"command": "PARALLEL", "args": [], "branches": [[...steps...], [...steps...]]}}.
+  Each branch runs in its own browser window, so every branch must start with GOTO.
 - The final step must always be DONE.
 
 Example:
 User command: Search for trending startups on ProductHunt and screenshot the page.
 Plan:
-1. GOTO "https://www.producthunt.com"
-2. TYPE "input[name='q']" "trending startups"
-3. CLICK "button[type='submit']"
-4. SCREENSHOT "producthunt_results.png"
-5. DONE
+{{"steps": [
+  {{"command": "GOTO", "args": ["https://www.producthunt.com"]}},
+  {{"command": "TYPE", "args": ["input[name='q']", "trending startups"]}},
+  {{"command": "CLICK", "args": ["button[type='submit']"]}},
+  {{"command": "SCREENSHOT", "args": ["producthunt_results.png"]}},
+  {{"command": "DONE", "args": []}}
+]}}
 """
-        with console.status("[bold magenta]Asking LLM to create a plan...", spinner="dots"):
-            raw_plan = self.llm.generate(prompt, system_prompt=system_prompt)
-        
-        console.print("[bold green]LLM has generated a plan:[/bold green]")
-        console.print(raw_plan)
 
-        plan = re.findall(r'^\d+\.\s*(GOTO|TYPE|CLICK|SCROLL|SCREENSHOT|DONE.*)', raw_plan, re.MULTILINE)
-        
+class Planner:
+    def __init__(self, model: str = None, skills: Optional[Dict[str, Callable]] = None):
+        self.llm = LLM(model=model)
+        self.plan_cache = PlanCache()
+        self.signatures = command_signatures(skills)
+        self.plan_schema = build_plan_schema(self.signatures)
+        self.system_prompt = PLANNER_SYSTEM_PROMPT.format(commands=describe_commands(self.signatures))
+
+    def create_plan(self, prompt: str, use_cache: bool = True,
+                    deadline: Optional[Deadline] = None) -> List[PlanStep]:
+        """
+        Creates a sequence of executable steps from a natural language prompt.
+        Plans that previously executed successfully are served from the plan cache.
+        """
+        plan = list(self.stream_plan(prompt, use_cache=use_cache, echo=True, deadline=deadline))
+        console.print("[bold green]LLM has generated a plan.[/bold green]")
+        return plan
+
+    def stream_plan(self, prompt: str, use_cache: bool = True, echo: bool = False,
+                    stop: Optional[threading.Event] = None,
+                    deadline: Optional[Deadline] = None) -> Iterator[PlanStep]:
+        """
+        Creates a plan, yielding each step as soon as it is complete so execution
+        can start while the LLM is still generating later steps.
+
+        The LLM output is constrained to a JSON schema generated from the
+        available commands and skill signatures, and generation is stopped as
+        soon as the DONE step has been emitted. Plans are cached by the plan
+        cache, so the LLM response cache is not used.
+
+        Args:
+            prompt: The natural language task
+            use_cache: Whether the plan cache may be used
+            echo: Print the raw LLM output as it streams in
+            stop: Optional event that aborts generation when set
+            deadline: Optional deadline for the LLM request
+
+        Yields:
+            Typed plan steps
+        """
+        if use_cache:
+            cached_plan = self._cached_plan(prompt)
+            if cached_plan:
+                console.print("[bold green]Using cached plan from a previous successful run.[/bold green]")
+                yield from cached_plan
+                return
+
+        console.print("[bold magenta]Asking LLM to create a plan...[/bold magenta]")
         plan = []
-        for line in raw_plan.strip().split('\n'):
-            line = line.strip()
-            if re.match(r'^\d+\.', line):
-                match = re.search(r'\d+\.\s*(.*)', line)
-                if match:
-                    plan.append(match.group(1).strip())
-
-        if not plan or plan[-1] != "DONE":
+        for step in self._generate_steps(prompt, echo=echo, stop=stop, deadline=deadline):
+            plan.append(step)
+            yield step
+
+        if not plan or plan[-1].command != "DONE":
              console.print("[bold red]Warning: The generated plan is malformed or incomplete.[/bold red]")
+        elif use_cache:
+            self.plan_cache.store(prompt, [step.to_dict() for step in plan])
+
+    def replan(self, goal: str, completed: List[PlanStep], failed: PlanStep, error: str,
+               page: str, deadline: Optional[Deadline] = None) -> List[PlanStep]:
+        """
+        Plans the rest of a task after a step failed, starting from the current page.
         
-        return plan
\ No newline at end of file
+        Args:
+            goal: The original task
+            completed: The steps that already ran successfully
+            failed: The step that failed
+            error: The error the failed step reported
+            page: A compact description of the current page
+            deadline: Optional deadline for the LLM request
+            
+        Returns:
+            The remaining steps, ending with DONE, or an empty list if no
+            usable plan was produced
+        """
+        done = "\n".join(f"{i}. {step}" for i, step in enumerate(completed, 1)) or "(none)"
+        prompt = (
+            f"Goal: {goal}\n\n"
+            f"Steps already completed:\n{done}\n\n"
+            f"This step failed: {failed}\nError: {error}\n\n"
+            f"Current page:\n{page}\n\n"
+            "Plan only the remaining steps needed to reach the goal from the current page. "
+            "Do not repeat the completed steps, and do not repeat the failed step unchanged."
+        )
+        console.print("[bold magenta]Asking LLM to replan the remaining steps...[/bold magenta]")
+        steps = list(self._generate_steps(prompt, echo=False, deadline=deadline))
+        if not steps or steps[-1].command != "DONE":
+            console.print("[bold red]Warning: The replanned steps are malformed or incomplete.[/bold red]")
+            return []
+        return steps
+
+    def _generate_steps(self, prompt: str, echo: bool = False, stop: Optional[threading.Event] = None,
+                        deadline: Optional[Deadline] = None) -> Iterator[PlanStep]:
+        """
+        Streams schema-constrained plan steps from the LLM, stopping after DONE.
+
+        The response cache is bypassed: the stream is abandoned at DONE, so it
+        would never complete, and plans are cached by the plan cache instead.
+        """
+        plan = []
+        parser = PlanStreamParser()
+        tokens = self.llm.generate_stream(prompt, system_prompt=self.system_prompt, use_cache=False,
+                                          json_schema=self.plan_schema, deadline=deadline)
+        try:
+            for token in tokens:
+                if stop is not None and stop.is_set():
+                    return
+                if echo:
+                    console.print(token, end="", markup=False, highlight=False)
+                try:
+                    steps = parser.feed(token)
+                except ValueError as e:
+                    console.print(f"\n[bold red]The generated plan is malformed: {e}[/bold red]")
+                    return
+                for step in steps:
+                    plan.append(step)
+                    yield step
+                if plan and plan[-1].command == "DONE":
+                    break
+        finally:
+            tokens.close()
+        if echo:
+            console.print()
+
+    def _cached_plan(self, prompt: str) -> Optional[List[PlanStep]]:
+        """
+        Returns the cached plan for a prompt, ignoring entries that are not typed steps.
+        """
+        cached = self.plan_cache.get(prompt)
+        if not cached:
+            return None
+        try:
+            return [PlanStep.from_dict(step) for step in cached]
+        except ValueError:
+            return None
+
+    def record_outcome(self, prompt: str, success: bool) -> None:
+        """
+        Records whether the plan for a prompt executed successfully.
+        Failed plans are evicted so the next request generates a fresh plan.
+        """
+        self.plan_cache.record_outcome(prompt, success)
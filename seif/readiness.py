@@ -0,0 +1,177 @@
+# seifcli/seif/readiness.py
+
+import time
+from typing import Dict, List, Optional
+from rich.console import Console
+
+console = Console()
+
+# Conditions a page can be waited on:
+#   load          document.readyState is "complete"
+#   dom_quiet     no DOM mutations for dom_quiet_ms
+#   network_idle  no fetch/XHR in flight for network_idle_ms
+#   url_changed   the URL differs from the one before the action
+CONDITIONS = ("load", "dom_quiet", "network_idle", "url_changed")
+
+# Conditions waited on after each command, overridable with browser.readiness.
+# network_idle is soft after a command: pages that poll never go idle, so it is
+# given up on after browser.network_idle_timeout while the others are still awaited.
+DEFAULT_READINESS = {
+    "GOTO": ["load", "dom_quiet", "network_idle"],
+    "CLICK": ["load", "dom_quiet", "network_idle"],
+    "SUBMIT": ["load", "dom_quiet", "network_idle"],
+    "TYPE": ["dom_quiet"],
+    "SCROLL": ["dom_quiet"],
+}
+
+# Tracks DOM mutations and in-flight fetch/XHR requests in window.__seifReadiness.
+# Injected into every new document and installed on demand if that failed.
+INSTALL_SCRIPT = """
+(() => {
+if (window.__seifReadiness) { return; }
+const state = window.__seifReadiness = { lastMutation: Date.now(), lastNetwork: Date.now(), pending: 0 };
+new MutationObserver(() => { state.lastMutation = Date.now(); })
+    .observe(document, { childList: true, subtree: true, attributes: true, characterData: true });
+const started = () => { state.pending++; state.lastNetwork = Date.now(); };
+const finished = () => { state.pending = Math.max(0, state.pending - 1); state.lastNetwork = Date.now(); };
+if (window.fetch) {
+    const fetch = window.fetch;
+    window.fetch = function () {
+        started();
+        try { return fetch.apply(this, arguments).finally(finished); } catch (e) { finished(); throw e; }
+    };
+}
+const send = XMLHttpRequest.prototype.send;
+XMLHttpRequest.prototype.send = function () {
+    started();
+    this.addEventListener('loadend', finished, { once: true });
+    try { return send.apply(this, arguments); } catch (e) { finished(); throw e; }
+};
+})();
+"""
+
+# Resolves with the conditions still unmet once all are met or the timeout passes,
+# polling inside the page so a wait costs a single WebDriver round trip. After
+# idleCapMs network_idle no longer holds the wait up.
+WAIT_SCRIPT = INSTALL_SCRIPT + """
+const [conditions, quietMs, idleMs, since, timeoutMs, idleCapMs, startUrl, done] = arguments;
+const state = window.__seifReadiness;
+const started = Date.now();
+const unmet = () => conditions.filter((condition) => {
+    const now = Date.now();
+    switch (condition) {
+        case 'load': return document.readyState !== 'complete';
+        case 'dom_quiet': return now - Math.max(state.lastMutation, since) < quietMs;
+        case 'network_idle': return state.pending > 0 || now - Math.max(state.lastNetwork, since) < idleMs;
+        case 'url_changed': return location.href === startUrl;
+        default: return false;
+    }
+});
+const poll = () => {
+    const pending = unmet();
+    const elapsed = Date.now() - started;
+    const blocking = elapsed >= idleCapMs ? pending.filter((condition) => condition !== 'network_idle') : pending;
+    if (!blocking.length || elapsed >= timeoutMs) { done(pending); } else { setTimeout(poll, 25); }
+};
+poll();
+"""
+
+
+class Readiness:
+    """
+    Waits for a page to settle after an action, based on events observed
+    inside the page rather than fixed sleeps.
+
+    Which conditions are waited on is configurable per command with
+    browser.readiness, e.g. {"CLICK": ["url_changed", "load"], "TYPE": []}.
+    Waits are best effort: they end at browser.readiness_timeout, and the
+    caller decides whether unmet conditions are an error. Waits after a
+    command stop holding out for network_idle after browser.network_idle_timeout.
+    """
+
+    def __init__(self, config: Optional[Dict] = None):
+        """
+        Raises:
+            ValueError: If browser.readiness names an unknown condition
+        """
+        config = config or {}
+        self.commands = dict(DEFAULT_READINESS)
+        for command, conditions in (config.get("readiness") or {}).items():
+            unknown = set(conditions) - set(CONDITIONS)
+            if unknown:
+                raise ValueError(f"Unknown readiness condition(s) for {command}: {', '.join(sorted(unknown))}. "
+                                 f"Available: {', '.join(CONDITIONS)}")
+            self.commands[command.upper()] = list(conditions)
+        self.quiet_ms = config.get("dom_quiet_ms", 250)
+        self.idle_ms = config.get("network_idle_ms", 400)
+        self.timeout = config.get("readiness_timeout", 10)
+        self.idle_timeout = config.get("network_idle_timeout", 2)
+
+    def conditions_for(self, command: str) -> List[str]:
+        return self.commands.get(command.upper(), [])
+
+    def install(self, driver) -> bool:
+        """
+        Inject the tracker into every document the driver loads from now on.
+
+        Returns:
+            False if the DevTools protocol is unavailable; the tracker is then
+            installed by the first wait on each page instead
+        """
+        try:
+            driver.set_script_timeout(self.timeout + 5)
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": INSTALL_SCRIPT})
+            return True
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not inject the readiness tracker: {e}[/yellow]")
+            return False
+
+    def wait(self, driver, conditions: List[str], timeout: Optional[float] = None,
+             since: Optional[float] = None, start_url: str = "",
+             quiet_ms: Optional[int] = None, idle_ms: Optional[int] = None,
+             idle_timeout: Optional[float] = None) -> List[str]:
+        """
+        Wait until every condition holds.
+
+        Args:
+            driver: The WebDriver of the page
+            conditions: Conditions from CONDITIONS
+            timeout: Seconds to wait at most; defaults to browser.readiness_timeout
+            since: Epoch seconds of the action; activity before it is ignored
+                and quiet periods are counted from it
+            start_url: The URL before the action, for url_changed
+            quiet_ms: DOM quiet period, overriding browser.dom_quiet_ms
+            idle_ms: Network idle period, overriding browser.network_idle_ms
+            idle_timeout: Seconds after which network_idle stops holding up
+                the wait; by default it is waited on for the whole timeout
+
+        Returns:
+            The conditions still unmet when the wait ended; empty once the page is
+            ready. A given-up network_idle is included.
+        """
+        if not conditions:
+            return []
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        ends_at = started + timeout
+        since_ms = int((since if since is not None else time.time()) * 1000)
+        unmet = list(conditions)
+        # A navigation interrupts a wait once; repeated errors mean the page is gone
+        for _ in range(3):
+            remaining = ends_at - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                return driver.execute_async_script(
+                    WAIT_SCRIPT, list(conditions),
+                    self.quiet_ms if quiet_ms is None else quiet_ms,
+                    self.idle_ms if idle_ms is None else idle_ms,
+                    since_ms, int(remaining * 1000),
+                    int(remaining * 1000 if idle_timeout is None
+                        else max(0.0, idle_timeout - (time.monotonic() - started)) * 1000),
+                    start_url
+                ) or []
+            except Exception:
+                # The document was replaced mid-wait by a navigation; wait on the new one
+                time.sleep(0.05)
+        return unmet
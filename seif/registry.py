@@ -0,0 +1,130 @@
+# seifcli/seif/registry.py
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+from rich.console import Console
+
+from .config import config
+
+console = Console()
+
+_clients: Dict[Tuple[str, Optional[str]], Any] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(provider: str, host: Optional[str] = None, factory: Optional[Callable[[], Any]] = None):
+    """
+    Return the process-wide client for a (provider, host) pair, creating it on first use.
+    
+    Args:
+        provider: The LLM provider name
+        host: The server address, or None for the provider default
+        factory: Callable that builds the client when it does not exist yet
+        
+    Returns:
+        The shared client instance
+    """
+    key = (provider, host)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            if factory is None:
+                if provider != "ollama":
+                    raise ValueError(f"No default client factory for provider '{provider}'")
+                import ollama
+                factory = lambda: ollama.Client(host=host)
+            client = factory()
+            _clients[key] = client
+        return client
+
+
+def reset_clients() -> None:
+    """Forget all shared clients so the next lookup creates fresh ones."""
+    with _clients_lock:
+        _clients.clear()
+
+
+class ModelAvailabilityCache:
+    """
+    Short-lived record of which models a server is known to have.
+    
+    Entries are persisted under the config dir so subsequent CLI invocations can
+    skip the model-listing round trip while the entry is still fresh.
+    """
+    
+    def __init__(self, path: Optional[Path] = None, ttl: Optional[float] = None):
+        self.path = Path(path) if path else config.get_config_dir() / "cache" / "models.json"
+        self.ttl = ttl if ttl is not None else config.get("cache", "model_check_ttl", 300)
+        self._lock = threading.Lock()
+        self.entries = self._load()
+    
+    @staticmethod
+    def _key(provider: str, host: Optional[str], model: str) -> str:
+        return f"{provider}|{host or 'default'}|{model}"
+    
+    def _load(self) -> Dict[str, Dict]:
+        """Load availability entries from disk."""
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+    
+    def _save(self) -> None:
+        """Persist availability entries to disk. Caller must hold the lock."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, indent=2)
+            tmp_path.replace(self.path)
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not save model availability cache: {e}[/yellow]")
+    
+    def is_available(self, provider: str, host: Optional[str], model: str) -> bool:
+        """
+        Check whether a model was recently confirmed to be available.
+        
+        Returns:
+            True if a fresh positive entry exists, False if unknown or stale
+        """
+        with self._lock:
+            entry = self.entries.get(self._key(provider, host, model))
+        return bool(entry and entry["available"] and time.time() - entry["checked_at"] < self.ttl)
+    
+    def mark(self, provider: str, host: Optional[str], model: str, available: bool = True) -> None:
+        """
+        Record the result of a model availability check.
+        """
+        with self._lock:
+            self.entries[self._key(provider, host, model)] = {
+                "available": available,
+                "checked_at": time.time()
+            }
+            self._save()
+    
+    def forget(self, provider: str, host: Optional[str], model: str) -> None:
+        """
+        Drop the entry for a model, forcing the next check to hit the server.
+        """
+        with self._lock:
+            if self.entries.pop(self._key(provider, host, model), None) is not None:
+                self._save()
+
+
+_availability = None
+_availability_lock = threading.Lock()
+
+
+def get_model_availability() -> ModelAvailabilityCache:
+    """Return the process-wide model availability cache."""
+    global _availability
+    with _availability_lock:
+        if _availability is None:
+            _availability = ModelAvailabilityCache()
+        return _availability
@@ -0,0 +1,179 @@
+# seifcli/seif/selector_cache.py
+
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from rich.console import Console
+
+from .config import config
+
+console = Console()
+
+# Path segments that identify a record rather than a page type: numbers,
+# hex ids, UUIDs and long tokens mixing letters and digits
+_VARIABLE_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-f]{8,}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|"
+    r"(?=[^/]*\d)[\w-]{16,})$",
+    re.IGNORECASE
+)
+
+
+class SelectorCache:
+    """
+    Cache of element resolutions learned from past runs.
+
+    Keyed on the domain, the URL path pattern and the selector the plan asked
+    for, each entry holds the concrete selector and lookup strategy that found
+    a usable element. The browser tries a cached resolution before its full
+    search, counts a hit when it still matches and drops it when it does not.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_entries: Optional[int] = None):
+        self.path = Path(path) if path else config.get_config_dir() / "cache" / "selectors.json"
+        self.max_entries = max_entries or config.get("cache", "max_selectors", 2000)
+        self._lock = threading.Lock()
+        self.entries = self._load()
+
+    @staticmethod
+    def page_key(url: str) -> Tuple[str, str]:
+        """
+        The (domain, path pattern) of a URL.
+
+        The domain drops a leading "www." and path segments that look like
+        identifiers become "*", so /issues/123 and /issues/456 share entries.
+        """
+        parsed = urlparse(url or "")
+        domain = (parsed.hostname or "").lower()
+        if domain.startswith("www."):
+            domain = domain[4:]
+        segments = ["*" if _VARIABLE_SEGMENT.match(segment) else segment
+                    for segment in parsed.path.split("/") if segment]
+        return domain, "/" + "/".join(segments)
+
+    def _key(self, url: str, selector: str) -> str:
+        domain, path = self.page_key(url)
+        return f"{domain}{path} {selector}"
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load cached resolutions from disk."""
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not load selector cache: {e}[/yellow]")
+            return {}
+
+    def _save(self) -> None:
+        """Persist cached resolutions to disk. Caller must hold the lock."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, indent=2)
+            tmp_path.replace(self.path)
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not save selector cache: {e}[/yellow]")
+
+    def get(self, url: str, selector: str) -> Optional[List[str]]:
+        """
+        Return the cached resolution of a selector on a page.
+
+        Args:
+            url: The URL of the page
+            selector: The selector as requested by the plan
+
+        Returns:
+            The [selector, strategy] pair that last worked, or None on a miss
+        """
+        with self._lock:
+            entry = self.entries.get(self._key(url, selector))
+            return [entry["selector"], entry["strategy"]] if entry else None
+
+    def hit(self, url: str, selector: str) -> None:
+        """Record that the cached resolution of a selector still matched."""
+        with self._lock:
+            entry = self.entries.get(self._key(url, selector))
+            if not entry:
+                return
+            entry["hits"] = entry.get("hits", 0) + 1
+            entry["last_used"] = time.time()
+            self._save()
+
+    def store(self, url: str, selector: str, resolved_selector: str, strategy: str) -> None:
+        """
+        Store the resolution that found a usable element for a selector.
+
+        Args:
+            url: The URL of the page
+            selector: The selector as requested by the plan
+            resolved_selector: The selector that matched the element
+            strategy: The lookup strategy resolved_selector is used with
+        """
+        domain, path = self.page_key(url)
+        with self._lock:
+            self.entries[self._key(url, selector)] = {
+                "domain": domain,
+                "path": path,
+                "requested": selector,
+                "selector": resolved_selector,
+                "strategy": strategy,
+                "created_at": time.time(),
+                "last_used": time.time(),
+                "hits": 0
+            }
+            self._evict()
+            self._save()
+
+    def invalidate(self, url: str, selector: str) -> None:
+        """Drop the cached resolution of a selector that no longer matches."""
+        with self._lock:
+            if self.entries.pop(self._key(url, selector), None) is not None:
+                self._save()
+
+    def _evict(self) -> None:
+        """Drop the least recently used resolutions beyond the size bound. Caller must hold the lock."""
+        overflow = len(self.entries) - self.max_entries
+        if overflow <= 0:
+            return
+        oldest = sorted(self.entries, key=lambda k: self.entries[k].get("last_used", 0))
+        for key in oldest[:overflow]:
+            del self.entries[key]
+
+    def stats(self) -> Dict:
+        """Entry, domain and hit counts."""
+        with self._lock:
+            return {
+                "entries": len(self.entries),
+                "domains": len({entry.get("domain") for entry in self.entries.values()}),
+                "hits": sum(entry.get("hits", 0) for entry in self.entries.values())
+            }
+
+    def clear(self) -> None:
+        """Remove all cached resolutions."""
+        with self._lock:
+            self.entries = {}
+            self._save()
+
+
+_selector_cache = None
+_selector_cache_lock = threading.Lock()
+
+
+def get_selector_cache() -> Optional[SelectorCache]:
+    """
+    Returns the process-wide selector cache, shared by every browser, or None if it is disabled.
+    """
+    global _selector_cache
+    if not config.get("cache", "selectors", True):
+        return None
+
+    with _selector_cache_lock:
+        if _selector_cache is None:
+            _selector_cache = SelectorCache()
+        return _selector_cache
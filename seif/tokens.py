@@ -0,0 +1,52 @@
+# seifcli/seif/tokens.py
+
+import math
+import re
+from typing import Callable, Dict, Optional
+
+# Tokens a chat template spends framing each message (role markers, separators)
+MESSAGE_OVERHEAD = 4
+
+_WORD_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def approximate_tokens(text: str) -> int:
+    """
+    Cheap token estimate for when the model's tokenizer is not available.
+    
+    BPE tokenizers average roughly four characters per token on English text
+    but split punctuation and rare words further, so the larger of the
+    character-based and word/punctuation-based estimates is used.
+    """
+    if not text:
+        return 0
+    return max(math.ceil(len(text) / 4), len(_WORD_RE.findall(text)))
+
+
+def message_tokens(content: str, count: Callable[[str], int] = approximate_tokens) -> int:
+    """
+    Count the tokens a chat message costs, including its framing overhead.
+    """
+    return count(content) + MESSAGE_OVERHEAD
+
+
+_tiktoken_encoders: Dict[str, object] = {}
+
+
+def tiktoken_counter(model: str) -> Optional[Callable[[str], int]]:
+    """
+    Return a tiktoken-based counter for OpenAI models, or None if tiktoken is not installed.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    
+    encoder = _tiktoken_encoders.get(model)
+    if encoder is None:
+        try:
+            encoder = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoder = tiktoken.get_encoding("cl100k_base")
+        _tiktoken_encoders[model] = encoder
+    return lambda text: len(encoder.encode(text, disallowed_special=()))
@@ -0,0 +1,44 @@
+import json
+
+import seif.agent as agent_module
+from seif.agent import Agent
+from seif.config import Config
+
+
+def _configure(monkeypatch, tmp_path, settings):
+    """Point the global config at a config.json holding settings."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    config = Config()
+    config.config_file.write_text(json.dumps(settings))
+    monkeypatch.setattr(agent_module, "global_config", Config())
+
+
+def test_config_json_reaches_the_agent(monkeypatch, tmp_path):
+    _configure(monkeypatch, tmp_path, {
+        "recovery": {"unattended": True, "max_retries": 5},
+        "execution": {"max_parallel_branches": 6, "checkpoints": False},
+        "browser": {"pacing": "fast", "readiness": {"CLICK": ["url_changed"]}}
+    })
+
+    config = Agent().config
+
+    assert config["recovery"]["unattended"] is True
+    assert config["recovery"]["max_retries"] == 5
+    assert config["recovery"]["retry_backoff"] == 1.0
+    assert config["execution"]["max_parallel_branches"] == 6
+    assert config["execution"]["checkpoints"] is False
+    assert config["execution"]["max_step_seconds"] == 60
+    assert config["browser"]["pacing"] == "fast"
+    assert config["browser"]["readiness"] == {"CLICK": ["url_changed"]}
+
+
+def test_config_path_overrides_config_json(monkeypatch, tmp_path):
+    _configure(monkeypatch, tmp_path, {"recovery": {"max_retries": 5, "max_replans": 4}})
+    override = tmp_path / "agent.json"
+    override.write_text(json.dumps({"recovery": {"max_retries": 1}}))
+
+    config = Agent(config_path=str(override)).config
+
+    assert config["recovery"]["max_retries"] == 1
+    assert config["recovery"]["max_replans"] == 4
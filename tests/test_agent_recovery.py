@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+
+from seif.agent import Agent
+from seif.plan import PlanStep
+
+
+class FakeBrowser:
+    driver = True
+    pacer = SimpleNamespace(slept=0.0)
+
+    def close(self):
+        pass
+
+    def get_state(self):
+        return {"url": "https://example.com/", "cookies": []}
+
+    def describe_page(self):
+        return "URL: https://example.com/"
+
+
+def _agent(tmp_path, require_confirmation: bool):
+    agent = Agent()
+    agent.config["recovery"].update(unattended=True, retry_backoff=0.01)
+    agent.config["security"]["require_confirmation"] = require_confirmation
+    agent.config["execution"]["checkpoints"] = False
+    agent.config["logging"].update(save_screenshots_on_error=False, log_file=str(tmp_path / "execution.log"))
+    agent._initialize_browser = lambda: setattr(agent, "browser", FakeBrowser())
+    agent.executed = []
+    agent._execute_command = lambda command, args, step, browser=None: agent.executed.append(command)
+    return agent
+
+
+PLAN = [PlanStep("GOTO", ["github.com"]), PlanStep("CLICK", ["#delete"]), PlanStep("DONE")]
+
+
+def test_unattended_run_stops_at_a_step_needing_confirmation(tmp_path):
+    agent = _agent(tmp_path, require_confirmation=True)
+
+    assert not agent.execute_task("delete the repository", plan=list(PLAN), optimize=False)
+
+    assert agent.executed == ["GOTO"]
+    assert agent.execution_log[-1]["error"] == "Confirmation required in unattended mode"
+
+
+def test_unattended_run_proceeds_when_confirmation_is_turned_off(tmp_path):
+    agent = _agent(tmp_path, require_confirmation=False)
+
+    assert agent.execute_task("delete the repository", plan=list(PLAN), optimize=False)
+
+    assert agent.executed == ["GOTO", "CLICK", "DONE"]
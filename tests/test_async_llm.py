@@ -0,0 +1,86 @@
+import asyncio
+
+import seif.llm as llm_module
+from seif.llm import AsyncLLM
+
+
+class SlowClient:
+    """Stands in for ollama.AsyncClient, answering every chat after a fixed delay."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+
+    async def chat(self, model, messages, options=None, stream=False):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return {"message": {"content": "ok " + messages[-1]["content"]}}
+
+
+def _client(monkeypatch, delay: float, max_concurrency: int) -> AsyncLLM:
+    monkeypatch.setattr(llm_module, "get_response_cache", lambda: None)
+    client = AsyncLLM(model="test", max_concurrency=max_concurrency)
+    client.client = SlowClient(delay)
+    return client
+
+
+def test_queued_requests_do_not_count_toward_timeout(monkeypatch):
+    client = _client(monkeypatch, delay=0.2, max_concurrency=1)
+    prompts = [f"p{i}" for i in range(4)]
+
+    results = asyncio.run(client.generate_many(prompts, timeout=0.3))
+
+    assert results == ["ok p0", "ok p1", "ok p2", "ok p3"]
+    assert client.client.peak == 1
+
+
+def test_slow_request_times_out(monkeypatch):
+    client = _client(monkeypatch, delay=0.5, max_concurrency=2)
+
+    result = asyncio.run(client.generate("p", timeout=0.1))
+
+    assert result == "Error: request timed out."
+
+
+def test_cancelled_request_does_not_cancel_identical_requests(monkeypatch):
+    client = _client(monkeypatch, delay=0.2, max_concurrency=2)
+    client.client.requests = 0
+    chat = client.client.chat
+
+    async def counting_chat(*args, **kwargs):
+        client.client.requests += 1
+        return await chat(*args, **kwargs)
+
+    client.client.chat = counting_chat
+
+    async def run():
+        leader = asyncio.create_task(client.generate("p"))
+        await asyncio.sleep(0.05)
+        followers = [asyncio.create_task(client.generate("p")) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        leader.cancel()
+        return await asyncio.gather(*followers), leader.cancelled()
+
+    results, leader_cancelled = asyncio.run(run())
+
+    assert leader_cancelled
+    assert results == ["ok p", "ok p"]
+    assert client.client.requests == 2
+
+
+def test_aclose_releases_the_connection_pool(monkeypatch):
+    client = _client(monkeypatch, delay=0, max_concurrency=1)
+    closed = []
+
+    async def aclose():
+        closed.append(True)
+
+    monkeypatch.setattr(client._transport, "aclose", aclose)
+    asyncio.run(client.aclose())
+
+    assert closed == [True]
@@ -0,0 +1,73 @@
+import os
+import subprocess
+import sys
+import threading
+import types
+
+from seif import browser_pool
+from seif.browser_pool import BrowserPool, _pid_alive
+
+
+def dead_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def test_lock_held_by_a_live_process_is_not_broken(tmp_path):
+    pool = BrowserPool(browser_config={}, root=tmp_path)
+    tmp_path.mkdir(exist_ok=True)
+    pool.lock_path.write_text(str(os.getpid()))
+    acquired = threading.Event()
+
+    def lock():
+        with pool._locked():
+            acquired.set()
+
+    threading.Thread(target=lock, daemon=True).start()
+
+    assert not acquired.wait(0.5)
+    pool.lock_path.unlink()
+    assert acquired.wait(2)
+
+
+def test_lock_left_by_a_dead_process_is_broken(tmp_path):
+    pool = BrowserPool(browser_config={}, root=tmp_path)
+    pool.lock_path.write_text(str(dead_pid()))
+
+    with pool._locked():
+        assert pool.lock_path.read_text() == str(os.getpid())
+    assert not pool.lock_path.exists()
+
+
+def test_driver_is_resolved_outside_the_lock(tmp_path, monkeypatch):
+    pool = BrowserPool(browser_config={}, root=tmp_path)
+    driver = tmp_path / "chromedriver"
+    driver.write_text("")
+
+    class Manager:
+        def install(self):
+            assert not pool.lock_path.exists()
+            return str(driver)
+
+    monkeypatch.setattr(browser_pool, "ChromeDriverManager", Manager)
+
+    assert pool._driver_path() == str(driver)
+    assert pool._load()["driver_path"] == str(driver)
+
+
+def test_pid_alive_does_not_signal_processes_on_windows(monkeypatch):
+    def kill(*args):
+        raise AssertionError("os.kill terminates processes on Windows")
+
+    monkeypatch.setattr(browser_pool, "os", types.SimpleNamespace(name="nt", kill=kill))
+    monkeypatch.setitem(sys.modules, "psutil", types.SimpleNamespace(pid_exists=lambda pid: pid == 1234))
+
+    assert _pid_alive(1234)
+    assert not _pid_alive(4321)
+
+
+def test_pid_alive():
+    assert _pid_alive(os.getpid())
+    assert not _pid_alive(dead_pid())
+    assert not _pid_alive(None)
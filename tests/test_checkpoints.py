@@ -0,0 +1,89 @@
+import os
+from types import SimpleNamespace
+
+from seif.agent import Agent
+from seif.checkpoints import Checkpoint, CheckpointStore
+from seif.plan import PlanStep
+
+PLAN = [PlanStep("GOTO", ["github.com"]), PlanStep("CLICK", ["#delete"]), PlanStep("DONE")]
+
+
+def test_checkpoint_round_trips_through_the_store(tmp_path):
+    store = CheckpointStore(tmp_path)
+    checkpoint = Checkpoint("run-1", "delete the repository", list(PLAN), next_step=1,
+                            url="https://github.com/", cookies=[{"name": "session", "value": "x"}])
+
+    store.save(checkpoint)
+    loaded = store.get("run-1")
+
+    assert loaded.to_dict() == checkpoint.to_dict()
+    assert loaded.resumable
+
+
+def test_checkpoint_files_are_private(tmp_path):
+    CheckpointStore(tmp_path).save(Checkpoint("run-1", "", list(PLAN)))
+
+    assert os.stat(tmp_path / "run-1.json").st_mode & 0o777 == 0o600
+    assert list(tmp_path.iterdir()) == [tmp_path / "run-1.json"]
+
+
+def test_finished_runs_are_not_resumable():
+    assert not Checkpoint("run-1", "", list(PLAN), next_step=1, status="succeeded").resumable
+    assert not Checkpoint("run-1", "", list(PLAN), next_step=3, status="failed").resumable
+
+
+def test_runs_are_listed_most_recent_first_and_can_be_deleted(tmp_path):
+    store = CheckpointStore(tmp_path)
+    for run_id in ["run-1", "run-2"]:
+        store.save(Checkpoint(run_id, "", list(PLAN)))
+
+    assert [checkpoint.run_id for checkpoint in store.list()] == ["run-2", "run-1"]
+    assert store.delete("run-2")
+    assert not store.delete("run-2")
+    assert store.get("run-2") is None
+
+
+class FakeBrowser:
+    driver = True
+    pacer = SimpleNamespace(slept=0.0)
+    restored = None
+
+    def close(self):
+        pass
+
+    def get_state(self):
+        return {"url": "https://github.com/", "cookies": [{"name": "session", "value": "x"}]}
+
+    def restore_state(self, url, cookies):
+        FakeBrowser.restored = (url, cookies)
+        return None
+
+    def describe_page(self):
+        return "URL: https://github.com/"
+
+
+def _agent(tmp_path, require_confirmation: bool):
+    agent = Agent()
+    agent.checkpoints = CheckpointStore(tmp_path / "runs")
+    agent.config["recovery"]["unattended"] = True
+    agent.config["security"]["require_confirmation"] = require_confirmation
+    agent.config["logging"].update(save_screenshots_on_error=False, log_file=str(tmp_path / "execution.log"))
+    agent._initialize_browser = lambda: setattr(agent, "browser", FakeBrowser())
+    agent.executed = []
+    agent._execute_command = lambda command, args, step, browser=None: agent.executed.append(command)
+    return agent
+
+
+def test_stopped_run_resumes_after_its_last_completed_step(tmp_path):
+    agent = _agent(tmp_path, require_confirmation=True)
+    assert not agent.execute_task("delete the repository", plan=list(PLAN), optimize=False)
+
+    checkpoint, = agent.checkpoints.list()
+    assert (checkpoint.next_step, checkpoint.status) == (1, "aborted")
+
+    resumed = _agent(tmp_path, require_confirmation=False)
+    assert resumed.resume(checkpoint.run_id)
+
+    assert resumed.executed == ["CLICK", "DONE"]
+    assert FakeBrowser.restored == ("https://github.com/", [{"name": "session", "value": "x"}])
+    assert resumed.checkpoints.list() == []
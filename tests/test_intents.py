@@ -0,0 +1,39 @@
+import pytest
+
+from seif.intents import IntentMatcher
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return IntentMatcher()
+
+
+def _plan(matcher, text):
+    steps = matcher.match(text)
+    return [str(step) for step in steps] if steps is not None else None
+
+
+@pytest.mark.parametrize("text, url", [
+    ("go to github.com", "github.com"),
+    ("open https://intranet.corp/wiki", "https://intranet.corp/wiki"),
+    ("visit www.example.pdf", "www.example.pdf"),
+    ("open github.com/settings.json", "github.com/settings.json"),
+    ("navigate to news.ycombinator.com", "news.ycombinator.com"),
+])
+def test_web_addresses_are_opened(matcher, text, url):
+    assert _plan(matcher, text) == [f'GOTO "{url}"', "DONE"]
+
+
+@pytest.mark.parametrize("text", [
+    "open settings.json",
+    "open report.pdf and scroll down",
+    "open notes.md",
+    "load config.yaml",
+    "open main.py",
+])
+def test_file_names_go_to_the_planner(matcher, text):
+    assert matcher.match(text) is None
+
+
+def test_compound_command(matcher):
+    assert _plan(matcher, "go to github.com and scroll down") == ['GOTO "github.com"', 'SCROLL "down"', "DONE"]
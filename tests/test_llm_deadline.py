@@ -0,0 +1,73 @@
+import threading
+import time
+
+import pytest
+
+import seif.llm as llm_module
+from seif.deadline import Deadline, DeadlineExceeded
+from seif.llm import LLM
+
+
+class HangingOllama:
+    """Stands in for the Ollama client of a server that accepts requests but never answers."""
+
+    def __init__(self, stall_after: int = 0):
+        self.stall_after = stall_after
+        self.released = threading.Event()
+
+    def list(self):
+        return {"models": [{"name": "test"}]}
+
+    def chat(self, model, messages, stream=False, **kwargs):
+        if not stream:
+            self.released.wait()
+            return {"message": {"content": "late"}}
+        return self._stream()
+
+    def _stream(self):
+        for _ in range(self.stall_after):
+            yield {"message": {"content": "token "}}
+        self.released.wait()
+        yield {"message": {"content": "late"}, "done": True}
+
+
+def _llm(monkeypatch, client: HangingOllama) -> LLM:
+    monkeypatch.setattr(llm_module.registry, "get_client", lambda *args, **kwargs: client)
+    monkeypatch.setattr(llm_module, "get_response_cache", lambda: None)
+    return LLM(model="test")
+
+
+def test_stalled_request_is_abandoned_at_the_deadline(monkeypatch):
+    client = HangingOllama()
+    llm = _llm(monkeypatch, client)
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        llm.generate("plan this", deadline=Deadline(0.3))
+
+    assert time.monotonic() - started < 2
+    client.released.set()
+
+
+def test_stalled_stream_is_abandoned_at_the_deadline(monkeypatch):
+    client = HangingOllama(stall_after=2)
+    llm = _llm(monkeypatch, client)
+    tokens = []
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        for token in llm.generate_stream("plan this", deadline=Deadline(0.3)):
+            tokens.append(token)
+
+    assert tokens == ["token ", "token "]
+    assert time.monotonic() - started < 2
+    client.released.set()
+
+
+def test_request_within_the_deadline_completes(monkeypatch):
+    client = HangingOllama(stall_after=2)
+    client.released.set()
+    llm = _llm(monkeypatch, client)
+
+    assert "".join(llm.generate_stream("plan this", deadline=Deadline(5))) == "token token late"
+    assert llm.generate("plan this", deadline=Deadline(5)) == "late"
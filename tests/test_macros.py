@@ -0,0 +1,66 @@
+import pytest
+
+from seif.macros import Macro, MacroLibrary, parameterize
+from seif.plan import PlanStep
+
+STEPS = [
+    PlanStep("GOTO", ["https://github.com/search?q=llama"]),
+    PlanStep("TYPE", ["input[name='q']", "llama"]),
+    PlanStep("CLICK", ["button[type='submit']"]),
+    PlanStep("DONE")
+]
+
+
+def test_named_parameters_replace_every_occurrence():
+    steps, params = parameterize(STEPS, {"query": "llama", "unused": "nothing"})
+
+    assert [str(step) for step in steps[:2]] == [
+        'GOTO "https://github.com/search?q={query}"',
+        'TYPE "input[name=\'q\']" "{query}"'
+    ]
+    assert params == {"query": "llama"}
+
+
+def test_typed_text_becomes_a_parameter_by_default():
+    steps, params = parameterize(STEPS + [PlanStep("TYPE", ["#other", "alpaca"])])
+
+    assert steps[1].args[1] == "{text}"
+    assert steps[-1].args[1] == "{text2}"
+    assert params == {"text": "llama", "text2": "alpaca"}
+
+
+def test_bind_substitutes_values_and_keeps_recorded_defaults():
+    steps, params = parameterize(STEPS, {"query": "llama"})
+    macro = Macro("search", "search github for llama", steps, params)
+
+    assert macro.bind({"query": "vicuna"})[0].args == ["https://github.com/search?q=vicuna"]
+    assert macro.bind()[1].args == ["input[name='q']", "llama"]
+
+
+def test_bind_rejects_unknown_parameters():
+    macro = Macro("search", "", STEPS, {"query": "llama"})
+
+    with pytest.raises(ValueError, match="Available: query"):
+        macro.bind({"term": "vicuna"})
+
+
+def test_library_saves_lists_and_deletes_macros(tmp_path):
+    library = MacroLibrary(tmp_path)
+    steps, params = parameterize(STEPS, {"query": "llama"})
+    library.save(Macro("search", "search github for llama", steps, params))
+
+    reopened = MacroLibrary(tmp_path)
+    assert reopened.get("search").bind({"query": "x"})[1].args[1] == "x"
+    assert reopened.list()["search"]["params"] == ["query"]
+
+    reopened.record_run("search")
+    assert MacroLibrary(tmp_path).list()["search"]["runs"] == 1
+
+    assert reopened.delete("search")
+    assert reopened.get("search") is None
+    assert not reopened.delete("search")
+
+
+def test_invalid_macro_names_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        MacroLibrary(tmp_path).save(Macro("../escape", "", STEPS))
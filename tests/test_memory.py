@@ -0,0 +1,71 @@
+import seif.memory as memory_module
+from seif.memory import Memory
+
+
+def _memory(monkeypatch, tmp_path, max_tokens: int, counted=None) -> Memory:
+    """A Memory counting one token per word plus the framing overhead of 4 per message."""
+    monkeypatch.setattr(memory_module.config, "config_dir", tmp_path)
+
+    def count(text):
+        if counted is not None:
+            counted.append(text)
+        return len(text.split())
+
+    memory = Memory(token_counter=count)
+    memory.max_context_tokens = max_tokens
+    memory.auto_summarize = False
+    return memory
+
+
+def _contents(context):
+    return [message["content"] for message in context]
+
+
+def test_context_keeps_the_most_recent_messages_that_fit(monkeypatch, tmp_path):
+    memory = _memory(monkeypatch, tmp_path, max_tokens=15)
+    for text in ["one two three", "four five six", "seven eight", "nine ten"]:
+        memory.add_message("user", text)
+
+    # 6 + 6 tokens for the last two; the one before would add 7 more
+    assert _contents(memory.get_formatted_context()) == ["seven eight", "nine ten"]
+
+
+def test_system_messages_and_reserved_tokens_shrink_the_window(monkeypatch, tmp_path):
+    memory = _memory(monkeypatch, tmp_path, max_tokens=21)
+    memory.add_message("system", "be brief")
+    for text in ["one", "two", "three"]:
+        memory.add_message("user", text)
+
+    assert _contents(memory.get_formatted_context()) == ["be brief", "one", "two", "three"]
+    assert _contents(memory.get_formatted_context(reserve_tokens=6)) == ["be brief", "three"]
+    assert _contents(memory.get_formatted_context(include_system=False)) == ["one", "two", "three"]
+
+
+def test_latest_message_is_kept_even_when_it_exceeds_the_budget(monkeypatch, tmp_path):
+    memory = _memory(monkeypatch, tmp_path, max_tokens=5)
+    memory.add_message("user", "short")
+    memory.add_message("user", "a message far longer than the whole budget")
+
+    assert _contents(memory.get_formatted_context()) == ["a message far longer than the whole budget"]
+
+
+def test_messages_are_counted_once(monkeypatch, tmp_path):
+    counted = []
+    memory = _memory(monkeypatch, tmp_path, max_tokens=100, counted=counted)
+    for text in ["one", "two", "three"]:
+        memory.add_message("user", text)
+
+    memory.get_formatted_context(include_summary=False, include_system=False)
+    memory.get_formatted_context(include_summary=False, include_system=False)
+
+    assert counted == ["one", "two", "three"]
+
+
+def test_clear_resets_the_window(monkeypatch, tmp_path):
+    memory = _memory(monkeypatch, tmp_path, max_tokens=100)
+    memory.add_message("user", "hello")
+
+    memory.clear()
+    memory.add_message("user", "again")
+
+    assert _contents(memory.get_formatted_context()) == ["again"]
@@ -0,0 +1,99 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from seif.openai_backend import OpenAICompatBackend, OpenAICompatError
+
+
+class StubServer:
+    """A local OpenAI-compatible server answering with queued (status, body) replies."""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                stub.requests.append(json.loads(self.rfile.read(length)))
+                status, body = stub.replies.pop(0)
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                if status == 503:
+                    self.send_header("Retry-After", "0")
+                    self.send_header("Content-Type", "application/json")
+                else:
+                    # No charset, as many servers send it
+                    self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _events(*tokens: str) -> str:
+    chunks = [{"choices": [{"delta": {"content": token}}]} for token in tokens]
+    return "".join(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n" for chunk in chunks) + "data: [DONE]\n\n"
+
+
+@pytest.fixture
+def stub():
+    servers = []
+
+    def start(*replies):
+        server = StubServer(replies)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.close()
+
+
+def _backend(server: StubServer, max_retries: int = 3) -> OpenAICompatBackend:
+    return OpenAICompatBackend(server.url, max_retries=max_retries, backoff=0.01, total_timeout=10)
+
+
+def _stream(backend: OpenAICompatBackend):
+    return list(backend.stream([{"role": "user", "content": "hi"}], "test", 0.0, 16))
+
+
+def test_stream_yields_tokens(stub):
+    server = stub((200, _events("Hello", ", ", "world")))
+
+    assert _stream(_backend(server)) == ["Hello", ", ", "world"]
+    assert server.requests[0]["stream"] is True
+
+
+def test_stream_decodes_utf8(stub):
+    server = stub((200, _events("Café", " 日本")))
+
+    assert "".join(_stream(_backend(server))) == "Café 日本"
+
+
+def test_stream_retries_on_503(stub):
+    server = stub((503, "{}"), (503, "{}"), (200, _events("ok")))
+
+    assert _stream(_backend(server)) == ["ok"]
+    assert len(server.requests) == 3
+
+
+def test_retries_exhausted(stub):
+    server = stub((503, "{}"), (503, "{}"))
+
+    with pytest.raises(OpenAICompatError):
+        _stream(_backend(server, max_retries=1))
+    assert len(server.requests) == 2
@@ -0,0 +1,22 @@
+from seif.optimizer import PlanOptimizer
+from seif.plan import PlanStep
+
+
+def test_goto_is_emitted_before_the_next_step_is_planned():
+    produced = []
+
+    def plan():
+        for step in (PlanStep("GOTO", ["github.com"]), PlanStep("SCROLL", ["down"]), PlanStep("DONE", [])):
+            produced.append(step.command)
+            yield step
+
+    steps = PlanOptimizer().optimize(plan())
+
+    assert next(steps).command == "GOTO"
+    assert produced == ["GOTO"]
+
+
+def test_goto_to_the_current_page_is_dropped():
+    plan = [PlanStep("GOTO", ["github.com"]), PlanStep("GOTO", ["https://github.com/"]), PlanStep("DONE", [])]
+
+    assert [str(step) for step in PlanOptimizer().optimize(plan)] == ['GOTO "github.com"', "DONE"]
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from seif.plan import PlanStep, PlanStreamParser, build_plan_schema, command_signatures
+
+PLAN = json.dumps({"steps": [
+    {"command": "goto", "args": ["https://github.com"]},
+    {"command": "TYPE", "args": ["input[name='q']", "say \"hi\" {to} [all]"]},
+    {"command": "DONE", "args": []}
+]})
+
+
+def test_steps_are_returned_as_soon_as_they_are_complete():
+    parser = PlanStreamParser()
+    first_step_end = PLAN.index("}") + 1
+
+    assert parser.feed(PLAN[:first_step_end - 1]) == []
+    assert parser.feed(PLAN[first_step_end - 1:first_step_end]) == [PlanStep("GOTO", ["https://github.com"])]
+
+
+def test_plan_fed_one_character_at_a_time_is_parsed():
+    parser = PlanStreamParser()
+
+    steps = [step for char in PLAN for step in parser.feed(char)]
+
+    assert [str(step) for step in steps] == [
+        'GOTO "https://github.com"',
+        'TYPE "input[name=\'q\']" "say "hi" {to} [all]"',
+        "DONE"
+    ]
+
+
+def test_invalid_step_is_rejected():
+    with pytest.raises(ValueError):
+        PlanStreamParser().feed('{"steps": [{"args": ["no command"]}')
+
+
+def test_step_round_trips_through_its_json_form():
+    step = PlanStep("CLICK", ["#submit"])
+
+    assert PlanStep.from_dict(step.to_dict()) == step
+
+
+def test_skill_parameters_become_command_arguments():
+    def save_text(browser, filename, text="", append=False):
+        pass
+
+    signature = command_signatures({"SAVE_TEXT": save_text})["SAVE_TEXT"]
+
+    assert signature.required == ["filename"]
+    assert signature.optional == ["text", "append"]
+
+
+def test_schema_bounds_the_arguments_of_each_command():
+    schema = build_plan_schema(command_signatures())
+    variants = {variant["properties"]["command"]["enum"][0]: variant["properties"]["args"]
+                for variant in schema["properties"]["steps"]["items"]["anyOf"]}
+
+    assert (variants["TYPE"]["minItems"], variants["TYPE"]["maxItems"]) == (2, 2)
+    assert (variants["DONE"]["minItems"], variants["DONE"]["maxItems"]) == (0, 0)
+    assert variants["SCROLL"]["items"]["enum"] == ["up", "down", "top", "bottom"]
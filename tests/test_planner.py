@@ -0,0 +1,75 @@
+import json
+
+import seif.llm as llm_module
+from seif.llm import ResponseCache
+from seif.plan_cache import PlanCache
+from seif.planner import Planner
+
+PLAN = json.dumps({"steps": [
+    {"command": "GOTO", "args": ["https://github.com"]},
+    {"command": "DONE", "args": []}
+]})
+# What a model may go on to generate after DONE when nothing stops it
+TAIL = ", " + ", ".join(['{"command": "SCROLL", "args": ["down"]}'] * 50)
+
+
+class FakeOllama:
+    """Stands in for the Ollama client, streaming a fixed plan a few characters at a time."""
+
+    def __init__(self, content: str = PLAN):
+        self.content = content
+        self.requests = 0
+        self.chunks = 0
+
+    def list(self):
+        return {"models": [{"name": "test"}]}
+
+    def chat(self, model, messages, stream=False, **kwargs):
+        self.requests += 1
+        for i in range(0, len(self.content), 8):
+            self.chunks += 1
+            yield {"message": {"content": self.content[i:i + 8]}}
+
+
+def _planner(monkeypatch, tmp_path, client: FakeOllama, cache: ResponseCache) -> Planner:
+    monkeypatch.setattr(llm_module.registry, "get_client", lambda *args, **kwargs: client)
+    monkeypatch.setattr(llm_module, "get_response_cache", lambda: cache)
+    planner = Planner(model="test")
+    planner.plan_cache = PlanCache(tmp_path / "plans.json")
+    return planner
+
+
+def test_generation_stops_at_done(monkeypatch, tmp_path):
+    content = PLAN[:PLAN.rindex("]")] + TAIL + "]}"
+    client = FakeOllama(content)
+    planner = _planner(monkeypatch, tmp_path, client, ResponseCache(tmp_path / "responses.sqlite3"))
+
+    steps = [step.command for step in planner.stream_plan("open github")]
+
+    assert steps == ["GOTO", "DONE"]
+    assert client.chunks * 8 < len(PLAN) + 8
+
+
+def test_succeeded_plan_is_served_from_the_plan_cache(monkeypatch, tmp_path):
+    client = FakeOllama()
+    cache = ResponseCache(tmp_path / "responses.sqlite3")
+    planner = _planner(monkeypatch, tmp_path, client, cache)
+
+    first = [step.command for step in planner.stream_plan("open github")]
+    planner.record_outcome("open github", success=True)
+    second = [step.command for step in planner.stream_plan("open github")]
+
+    assert first == second == ["GOTO", "DONE"]
+    assert client.requests == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_failed_plan_is_generated_again(monkeypatch, tmp_path):
+    client = FakeOllama()
+    planner = _planner(monkeypatch, tmp_path, client, ResponseCache(tmp_path / "responses.sqlite3"))
+
+    list(planner.stream_plan("open github"))
+    planner.record_outcome("open github", success=False)
+    list(planner.stream_plan("open github"))
+
+    assert client.requests == 2
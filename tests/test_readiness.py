@@ -0,0 +1,35 @@
+from seif.readiness import Readiness
+
+
+class FakeDriver:
+    def __init__(self):
+        self.calls = []
+
+    def execute_async_script(self, script, *args):
+        self.calls.append(args)
+        return ["network_idle"]
+
+
+def test_network_idle_is_only_awaited_up_to_its_timeout():
+    driver = FakeDriver()
+
+    unmet = Readiness({"readiness_timeout": 10}).wait(driver, ["load", "network_idle"], idle_timeout=2)
+
+    conditions, quiet_ms, idle_ms, since, timeout_ms, idle_cap_ms, start_url = driver.calls[0]
+    assert unmet == ["network_idle"]
+    assert 9000 < timeout_ms <= 10000
+    assert 1900 < idle_cap_ms <= 2000
+
+
+def test_network_idle_is_awaited_for_the_whole_timeout_by_default():
+    driver = FakeDriver()
+
+    Readiness({"readiness_timeout": 10}).wait(driver, ["network_idle"])
+
+    timeout_ms, idle_cap_ms = driver.calls[0][4:6]
+    assert idle_cap_ms == timeout_ms
+
+
+def test_network_idle_timeout_is_configurable():
+    assert Readiness().idle_timeout == 2
+    assert Readiness({"network_idle_timeout": 0.5}).idle_timeout == 0.5
@@ -0,0 +1,117 @@
+import threading
+import time
+
+import seif.llm as llm_module
+from seif.llm import LLM, ResponseCache
+
+
+def _put(cache, key, value):
+    assert cache.acquire(key) == (None, True)
+    cache.release(key, value)
+
+
+def test_entries_expire_after_the_ttl(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.sqlite3", ttl=0.1)
+    _put(cache, "k", "v")
+
+    assert cache.acquire("k") == ("v", False)
+    time.sleep(0.15)
+    assert cache.acquire("k") == (None, True)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.sqlite3", max_entries=2)
+    _put(cache, "a", "1")
+    _put(cache, "b", "2")
+    time.sleep(0.01)
+    cache.acquire("a")
+
+    _put(cache, "c", "3")
+
+    assert cache.acquire("a") == ("1", False)
+    assert cache.acquire("b") == (None, True)
+    assert cache.acquire("c") == ("3", False)
+
+
+def test_entries_persist_across_instances(tmp_path):
+    _put(ResponseCache(tmp_path / "responses.sqlite3"), "k", "v")
+
+    assert ResponseCache(tmp_path / "responses.sqlite3").acquire("k") == ("v", False)
+
+
+def test_identical_requests_wait_for_the_one_in_flight(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.sqlite3")
+    assert cache.acquire("k") == (None, True)
+    results = []
+    follower = threading.Thread(target=lambda: results.append(cache.acquire("k")))
+    follower.start()
+
+    time.sleep(0.1)
+    cache.release("k", "v")
+    follower.join(2)
+
+    assert results == [("v", False)]
+    assert cache.coalesced == 1
+
+
+def test_waiting_for_a_request_is_bounded(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.sqlite3", coalesce_timeout=0.2)
+    assert cache.acquire("k") == (None, True)
+    results = []
+    follower = threading.Thread(target=lambda: results.append(cache.acquire("k")))
+
+    started = time.monotonic()
+    follower.start()
+    follower.join(2)
+
+    assert results == [(None, False)]
+    assert 0.15 < time.monotonic() - started < 1
+
+
+def test_thread_does_not_wait_on_its_own_request(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.sqlite3")
+    assert cache.acquire("k") == (None, True)
+
+    started = time.monotonic()
+    assert cache.acquire("k") == (None, False)
+    assert time.monotonic() - started < 0.1
+
+
+class FakeOllama:
+    def __init__(self):
+        self.requests = 0
+
+    def list(self):
+        return {"models": [{"name": "test"}]}
+
+    def chat(self, model, messages, stream=False, **kwargs):
+        self.requests += 1
+        reply = {"message": {"content": f"reply {self.requests}"}}
+        return iter([reply]) if stream else reply
+
+
+def _llm(monkeypatch, tmp_path, temperature: float):
+    client = FakeOllama()
+    cache = ResponseCache(tmp_path / "responses.sqlite3")
+    monkeypatch.setattr(llm_module.registry, "get_client", lambda *args, **kwargs: client)
+    monkeypatch.setattr(llm_module, "get_response_cache", lambda: cache)
+    llm = LLM(model="test")
+    llm.temperature = temperature
+    return llm, client
+
+
+def test_sampled_replies_are_not_cached_by_default(monkeypatch, tmp_path):
+    llm, client = _llm(monkeypatch, tmp_path, temperature=0.7)
+
+    assert llm.generate("hello") == "reply 1"
+    assert "".join(llm.generate_stream("hello")) == "reply 2"
+    assert llm.generate("hello", use_cache=True) == "reply 3"
+    assert llm.generate("hello", use_cache=True) == "reply 3"
+
+
+def test_deterministic_replies_are_cached_by_default(monkeypatch, tmp_path):
+    llm, client = _llm(monkeypatch, tmp_path, temperature=0)
+
+    assert llm.generate("hello") == "reply 1"
+    assert "".join(llm.generate_stream("hello")) == "reply 1"
+    assert client.requests == 1
@@ -0,0 +1,130 @@
+import seif.browser as browser_module
+from seif.browser import Browser
+from seif.pacing import Pacer
+from seif.readiness import Readiness
+from seif.selector_cache import SelectorCache
+
+URL = "https://example.com/issues/1234"
+
+
+def test_page_key_groups_record_urls():
+    assert SelectorCache.page_key("https://www.github.com/foo/issues/1234") == ("github.com", "/foo/issues/*")
+    assert SelectorCache.page_key("https://x.com/p/3fa2b9c0d1e2f3a4/edit") == ("x.com", "/p/*/edit")
+
+
+def test_resolutions_are_shared_by_pages_of_the_same_pattern(tmp_path):
+    cache = SelectorCache(tmp_path / "selectors.json")
+
+    cache.store(URL, "#submit", "button.primary", "css")
+
+    assert cache.get("https://example.com/issues/99", "#submit") == ["button.primary", "css"]
+    assert cache.get("https://example.com/pulls/99", "#submit") is None
+
+
+def test_hits_are_counted_and_invalidated_entries_dropped(tmp_path):
+    cache = SelectorCache(tmp_path / "selectors.json")
+    cache.store(URL, "#submit", "button.primary", "css")
+
+    cache.hit(URL, "#submit")
+    assert cache.stats() == {"entries": 1, "domains": 1, "hits": 1}
+
+    cache.invalidate(URL, "#submit")
+    assert cache.get(URL, "#submit") is None
+
+
+def test_least_recently_used_resolutions_are_evicted(tmp_path):
+    cache = SelectorCache(tmp_path / "selectors.json", max_entries=2)
+    cache.store(URL, "a", "a", "css")
+    cache.store(URL, "b", "b", "css")
+    cache.entries[cache._key(URL, "a")]["last_used"] = 0
+
+    cache.store(URL, "c", "c", "css")
+
+    assert cache.get(URL, "a") is None
+    assert cache.get(URL, "b") and cache.get(URL, "c")
+
+
+def test_resolutions_persist_across_instances(tmp_path):
+    SelectorCache(tmp_path / "selectors.json").store(URL, "#submit", "button.primary", "css")
+
+    assert SelectorCache(tmp_path / "selectors.json").get(URL, "#submit") == ["button.primary", "css"]
+
+
+class FakeElement:
+    def __init__(self, fails: bool = False):
+        self.fails = fails
+
+    def click(self):
+        if self.fails:
+            raise RuntimeError("element is not clickable")
+
+
+class FakeDriver:
+    """Answers element resolution with the first selector present on a fake page."""
+
+    current_url = URL
+
+    def __init__(self, page):
+        self.page = page
+
+    def execute_script(self, script, *args):
+        if script is browser_module.RESOLVE_ELEMENT_SCRIPT:
+            for entry in args[0]:
+                wanted = entry[0] if isinstance(entry, list) else entry
+                if wanted in self.page:
+                    return {"element": self.page[wanted], "selector": wanted, "strategy": "css",
+                            "candidates": 1, "stable": "#found", "info": {"tag": "button"}}
+            return {"element": None, "candidates": 0}
+        if "click()" in script and self.page and any(e.fails for e in self.page.values()):
+            raise RuntimeError("element is not clickable")
+
+    def execute_async_script(self, *args):
+        return []
+
+
+def _browser(cache: SelectorCache, page, domain: str = "example.com") -> Browser:
+    browser = object.__new__(Browser)
+    browser.config = {"timeout": 0.2}
+    browser.driver = FakeDriver(page)
+    browser.current_page_info = {"url": URL, "domain": domain}
+    browser.deadline = None
+    browser.pacer = Pacer("fast")
+    browser.resolve_selectors = False
+    browser.readiness = Readiness({})
+    browser.last_resolved_selector = None
+    browser.selector_cache = cache
+    return browser
+
+
+def test_successful_click_is_learned(tmp_path):
+    cache = SelectorCache(tmp_path / "selectors.json")
+
+    assert _browser(cache, {"#submit": FakeElement()}).click("#submit") is None
+
+    assert cache.get(URL, "#submit") == ["#found", "css"]
+
+
+def test_failed_click_is_not_learned(tmp_path):
+    cache = SelectorCache(tmp_path / "selectors.json")
+
+    assert _browser(cache, {"#submit": FakeElement(fails=True)}).click("#submit")
+
+    assert cache.get(URL, "#submit") is None
+
+
+def test_generic_fallback_match_is_not_learned(tmp_path):
+    cache = SelectorCache(tmp_path / "selectors.json")
+    browser = _browser(cache, {"button[type='submit']": FakeElement()}, domain="www.google.com")
+
+    assert browser.click("#search-button") is None
+
+    assert cache.get(URL, "#search-button") is None
+
+
+def test_cached_resolution_that_fails_is_dropped(tmp_path):
+    cache = SelectorCache(tmp_path / "selectors.json")
+    cache.store(URL, "#submit", "#found", "css")
+
+    assert _browser(cache, {"#found": FakeElement(fails=True)}).click("#submit")
+
+    assert cache.get(URL, "#submit") is None
@@ -0,0 +1,25 @@
+import seif.llm as llm_module
+from seif.llm import LLM, get_warmup_state
+
+
+class FakeOllama:
+    def list(self):
+        return {"models": [{"name": "test"}]}
+
+    def generate(self, model, prompt, keep_alive=None, **kwargs):
+        return {"response": "", "load_duration": 1_500_000_000}
+
+
+def test_warmup_is_reported_to_later_processes(monkeypatch, tmp_path):
+    monkeypatch.setattr(llm_module.config, "config_dir", tmp_path)
+    monkeypatch.setattr(llm_module.registry, "get_client", lambda *args, **kwargs: FakeOllama())
+    monkeypatch.setattr(llm_module, "_warmup_state", {})
+
+    assert LLM(model="test").warm_up() == 1.5
+
+    # A later `model status` runs in a fresh process
+    monkeypatch.setattr(llm_module, "_warmup_state", {})
+    state = get_warmup_state("test")
+    assert state["load_time"] == 1.5
+    assert state["warmed_at"] > 0
+    assert get_warmup_state("other") is None